@@ -0,0 +1,70 @@
+import pytest  # type: ignore
+from fortran_format_converter import (Format, FormatStatement, convert,
+                                      convert_cache, format_cache, is_valid,
+                                      use_lookup_table)
+
+SPECS = ['I6', 'I6.6', 'B16.16', 'O8', 'Z8.8', 'F10.4', 'D12.5', 'E12.4',
+         'E12.4E3', 'EN12.4', 'ES12.4', 'G12.4', 'L2', 'A', 'A16']
+
+INVALID = ['J4', 'F10', 'I.4', 'E12.4E', 'A-1', '', 'ENX']
+
+
+def convert_all(specs):
+    for spec in specs:
+        convert(spec)
+
+
+def test_convert_cold(benchmark):
+    benchmark.pedantic(convert_all, args=(SPECS,), setup=convert_cache.clear,
+                       rounds=2000)
+
+
+def test_convert_repeated(benchmark):
+    convert_all(SPECS)
+    benchmark(convert_all, SPECS)
+
+
+def test_convert_lookup_table(benchmark):
+    use_lookup_table()
+    try:
+        convert_all(SPECS)
+        benchmark(convert_all, SPECS)
+    finally:
+        use_lookup_table(False)
+
+
+def test_format_construction(benchmark):
+    benchmark(lambda: [Format(spec) for spec in SPECS])
+
+
+def test_format_get(benchmark):
+    format_cache.clear()
+    benchmark(lambda: [Format.get(spec) for spec in SPECS])
+
+
+@pytest.mark.parametrize('name', ['string', 'sign', 'align', 'fill',
+                                  'precision', 'type', 'width'])
+def test_format_property(benchmark, name):
+    format_ = Format('E12.4')
+    benchmark(getattr, format_, name)
+
+
+def test_invalid(benchmark):
+    def reject():
+        for spec in INVALID:
+            try:
+                Format(spec)
+            except ValueError:
+                pass
+    benchmark(reject)
+
+
+def test_is_valid(benchmark):
+    def check():
+        for spec in INVALID:
+            is_valid(spec)
+    benchmark(check)
+
+
+def test_format_statement(benchmark):
+    benchmark(FormatStatement, "(2X,3(F10.4,1X),I6,'label',A8/2(ES12.4E3))")
@@ -0,0 +1,112 @@
+import random
+
+import pytest  # type: ignore
+from fortran_format_converter import (Format, RowFormat, format_array,
+                                      render_array)
+
+SIZE = 10**6
+
+SPECS = ['I10', 'F12.4', 'E14.6', 'ES14.6E3', 'A8']
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = random.Random(0)
+    return {
+        'I10': [rng.randint(-10**8, 10**8) for _ in range(SIZE)],
+        'F12.4': [rng.uniform(-1e4, 1e4) for _ in range(SIZE)],
+        'E14.6': [rng.gauss(0, 1) * 10**rng.randint(-20, 20)
+                  for _ in range(SIZE)],
+        'ES14.6E3': [rng.gauss(0, 1) * 10**rng.randint(-200, 200)
+                     for _ in range(SIZE)],
+        'A8': ['{:x}'.format(rng.getrandbits(24)) for _ in range(SIZE)]
+    }
+
+
+@pytest.mark.parametrize('spec', SPECS)
+def test_format_string(benchmark, data, spec):
+    template = '{:' + Format(spec).string + '}'
+    values = data[spec]
+    benchmark.pedantic(lambda: ''.join(map(template.format, values)),
+                       rounds=3)
+
+
+@pytest.mark.parametrize('spec', SPECS)
+def test_formatter(benchmark, data, spec):
+    formatter = Format(spec).formatter
+    values = data[spec]
+    benchmark.pedantic(lambda: ''.join(map(formatter, values)), rounds=3)
+
+
+@pytest.mark.parametrize('spec', SPECS)
+def test_format_many(benchmark, data, spec):
+    format_ = Format(spec)
+    benchmark.pedantic(format_.format_many, args=(data[spec],), rounds=3)
+
+
+@pytest.mark.parametrize('spec', SPECS)
+def test_format_array(benchmark, data, spec):
+    np = pytest.importorskip('numpy')
+    array = np.array(data[spec])
+    benchmark.pedantic(format_array, args=(spec, array), rounds=3)
+
+
+@pytest.mark.parametrize('spec', ['E14.6', 'ES14.6E3'])
+def test_render(benchmark, data, spec):
+    render = Format(spec).render
+    values = data[spec][:SIZE // 10]
+    benchmark.pedantic(lambda: [render(value) for value in values], rounds=3)
+
+
+@pytest.mark.parametrize('spec', ['E14.6', 'ES14.6E3'])
+def test_render_array(benchmark, data, spec):
+    np = pytest.importorskip('numpy')
+    array = np.array(data[spec])
+    benchmark.pedantic(render_array, args=(spec, array), rounds=3)
+
+
+ROWS = {'reals': ['F12.4', 'E14.6', 'ES14.6E3'], 'mixed': SPECS}
+
+
+@pytest.mark.parametrize('row', sorted(ROWS))
+def test_join_fields(benchmark, data, row):
+    formatters = [Format(spec).formatter for spec in ROWS[row]]
+    rows = list(zip(*[data[spec] for spec in ROWS[row]]))[:SIZE // 10]
+
+    def format_rows():
+        for values in rows:
+            ''.join([formatter(value)
+                     for formatter, value in zip(formatters, values)])
+    benchmark.pedantic(format_rows, rounds=3)
+
+
+@pytest.mark.parametrize('row', sorted(ROWS))
+def test_row_format(benchmark, data, row):
+    format_ = RowFormat(ROWS[row]).format
+    rows = list(zip(*[data[spec] for spec in ROWS[row]]))[:SIZE // 10]
+
+    def format_rows():
+        for values in rows:
+            format_(values)
+    benchmark.pedantic(format_rows, rounds=3)
+
+
+@pytest.mark.parametrize('row', sorted(ROWS))
+def test_row_format_write(benchmark, data, row):
+    row_format = RowFormat(ROWS[row])
+    rows = list(zip(*[data[spec] for spec in ROWS[row]]))[:SIZE // 10]
+    buffer = bytearray(row_format.width)
+    write = row_format.write
+
+    def write_rows():
+        for values in rows:
+            write(buffer, values)
+    benchmark.pedantic(write_rows, rounds=3)
+
+
+def test_format_ticks(benchmark):
+    pytest.importorskip('matplotlib')
+    from fortran_format_converter import FortranFormatter
+    formatter = FortranFormatter('F8.3')
+    ticks = [i / 10 for i in range(11)]
+    benchmark(formatter.format_ticks, ticks)
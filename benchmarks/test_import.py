@@ -0,0 +1,25 @@
+import importlib
+import sys
+
+
+def loaded():
+    return {name: module for name, module in sys.modules.items()
+            if name.split('.')[0] == 'fortran_format_converter'}
+
+
+def unload():
+    for name in loaded():
+        del sys.modules[name]
+
+
+def test_import(benchmark):
+    # the modules imported by other benchmarks must be the originals again
+    # afterwards, or objects they pickle no longer match their module
+    modules = loaded()
+    try:
+        benchmark.pedantic(importlib.import_module,
+                           args=('fortran_format_converter',), setup=unload,
+                           rounds=200)
+    finally:
+        unload()
+        sys.modules.update(modules)
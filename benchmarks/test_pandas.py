@@ -0,0 +1,60 @@
+import io
+
+import pytest  # type: ignore
+from fortran_format_converter import (FormatStatement, read_fortran,
+                                      write_fortran)
+
+pd = pytest.importorskip('pandas')
+
+LAYOUT = '(I8,2X,3F12.4,1X,A8)'
+
+SIZE = 10**5
+
+
+@pytest.fixture(scope='module')
+def frame():
+    return pd.DataFrame({'i': range(SIZE),
+                         'x': [i / 3 for i in range(SIZE)],
+                         'y': [i / 7 for i in range(SIZE)],
+                         'z': [i / 11 for i in range(SIZE)],
+                         'name': ['row'] * SIZE})
+
+
+@pytest.fixture(scope='module')
+def path(frame, tmpdir_factory):
+    path = str(tmpdir_factory.mktemp('pandas').join('records.txt'))
+    write_fortran(frame, path, LAYOUT)
+    return path
+
+
+def test_read_fortran(benchmark, path):
+    benchmark.pedantic(read_fortran, args=(path, LAYOUT), rounds=5)
+
+
+def test_read_fortran_chunks(benchmark, path):
+    benchmark.pedantic(
+        lambda: list(read_fortran(path, LAYOUT, chunksize=10**4)), rounds=5)
+
+
+def test_read_fwf(benchmark, path):
+    # hand computed column specifications, the usual alternative
+    colspecs = [(0, 8), (10, 22), (22, 34), (34, 46), (47, 55)]
+    benchmark.pedantic(pd.read_fwf, args=(path,),
+                       kwargs={'colspecs': colspecs, 'header': None},
+                       rounds=5)
+
+
+def test_write_fortran(benchmark, frame):
+    benchmark.pedantic(lambda: write_fortran(frame, io.StringIO(), LAYOUT),
+                       rounds=5)
+
+
+def test_write_rows(benchmark, frame):
+    # formatting each row, the usual alternative
+    string = FormatStatement(LAYOUT).string + '\n'
+
+    def write():
+        file = io.StringIO()
+        for row in frame.itertuples(index=False):
+            file.write(string.format(*row))
+    benchmark.pedantic(write, rounds=5)
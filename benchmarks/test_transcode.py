@@ -0,0 +1,28 @@
+import os
+
+import pytest  # type: ignore
+from fortran_format_converter import transcode, write_columns
+
+np = pytest.importorskip('numpy')
+
+SIZE = 10**6
+
+
+@pytest.fixture(scope='module')
+def source(tmpdir_factory):
+    path = str(tmpdir_factory.mktemp('transcode').join('source.txt'))
+    values = np.random.RandomState(0).uniform(-1e4, 1e4, SIZE)
+    with open(path, 'w') as file:
+        write_columns(file, ['I8', 'F10.4'], [np.arange(SIZE), values])
+    return path
+
+
+# throughput should scale with the number of processes, up to the number of
+# cores
+@pytest.mark.parametrize('processes', [None, 2, os.cpu_count() or 1])
+def test_transcode(benchmark, source, tmpdir, processes):
+    destination = str(tmpdir.join('destination.txt'))
+    benchmark.pedantic(
+        transcode, args=(source, destination, ['I8', 'F10.4'],
+                         ['I10', 'E15.7']),
+        kwargs={'processes': processes}, rounds=3)
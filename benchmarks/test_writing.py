@@ -0,0 +1,70 @@
+import asyncio
+import io
+import os
+
+import pytest  # type: ignore
+from fortran_format_converter import (FormatStatement, RowFormat,
+                                      write_records, write_records_async)
+
+LAYOUT = '(I8,2X,3F12.4,1X,A8)'
+
+ROWS = [(i, i / 3, i / 7, i / 11, 'row') for i in range(10**5)]
+
+
+def test_write_records(benchmark):
+    benchmark.pedantic(lambda: write_records(io.StringIO(), LAYOUT, ROWS),
+                       rounds=5)
+
+
+@pytest.mark.parametrize('batchsize', [256, 4096])
+def test_write_records_async(benchmark, batchsize):
+    # the same records written through a pipe that is drained as fast as
+    # possible, throughput should stay close to the synchronous baseline
+
+    async def drain(reader):
+        while await reader.read(2**16):
+            pass
+
+    async def write():
+        loop = asyncio.get_event_loop()
+        read_fd, write_fd = os.pipe()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(read_fd, 'rb'))
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, os.fdopen(write_fd, 'wb'))
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+        draining = asyncio.ensure_future(drain(reader))
+        await write_records_async(writer, LAYOUT, ROWS, batchsize)
+        writer.close()
+        await draining
+
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark.pedantic(lambda: loop.run_until_complete(write()),
+                           rounds=5)
+    finally:
+        loop.close()
+
+
+NUMERIC_LAYOUT = '(I8,2X,3F12.4)'
+
+NUMERIC_ROWS = [row[:4] for row in ROWS]
+
+
+def test_write_encoded(benchmark):
+    # formatting each line to str and encoding it, the usual alternative
+    string = FormatStatement(NUMERIC_LAYOUT).string + '\n'
+
+    def write():
+        return b''.join([string.format(*row).encode('ascii')
+                         for row in NUMERIC_ROWS])
+    benchmark.pedantic(write, rounds=5)
+
+
+def test_pack_into(benchmark):
+    row = RowFormat(NUMERIC_LAYOUT)
+    buffer = bytearray((row.width + 1) * len(NUMERIC_ROWS))
+    benchmark.pedantic(row.pack_into, args=(buffer, 0, NUMERIC_ROWS),
+                       rounds=5)
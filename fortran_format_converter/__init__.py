@@ -1,7 +1,102 @@
-"""Convert Fortran format specifications to Python format strings."""
+"""Convert Fortran format specifications to Python format strings.
 
-from ._converter import Format, convert
+Submodules are only imported when one of their names is first used, so
+importing the package itself is nearly free.
+"""
+
+import sys
+
+TYPE_CHECKING = False  # avoid importing typing just for this
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import List
+
+    from ._array import (format_array, format_columns, read_columns,
+                         render_array, write_columns)
+    from ._batch import convert_many, validate_many
+    from ._cache import CacheInfo, LRUCache
+    from ._converter import (Format, FormatError, convert, convert_cache,
+                             format_cache, instrumentation_snapshot, is_valid,
+                             use_instrumentation, use_lookup_table,
+                             use_persistent_cache)
+    from ._inverse import to_fortran, to_fortran_cache
+    from ._pandas import read_fortran, write_fortran  # noqa: F401
+    from ._reader import read_records
+    from ._row import RowFormat
+    from ._statement import FormatStatement
+    from ._ticker import FortranFormatter  # noqa: F401
+    from ._transcode import transcode
+    from ._writer import write_records, write_records_async
 
 __version__ = '0.1.3'
 
-__all__ = ['Format', 'convert']
+# names needing an optional dependency are left out, so that a star import
+# works without it
+__all__ = ['CacheInfo', 'Format', 'FormatError', 'FormatStatement',
+           'LRUCache', 'RowFormat', 'convert', 'convert_cache',
+           'convert_many', 'format_array', 'format_cache', 'format_columns',
+           'instrumentation_snapshot', 'is_valid', 'read_columns',
+           'read_records', 'render_array', 'to_fortran', 'to_fortran_cache',
+           'transcode', 'use_instrumentation', 'use_lookup_table',
+           'use_persistent_cache', 'validate_many', 'write_columns',
+           'write_records', 'write_records_async']
+
+# submodule defining each public name
+_MODULES = {
+    'CacheInfo': '_cache',
+    'Format': '_converter',
+    'FormatError': '_converter',
+    'FormatStatement': '_statement',
+    'FortranFormatter': '_ticker',
+    'LRUCache': '_cache',
+    'RowFormat': '_row',
+    'convert': '_converter',
+    'convert_cache': '_converter',
+    'convert_many': '_batch',
+    'format_array': '_array',
+    'format_cache': '_converter',
+    'format_columns': '_array',
+    'instrumentation_snapshot': '_converter',
+    'is_valid': '_converter',
+    'read_columns': '_array',
+    'read_fortran': '_pandas',
+    'read_records': '_reader',
+    'render_array': '_array',
+    'to_fortran': '_inverse',
+    'to_fortran_cache': '_inverse',
+    'transcode': '_transcode',
+    'use_instrumentation': '_converter',
+    'use_lookup_table': '_converter',
+    'use_persistent_cache': '_converter',
+    'validate_many': '_batch',
+    'write_columns': '_array',
+    'write_fortran': '_pandas',
+    'write_records': '_writer',
+    'write_records_async': '_writer'
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import public names on first use (:pep:`562`)."""
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            __name__, name)) from None
+    from importlib import import_module
+    value = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = value  # later lookups skip this function
+    return value
+
+
+def __dir__() -> 'List[str]':
+    return sorted(set(globals()) | set(_MODULES))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module __getattr__ is not supported, import everything up front
+    for _name in _MODULES:
+        try:
+            __getattr__(_name)
+        except ImportError:  # an optional dependency is not installed
+            pass
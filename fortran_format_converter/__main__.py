@@ -0,0 +1,8 @@
+"""Run the command line converter with :code:`python -m`."""
+
+import sys
+
+from ._cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,727 @@
+"""Vectorized formatting and reading of NumPy arrays."""
+
+import os
+from itertools import chain
+from typing import (TYPE_CHECKING, Any, BinaryIO, List, Optional, Sequence,
+                    TextIO, Tuple, Union, cast)
+
+from ._converter import Format
+from ._layout import Layout, fields, records, width
+from ._reader import _read_integer, _read_logical, _read_real
+from ._render import REAL_DESCRIPTORS, render_real
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+__all__ = ['format_array', 'format_columns', 'read_columns', 'render_array',
+           'write_columns']
+
+# array kinds for which printf style formatting is identical to the Python
+# format string, keyed on the Python format type
+_PRINTF_KINDS = {
+    'd': 'biu',
+    'o': 'iu',
+    'x': 'iu',
+    'X': 'iu',
+    'f': 'biuf',
+    'F': 'biuf',
+    'e': 'biuf',
+    'E': 'biuf',
+    'g': 'biuf',
+    'G': 'biuf',
+    's': 'U'
+}
+
+_EXPONENT_LETTERS = bytes.maketrans(b'dDqQ', b'EEEE')
+_POINT = ord(b'.')
+_BLANK = ord(b' ')
+_ZERO = ord(b'0')
+
+
+def _format(format_: Union[str, Format]) -> Format:
+    if isinstance(format_, Format):
+        return format_
+    return Format.get(format_)
+
+
+def _printf(format_: Format, kind: str) -> Optional[str]:
+    """Get the printf style equivalent of a format for an array kind.
+
+    Parameters
+    ----------
+    format_
+        Format to get the printf style template of.
+    kind
+        NumPy array kind (:attr:`numpy.dtype.kind`) of the values.
+
+    Returns
+    -------
+    Optional[str]
+        A printf style template that gives identical results to
+        :attr:`Format.string` for values of the given kind, or None if there
+        is no such template.
+
+    """
+    if kind not in _PRINTF_KINDS.get(format_.type, ''):
+        return None
+    return format_.printf
+
+
+def _items(layout: Layout) -> List[Union[str, Format]]:
+    # join the records of the layout with newlines
+    items = []  # type: List[Union[str, Format]]
+    for i, record in enumerate(records(layout)):
+        if i:
+            items.append('\n')
+        items.extend(record)
+    return items
+
+
+def _strings(format_: Format, values: 'np.ndarray') -> List[str]:
+    template = _printf(format_, values.dtype.kind)
+    if template is not None:
+        return [template % value for value in values.tolist()]
+    spec = format_.string
+    return [format(value, spec) for value in values.tolist()]
+
+
+def _arrays(items: List[Union[str, Format]],
+            columns: Sequence[Any]) -> List['np.ndarray']:
+    # check that there is a column of equal length for each data edit
+    # descriptor, before anything is formatted
+    import numpy as np
+    arrays = [np.asarray(column) for column in columns]
+    if sum(isinstance(item, Format) for item in items) != len(arrays):
+        raise ValueError('the number of columns does not match the layout')
+    if any(array.ndim != 1 for array in arrays):
+        raise ValueError('columns must be one dimensional')
+    if any(len(array) != len(arrays[0]) for array in arrays):
+        raise ValueError('columns must all be the same length')
+    return arrays
+
+
+def _columns(items: List[Union[str, Format]],
+             arrays: List['np.ndarray']) -> Tuple[str, List[List[Any]]]:
+    """Build a printf style record template and the values to fill it with.
+
+    Columns that can not be formatted with printf style formatting are
+    formatted individually and filled in with :code:`%s`.
+
+    Parameters
+    ----------
+    items
+        Literal text and data edit descriptors of the layout.
+    arrays
+        Columns already checked to match the layout.
+
+    Returns
+    -------
+    Tuple[str, List[List[Any]]]
+        Record template and a list of values for each column.
+
+    """
+    template = []
+    values = []
+    array = iter(arrays)
+    for item in items:
+        if isinstance(item, str):
+            template.append(item.replace('%', '%%'))
+            continue
+        column = next(array)
+        printf = _printf(item, column.dtype.kind)
+        if printf is None:
+            template.append('%s')
+            values.append(_strings(item, column))
+        else:
+            template.append(printf)
+            values.append(column.tolist())
+    return ''.join(template), values
+
+
+def format_array(format_: Union[str, Format], values: Any) -> 'np.ndarray':
+    """Format each value of an array.
+
+    Values are formatted with a precomputed printf style template when it
+    gives identical results, which is considerably faster than
+    :func:`format`.  Either way the result is identical to using
+    :func:`format` with :attr:`Format.string` on each value.
+
+    Parameters
+    ----------
+    format_
+        Fortran format specification or :class:`Format` to format the values
+        with.
+    values
+        Array like values to format.
+
+    Returns
+    -------
+    numpy.ndarray
+        Unicode string array, with the same shape as :paramref:`values`, of
+        formatted values.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`format_` is not a valid Fortran format specification.
+
+    """
+    import numpy as np
+    values = np.asarray(values)
+    strings = _strings(_format(format_), values.ravel())
+    return np.array(strings, dtype=str).reshape(values.shape)
+
+
+def _scientific(magnitudes: 'np.ndarray', precisions: 'np.ndarray'
+                ) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Get the significant digits and decimal exponents of numbers.
+
+    Correct rounding is left to a single printf style operation over all of
+    the numbers, whose fixed width output is then taken apart as a byte
+    matrix.
+
+    Parameters
+    ----------
+    magnitudes
+        Finite, non-negative numbers.
+    precisions
+        Number of digits after the first significant digit, for each number.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        ASCII digits, as an unsigned byte matrix with a row for each number
+        padded with zeros, and the exponents of the numbers written as
+        d.ddd x 10**exponent.
+
+    """
+    import numpy as np
+    count = len(magnitudes)
+    size = int(precisions.max()) + 7 if count else 7  # d.ddde+ddd
+    if count and precisions.min() == size - 7:
+        text = ('%#-{}.{}e'.format(size, size - 7) * count) % tuple(
+            magnitudes.tolist())
+    else:
+        text = ('%#-{}.*e'.format(size) * count) % tuple(chain.from_iterable(
+            zip(precisions.tolist(), magnitudes.tolist())))
+    chars = np.frombuffer(text.encode('ascii'), dtype=np.uint8).reshape(
+        count, size)
+    digits = np.delete(chars[:, :size - 5], 1, axis=1)  # drop the point
+    digits[np.arange(size - 6) > precisions[:, np.newaxis]] = _ZERO
+    rows = np.arange(count)
+    sign = chars[rows, precisions + 3]
+    exponents = ((chars[rows, precisions + 4].astype(np.int64) - _ZERO) * 10 +
+                 chars[rows, precisions + 5] - _ZERO)
+    last = chars[rows, precisions + 6]
+    three = last != _BLANK
+    exponents[three] = exponents[three] * 10 + last[three] - _ZERO
+    exponents[sign == ord(b'-')] *= -1
+    return digits, exponents
+
+
+def _exponent_fields(exponents: 'np.ndarray', exponent_digits: Optional[int],
+                     letter: str) -> Tuple['np.ndarray', 'np.ndarray']:
+    # byte matrix of exponent fields and the rows that do not fit
+    import numpy as np
+    magnitudes = np.abs(exponents)
+    signs = np.where(exponents < 0, ord(b'-'), ord(b'+')).astype(np.uint8)
+    count = exponent_digits if exponent_digits else 3
+    digits = np.empty((len(exponents), count), dtype=np.uint8)
+    for i in range(count):
+        digits[:, i] = magnitudes // 10 ** (count - 1 - i) % 10 + _ZERO
+    fields = np.empty((len(exponents), count + (1 if exponent_digits else 0) +
+                       1), dtype=np.uint8)
+    if exponent_digits:
+        fields[:, 0] = ord(letter)
+        fields[:, 1] = signs
+        fields[:, 2:] = digits
+        return fields, magnitudes >= 10 ** exponent_digits
+    # two digits with the letter, or three without it
+    three = magnitudes > 99
+    fields[:, 0] = np.where(three, signs, ord(letter))
+    fields[:, 1] = np.where(three, digits[:, 0], signs)
+    fields[:, 2:] = digits[:, 1:]
+    return fields, magnitudes > 999
+
+
+def _assemble(width: int, negative: 'np.ndarray', digits: 'np.ndarray',
+              integers: 'np.ndarray', fractions: 'np.ndarray',
+              tails: 'np.ndarray') -> 'np.ndarray':
+    """Right justify [-][0]iii.fff<tail> into a byte matrix.
+
+    The zero is only written if there are no integer digits and either
+    there is room for it or there are no other digits.  Rows that do not fit
+    are filled with asterisks.
+
+    Parameters
+    ----------
+    width
+        Width of the field.
+    negative
+        Whether to write a minus sign, for each row.
+    digits
+        ASCII digits, the integer digits followed by the fraction digits.
+    integers
+        Number of integer digits, for each row.
+    fractions
+        Number of fraction digits, for each row.
+    tails
+        Characters following the fraction digits, the same number for each
+        row.
+
+    Returns
+    -------
+    numpy.ndarray
+        Unsigned byte matrix with :paramref:`width` columns.
+
+    """
+    import numpy as np
+    count = len(digits)
+    rows = np.arange(count)
+    output = np.full((count, width), _BLANK, dtype=np.uint8)
+    if tails.shape[1] >= width:  # no room for the point
+        output[:] = ord(b'*')
+        return output
+    point = width - tails.shape[1] - fractions - 1
+    start = point - integers
+    required = (integers == 0) & (fractions == 0)
+    overflow = start - negative - required < 0
+    zero = (integers == 0) & ((start - negative > 0) | required)
+    # positions are clipped to keep rows that do not fit in bounds, they are
+    # overwritten at the end
+    for i in range(digits.shape[1]):
+        place = i < integers + fractions
+        column = np.where(i < integers, start + i, point + 1 + i - integers)
+        output[rows[place], np.clip(column[place], 0, width - 1)] = (
+            digits[place, i])
+    output[rows, np.clip(point, 0, width - 1)] = _POINT
+    output[rows[zero], point[zero] - 1] = _ZERO
+    sign = np.clip(start - zero - 1, 0, width - 1)
+    output[rows[negative], sign[negative]] = ord(b'-')
+    output[:, width - tails.shape[1]:] = tails
+    output[overflow] = ord(b'*')
+    return output
+
+
+def _render(format_: Format, values: 'np.ndarray') -> 'np.ndarray':
+    # byte matrix of the rendered finite values, see render_real
+    import numpy as np
+    descriptor = format_.descriptor
+    width = cast(int, format_.width)
+    digits = cast(int, format_.digits)
+    exponent_digits = format_.exponent_digits
+    negative = np.signbit(values)
+    magnitudes = np.abs(values)
+    nonzero = magnitudes != 0
+    count = len(values)
+
+    def exponential(letter: str) -> 'np.ndarray':
+        if not digits:
+            return np.full((count, width), ord(b'*'), dtype=np.uint8)
+        significands, exponents = _scientific(
+            magnitudes, np.full(count, digits - 1))
+        exponents = np.where(nonzero, exponents + 1, 0)
+        tails, overflow = _exponent_fields(exponents, exponent_digits, letter)
+        output = _assemble(width, negative, significands, np.zeros(count, int),
+                           np.full(count, digits), tails)
+        output[overflow] = ord(b'*')
+        return output
+
+    if descriptor == 'F':
+        # values with width - digits or more integer digits never fit, all
+        # others are written to the same width by a single printf operation
+        limit = width - digits - 1
+        fits = magnitudes < (10.0 ** limit if limit < 308 else np.inf)
+        size = max(width + 1, digits + 2)
+        text = ('%#{}.{}f'.format(size, digits) * count) % tuple(
+            np.where(fits, magnitudes, 0).tolist())
+        chars = np.frombuffer(text.encode('ascii'), dtype=np.uint8).reshape(
+            count, size)
+        point = size - digits - 1
+        integers = (chars[:, :point] != _BLANK).sum(axis=1)
+        # the leading zero is optional
+        integers[(integers == 1) & (chars[:, point - 1] == _ZERO)] = 0
+        # left align the digits that are used
+        right = np.delete(chars, point, axis=1)
+        index = np.clip((size - 1 - integers - digits)[:, np.newaxis] +
+                        np.arange(size - 1), 0, size - 2)
+        output = _assemble(width, negative, np.take_along_axis(
+            right, index, axis=1), integers, np.full(count, digits),
+            np.zeros((count, 0), dtype=np.uint8))
+        output[~fits] = ord(b'*')
+        return output
+    if descriptor == 'ES':
+        significands, exponents = _scientific(
+            magnitudes, np.full(count, digits))
+        tails, overflow = _exponent_fields(exponents, exponent_digits, 'E')
+        output = _assemble(width, negative, significands, np.ones(count, int),
+                           np.full(count, digits), tails)
+        output[overflow] = ord(b'*')
+        return output
+    if descriptor == 'EN':
+        _, exponents = _scientific(magnitudes, np.full(count, 16))
+        groups = exponents - exponents % 3
+        significands, exponents = _scientific(
+            magnitudes, digits + exponents - groups)
+        groups = np.where(exponents - groups == 3, groups + 3, groups)
+        groups[~nonzero] = 0
+        integers = np.where(nonzero, exponents - groups + 1, 1)
+        tails, overflow = _exponent_fields(groups, exponent_digits, 'E')
+        output = _assemble(width, negative, significands, integers,
+                           np.full(count, digits), tails)
+        output[overflow] = ord(b'*')
+        return output
+    if descriptor == 'G' and digits:
+        output = exponential('E')
+        blanks = np.full((count, exponent_digits + 2 if exponent_digits else
+                          4), _BLANK, dtype=np.uint8)
+        significands, exponents = _scientific(
+            magnitudes, np.full(count, digits - 1))
+        exponents = np.where(nonzero, exponents + 1, 0)
+        fixed = (exponents >= 0) & (exponents <= digits)
+        # zero is written with one less fraction digit
+        fractions = np.where(nonzero, digits - exponents, digits - 1)
+        output[fixed] = _assemble(
+            width, negative[fixed], significands[fixed], exponents[fixed],
+            fractions[fixed], blanks[fixed])
+        return output
+    return exponential('D' if descriptor == 'D' else 'E')
+
+
+def render_array(format_: Union[str, Format], values: Any) -> 'np.ndarray':
+    """Format each value of an array exactly as Fortran formatted output would.
+
+    The vectorized equivalent of :meth:`Format.render`.  Real numbers are
+    rounded by a single printf style operation over the entire array and the
+    fields are then assembled as a byte matrix, without any per value string
+    manipulation.
+
+    Parameters
+    ----------
+    format_
+        Fortran format specification or :class:`Format` to format the values
+        with.
+    values
+        Array like values to format.
+
+    Returns
+    -------
+    numpy.ndarray
+        Unicode string array, with the same shape as :paramref:`values`, of
+        formatted values.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`format_` is not a valid Fortran format specification.
+
+    """
+    import numpy as np
+    format_ = _format(format_)
+    values = np.asarray(values)
+    if format_.descriptor not in REAL_DESCRIPTORS:
+        return format_array(format_, values)
+    width = cast(int, format_.width)
+    flat = values.astype(np.float64).ravel()
+    finite = np.isfinite(flat)
+    output = np.empty((len(flat), width), dtype=np.uint8)
+    output[finite] = _render(format_, flat[finite])
+    for i in np.flatnonzero(~finite).tolist():
+        output[i] = np.frombuffer(render_real(
+            format_.descriptor, width, cast(int, format_.digits),
+            format_.exponent_digits, flat[i]).encode('ascii'), dtype=np.uint8)
+    return output.view('S{}'.format(width)).reshape(values.shape).astype(
+        'U{}'.format(width))
+
+
+def format_columns(layout: Layout, columns: Sequence[Any]) -> 'np.ndarray':
+    """Format columns of values into fixed width records.
+
+    Parameters
+    ----------
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, or a sequence
+        of Fortran format specifications or :class:`Format` objects, one for
+        each column.  A statement with multiple records results in records
+        that contain newlines.
+    columns
+        One dimensional array like columns of values, one for each data edit
+        descriptor in :paramref:`layout`.  All columns must be the same
+        length.
+
+    Returns
+    -------
+    numpy.ndarray
+        Unicode string array of records, one for each row of
+        :paramref:`columns`.  Records do not include the trailing newline.
+
+    Raises
+    ------
+    ValueError
+        If the number of columns does not match the number of data edit
+        descriptors or the columns are not all the same length.
+
+    """
+    import numpy as np
+    items = _items(layout)
+    template, values = _columns(items, _arrays(items, columns))
+    return np.array([template % row for row in zip(*values)], dtype=str)
+
+
+def write_columns(file: TextIO, layout: Layout, columns: Sequence[Any],
+                  chunksize: int = 65536) -> None:
+    """Write columns of values as fixed width records.
+
+    Each chunk of rows is written with a single printf style formatting
+    operation, in the same way as :func:`numpy.savetxt`.  The output is
+    identical to writing each row with :meth:`str.format`, using
+    :attr:`Format.string` for each value, followed by a newline.
+
+    Parameters
+    ----------
+    file
+        Text file to write the records to.
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, or a sequence
+        of Fortran format specifications or :class:`Format` objects, one for
+        each column.
+    columns
+        One dimensional array like columns of values, one for each data edit
+        descriptor in :paramref:`layout`.
+    chunksize
+        Number of rows to format at a time, limiting memory use.
+
+    Raises
+    ------
+    ValueError
+        If the number of columns does not match the number of data edit
+        descriptors or the columns are not all the same length.
+
+    """
+    items = _items(layout)
+    arrays = _arrays(items, columns)
+    rows = len(arrays[0]) if arrays else 0
+    for start in range(0, rows, chunksize):
+        template, values = _columns(
+            items, [array[start:start + chunksize] for array in arrays])
+        file.write((template + '\n') * min(chunksize, rows - start) %
+                   tuple(chain.from_iterable(zip(*values))))
+
+
+def _memory_map(file: Union[str, bytes, BinaryIO]) -> 'np.ndarray':
+    import numpy as np
+    if not hasattr(file, 'fileno'):
+        with open(file, 'rb') as opened:
+            return _memory_map(opened)
+    binary_file = cast(BinaryIO, file)
+    if os.fstat(binary_file.fileno()).st_size == 0:
+        return np.zeros(0, dtype=np.uint8)  # empty files can not be mapped
+    return np.memmap(binary_file, dtype=np.uint8, mode='r')
+
+
+def _unblank(column: 'np.ndarray') -> 'np.ndarray':
+    # an entirely blank numeric field is zero
+    import numpy as np
+    stripped = np.char.strip(column)
+    blank = stripped == b''
+    if blank.any():
+        return np.where(blank, b'0', stripped)
+    return column
+
+
+def _fallback(read: Any, column: 'np.ndarray', encoding: str,
+              dtype: Any) -> 'np.ndarray':
+    # read each value individually
+    import numpy as np
+    return np.array([read(value.decode(encoding))
+                     for value in column.tolist()], dtype=dtype)
+
+
+def _decode_integer(column: 'np.ndarray', base: int,
+                    encoding: str) -> 'np.ndarray':
+    import numpy as np
+    if base == 10:
+        try:
+            return _unblank(column).astype(np.int64)
+        except ValueError:
+            pass
+    return _fallback(lambda value: _read_integer(value, base),
+                     column, encoding, np.int64)
+
+
+def _decode_real(column: 'np.ndarray', digits: int,
+                 encoding: str) -> 'np.ndarray':
+    import numpy as np
+    # translate exponent letters and look for decimal points on the bytes
+    # themselves, which is much faster than numpy.char
+    table = np.frombuffer(_EXPONENT_LETTERS, dtype=np.uint8)
+    characters = table[np.ascontiguousarray(column).view(np.uint8).reshape(
+        len(column), column.dtype.itemsize)]
+    text = characters.view(column.dtype).reshape(len(column))
+    try:
+        values = _unblank(text).astype(np.float64)
+    except ValueError:
+        return _fallback(lambda value: _read_real(value, digits),
+                         column, encoding, np.float64)
+    implied = ~(characters == _POINT).any(axis=1)
+    if implied.any():
+        values[implied] = _fallback(lambda value: _read_real(value, digits),
+                                    column[implied], encoding, np.float64)
+    return values
+
+
+def _decode_logical(column: 'np.ndarray', encoding: str) -> 'np.ndarray':
+    import numpy as np
+    text = np.char.upper(np.char.lstrip(np.char.replace(column, b'.', b'', 1)))
+    true = np.char.startswith(text, b'T')
+    if not (true | np.char.startswith(text, b'F')).all():
+        return _fallback(_read_logical, column, encoding, bool)
+    return true
+
+
+def _decode(format_: Format, column: 'np.ndarray',
+            encoding: str) -> 'np.ndarray':
+    import numpy as np
+    type_ = format_.type.lower()
+    if type_ == 'd':
+        return _decode_integer(column, 10, encoding)
+    if type_ in {'b', 'o', 'x'}:
+        return _decode_integer(
+            column, {'b': 2, 'o': 8, 'x': 16}[type_], encoding)
+    if type_ in {'f', 'e', 'g'}:
+        return _decode_real(column, format_.precision or 0, encoding)
+    if type_ == 's':
+        return np.char.decode(column, encoding)
+    return _decode_logical(column, encoding)
+
+
+def read_columns(file: Union[str, bytes, BinaryIO], layout: Layout,
+                 encoding: str = 'ascii') -> List['np.ndarray']:
+    """Read a file of fixed length records written by Fortran into columns.
+
+    The file is memory mapped and viewed, without copying, as a NumPy
+    structured array with a fixed width byte string field for each column.
+    Each column is then converted in a single vectorized operation, falling
+    back to converting values individually only for those that NumPy can not
+    parse.  The values are identical to those of :func:`read_records`.
+
+    Parameters
+    ----------
+    file
+        Path to or binary file object of the file to read.  Every line must
+        be exactly the width of its record and all lines must end with the
+        same newline, either LF or CRLF.
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, a single
+        Fortran format specification or :class:`Format`, or a sequence of
+        Fortran format specifications or :class:`Format` objects making up a
+        record.  Each record of a statement is read from its own line.
+    encoding
+        Encoding of character fields.
+
+    Returns
+    -------
+    List[numpy.ndarray]
+        An array for each data edit descriptor in :paramref:`layout`.
+        Integer, binary, octal, and hexadecimal fields are read as
+        :code:`int64`, real fields as :code:`float64`, logical fields as
+        :code:`bool`, and character fields as unicode strings.
+
+    Raises
+    ------
+    ValueError
+        If the layout has a field of unknown width, the file is not made up
+        of fixed length records, or a value can not be read.
+
+    """
+    view, formats = _record_view(file, layout)
+    return _decode_view(view, formats, encoding)
+
+
+def _record_view(file: Union[str, bytes, BinaryIO],
+                 layout: Layout) -> Tuple['np.ndarray', List[Format]]:
+    """View a file of fixed length records as a NumPy structured array.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, List[Format]]
+        A zero copy view of the memory mapped file, with one element per
+        group of records and a fixed width byte string field, f0, f1, ...,
+        for each data edit descriptor, and the data edit descriptors.
+
+    Raises
+    ------
+    ValueError
+        If the layout has a field of unknown width or the file is not made
+        up of fixed length records.
+
+    """
+    return _view_records(_memory_map(file), layout)
+
+
+def _record_dtype(layout: Layout, data: 'np.ndarray'
+                  ) -> Tuple['np.dtype', List[Format], bytes]:
+    """Get the structured dtype of a group of fixed length records.
+
+    Returns
+    -------
+    Tuple[numpy.dtype, List[Format], bytes]
+        The dtype, with a field for each data edit descriptor and newline,
+        the data edit descriptors, and the newline, detected from the end of
+        the first record in :paramref:`data`.
+
+    """
+    import numpy as np
+    layout_records = records(layout)
+    widths = []
+    for record in layout_records:
+        record_width = width(record)
+        if record_width is None:
+            raise ValueError(
+                'fields of unknown width can not be read into columns')
+        widths.append(record_width)
+    newline = b'\n'
+    if data.size > widths[0] and data[widths[0]] == ord(b'\r'):
+        newline = b'\r\n'
+    names = []  # type: List[str]
+    formats = []  # type: List[str]
+    offsets = []  # type: List[int]
+    newlines = []  # type: List[int]
+    decoders = []  # type: List[Format]
+    start = 0
+    for record, record_width in zip(layout_records, widths):
+        for field in fields(record):
+            names.append('f{}'.format(len(names)))
+            formats.append('S{}'.format(field.format.width))
+            offsets.append(start + field.start)
+            decoders.append(field.format)
+        start += record_width
+        newlines.append(start)
+        start += len(newline)
+    for i, offset in enumerate(newlines):
+        names.append('newline{}'.format(i))
+        formats.append('S{}'.format(len(newline)))
+        offsets.append(offset)
+    dtype = np.dtype({'names': names, 'formats': formats,
+                      'offsets': offsets, 'itemsize': start})
+    return dtype, decoders, newline
+
+
+def _view_records(data: 'np.ndarray',
+                  layout: Layout) -> Tuple['np.ndarray', List[Format]]:
+    # view bytes as fixed length records, see _record_view
+    dtype, decoders, newline = _record_dtype(layout, data)
+    if data.size % dtype.itemsize:
+        raise ValueError('file is not made up of fixed length records')
+    view = data.view(dtype)
+    for name in dtype.names or ():
+        if name.startswith('newline') and not (view[name] == newline).all():
+            raise ValueError('file is not made up of fixed length records')
+    return view, decoders
+
+
+def _decode_view(view: 'np.ndarray', formats: List[Format],
+                 encoding: str) -> List['np.ndarray']:
+    # convert each column of a record view, which may be any slice of it
+    return [_decode(format_, view['f{}'.format(i)], encoding)
+            for i, format_ in enumerate(formats)]
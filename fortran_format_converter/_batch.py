@@ -0,0 +1,122 @@
+"""Batch conversion of Fortran format specifications."""
+
+from collections import OrderedDict
+from itertools import chain
+from typing import Iterable, List, Optional, Union
+
+from ._converter import convert, is_valid
+
+__all__ = ['convert_many', 'validate_many']
+
+_ERRORS = {'raise', 'skip', 'collect'}
+
+
+def _convert_chunk(fortran_formats: List[str],
+                   uppercase: bool) -> List[Union[str, ValueError]]:
+    results = []  # type: List[Union[str, ValueError]]
+    for fortran_format in fortran_formats:
+        try:
+            results.append(convert(fortran_format, uppercase))
+        except ValueError as err:
+            results.append(err)
+    return results
+
+
+def convert_many(fortran_formats: Iterable[str], uppercase: bool = False,
+                 errors: str = 'raise', processes: Optional[int] = None,
+                 chunksize: int = 4096) -> List[Union[str, ValueError]]:
+    """Convert many Fortran format specifications at once.
+
+    Each distinct specification is only converted once.  With
+    :paramref:`processes` the distinct specifications are split into chunks
+    that are converted in a pool of worker processes.
+
+    Parameters
+    ----------
+    fortran_formats
+        Fortran format specifications for a single value as strings.
+    uppercase
+        Set to True to use uppercase format, see :class:`Format`.
+    errors
+        What to do with invalid specifications:
+
+            * 'raise' - raise the :class:`ValueError` of the first invalid
+              specification, after all have been converted.
+            * 'skip' - leave them out of the results.
+            * 'collect' - put their :class:`ValueError` in the results in
+              place of a Python format string.
+
+    processes
+        Number of worker processes to convert with, or None to convert in
+        this process.  Workers are only used if there is more than one chunk
+        of distinct specifications.
+    chunksize
+        Number of distinct specifications to send to a worker at a time.
+
+    Returns
+    -------
+    List[Union[str, ValueError]]
+        Python format strings in the same order as
+        :paramref:`fortran_formats`.  Only contains errors if
+        :paramref:`errors` is 'collect'.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`errors` is not valid or if any specification is
+        invalid and :paramref:`errors` is 'raise'.
+
+    """
+    if errors not in _ERRORS:
+        raise ValueError(
+            "errors must be 'raise', 'skip', or 'collect', not {!r}".format(
+                errors))
+    fortran_formats = list(fortran_formats)
+    unique = list(OrderedDict.fromkeys(fortran_formats))
+    chunks = [unique[i:i + chunksize]
+              for i in range(0, len(unique), chunksize)]
+    if processes is not None and processes > 1 and len(chunks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(processes) as executor:
+            converted = list(executor.map(
+                _convert_chunk, chunks, [uppercase] * len(chunks)))
+    else:
+        converted = [_convert_chunk(chunk, uppercase) for chunk in chunks]
+    lookup = dict(zip(chain.from_iterable(chunks),
+                      chain.from_iterable(converted)))
+    output = []  # type: List[Union[str, ValueError]]
+    for fortran_format in fortran_formats:
+        result = lookup[fortran_format]
+        if isinstance(result, ValueError):
+            if errors == 'raise':
+                raise result
+            if errors == 'skip':
+                continue
+        output.append(result)
+    return output
+
+
+def validate_many(fortran_formats: Iterable[str]) -> List[bool]:
+    """Check if many Fortran format specifications are valid, without raising.
+
+    Each distinct specification is only checked once, see :func:`is_valid`.
+
+    Parameters
+    ----------
+    fortran_formats
+        Fortran format specifications for a single value as strings.
+
+    Returns
+    -------
+    List[bool]
+        Whether each specification is valid, in the same order as
+        :paramref:`fortran_formats`.
+
+    """
+    fortran_formats = list(fortran_formats)
+    try:
+        checked = {fortran_format: is_valid(fortran_format)
+                   for fortran_format in set(fortran_formats)}
+    except TypeError:  # unhashable, so not a string
+        return [is_valid(fortran_format) for fortran_format in fortran_formats]
+    return [checked[fortran_format] for fortran_format in fortran_formats]
@@ -0,0 +1,158 @@
+"""Bounded least recently used cache with statistics."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+__all__ = ['CacheInfo', 'LRUCache']
+
+_T = TypeVar('_T')
+
+CacheInfo = NamedTuple('CacheInfo', [
+    ('hits', int),
+    ('misses', int),
+    ('evictions', int),
+    ('maxsize', Optional[int]),
+    ('currsize', int)
+])
+CacheInfo.__doc__ = """Cache statistics as returned by :meth:`LRUCache.info`.
+
+Parameters
+----------
+hits
+    Number of lookups that found a value.
+misses
+    Number of lookups that did not find a value.
+evictions
+    Number of values dropped to stay within :paramref:`maxsize`.
+maxsize
+    Maximum number of values held, None if unbounded.
+currsize
+    Number of values currently held.
+
+"""
+
+
+class LRUCache(Generic[_T]):
+    """Thread safe least recently used cache with hit/miss/eviction counts.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of values to hold before the least recently used value
+        is evicted.  Set to None for an unbounded cache or 0 to disable
+        caching entirely.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`maxsize` is negative.
+
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        self._check_maxsize(maxsize)
+        self._maxsize = maxsize
+        self._data = OrderedDict()  # type: OrderedDict[Hashable, _T]
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _check_maxsize(maxsize: Optional[int]) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(
+                "cache size must be None or non-negative, not {}".format(
+                    maxsize))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> Optional[_T]:
+        """Get a value from the cache, marking it as most recently used.
+
+        Parameters
+        ----------
+        key
+            Key to lookup.
+
+        Returns
+        -------
+        Optional[_T]
+            The cached value or None if the key is not in the cache.
+
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: _T) -> None:
+        """Add a value to the cache, evicting old values as needed.
+
+        Parameters
+        ----------
+        key
+            Key to store :paramref:`value` under.
+        value
+            Value to store.
+
+        """
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        if self._maxsize is None:
+            return
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all values from the cache and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Get cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            Hit, miss, and eviction counts along with the size of the cache.
+
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self._maxsize, len(self._data))
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """Maximum number of values, None if unbounded.
+
+        Shrinking the cache evicts the least recently used values.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: Optional[int]) -> None:
+        self._check_maxsize(maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
@@ -0,0 +1,190 @@
+"""Command line batch converter."""
+
+import argparse
+import os
+import sys
+from itertools import islice
+from typing import IO, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ._converter import convert
+from ._statement import FormatStatement
+
+__all__ = ['main']
+
+_PROG = 'fortran-format-converter'
+
+# name of an input, the line number of the first line in a chunk, and the
+# lines of the chunk
+_Chunk = Tuple[str, int, List[str]]
+
+
+def _convert_line(line: str, uppercase: bool) -> str:
+    text = line.strip()
+    if not text:
+        return ''
+    if text.startswith('('):
+        # records are separated by newlines, which must be escaped to keep
+        # one line of output per line of input
+        string = FormatStatement(text, uppercase).string
+        return string.replace('\\', '\\\\').replace('\n', '\\n')
+    return convert(text, uppercase)
+
+
+def _convert_lines(lines: List[str],
+                   uppercase: bool) -> List[Union[str, ValueError]]:
+    results = []  # type: List[Union[str, ValueError]]
+    for line in lines:
+        try:
+            results.append(_convert_line(line, uppercase))
+        except ValueError as err:
+            results.append(err)
+    return results
+
+
+def _read(name: str, file: IO[str], chunksize: int) -> Iterator[_Chunk]:
+    number = 1
+    while True:
+        lines = list(islice(file, chunksize))
+        if not lines:
+            break
+        yield name, number, lines
+        number += len(lines)
+
+
+def _chunks(files: Sequence[str], stdin: IO[str],
+            chunksize: int) -> Iterator[_Chunk]:
+    # read each input a chunk at a time, so memory use does not depend on
+    # the size of the input
+    for name in files or ['-']:
+        if name == '-':
+            yield from _read(name, stdin, chunksize)
+            continue
+        with open(name, encoding='utf-8') as file:
+            yield from _read(name, file, chunksize)
+
+
+def _write(chunk: _Chunk, results: List[Union[str, ValueError]],
+           errors: str, stdout: IO[str], stderr: IO[str]) -> bool:
+    name, number, _ = chunk
+    output = []  # type: List[str]
+    for i, result in enumerate(results):
+        if isinstance(result, ValueError):
+            if errors == 'raise':
+                stdout.write(''.join(output))
+                stderr.write('{}: {}:{}: {}\n'.format(
+                    _PROG, '<stdin>' if name == '-' else name, number + i,
+                    result))
+                return False
+            if errors == 'mark':
+                output.append('error: {}\n'.format(result))
+            continue
+        output.append(result + '\n')
+    stdout.write(''.join(output))
+    return True
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=_PROG,
+        description='Convert Fortran format specifications, or FORMAT '
+                    'statements in parentheses, to Python format strings, '
+                    'one per line.  The newlines separating the records of '
+                    'a statement are written as \\n.')
+    parser.add_argument(
+        'files', nargs='*', metavar='FILE',
+        help="files to read, one specification per line, or '-' for "
+             "standard input (the default)")
+    parser.add_argument(
+        '-u', '--uppercase', action='store_true',
+        help='use uppercase hexadecimal digits, INF, NAN, and exponent '
+             'letters')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1, metavar='N',
+        help='number of worker processes to convert with (default: 1)')
+    parser.add_argument(
+        '--chunksize', type=int, default=4096, metavar='LINES',
+        help='number of lines to convert at a time (default: 4096)')
+    parser.add_argument(
+        '-e', '--errors', choices=['raise', 'skip', 'mark'], default='raise',
+        help='stop at the first invalid line (raise, the default), leave '
+             'invalid lines out (skip), or write their error message in '
+             'their place (mark)')
+    return parser
+
+
+def _run(args: argparse.Namespace, chunks: Iterator[_Chunk]) -> int:
+    if args.jobs == 1:
+        for chunk in chunks:
+            results = _convert_lines(chunk[2], args.uppercase)
+            if not _write(chunk, results, args.errors, sys.stdout,
+                          sys.stderr):
+                return 1
+        return 0
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(args.jobs) as executor:
+        # results are written in order, with enough chunks in flight to keep
+        # every worker busy
+        pending = [(chunk, executor.submit(_convert_lines, chunk[2],
+                                           args.uppercase))
+                   for chunk in islice(chunks, 2 * args.jobs)]
+        while pending:
+            chunk, future = pending.pop(0)
+            for chunk_ in islice(chunks, 1):
+                pending.append((chunk_, executor.submit(
+                    _convert_lines, chunk_[2], args.uppercase)))
+            if not _write(chunk, future.result(), args.errors, sys.stdout,
+                          sys.stderr):
+                for _, future in pending:
+                    future.cancel()
+                return 1
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command line converter.
+
+    Lines are converted a chunk at a time and only a bounded number of
+    chunks are ever pending, so memory use is constant regardless of the
+    size of the input.
+
+    Parameters
+    ----------
+    argv
+        Command line arguments, without the program name.  Defaults to
+        :data:`sys.argv`.
+
+    Returns
+    -------
+    int
+        Exit status, 0 on success and 1 if an invalid line stopped the
+        conversion or standard output was closed early, such as by
+        :code:`head`.
+
+    Raises
+    ------
+    SystemExit
+        With status 2 if the arguments are invalid or an input file can not
+        be read.
+
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.chunksize < 1:
+        parser.error('--chunksize must be at least 1')
+    try:
+        return _run(args, _chunks(args.files, sys.stdin, args.chunksize))
+    except BrokenPipeError:
+        # the reader has gone away, so stop quietly, and keep the flush of
+        # the remaining output at exit from failing again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        return 1
+    except OSError as err:
+        if err.filename is None:
+            raise
+        parser.error("can't read '{}': {}".format(err.filename, err.strerror))
+    except UnicodeDecodeError as err:
+        parser.error('invalid input: {}'.format(err))
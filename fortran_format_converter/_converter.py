@@ -1,25 +1,283 @@
 """Fortran format to Python format string conversion."""
 
-from typing import Tuple, Optional
+import atexit
+from operator import methodcaller
+from threading import Lock
+from time import perf_counter
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, List,
+                    Optional, Tuple, cast)
 
-import regex as re  # type: ignore
-from cached_property import cached_property  # type: ignore
+from ._cache import LRUCache
+from ._render import REAL_DESCRIPTORS, render_real
+from ._table import build_table
 
-__all__ = ['Format', 'convert']
+if TYPE_CHECKING:  # pragma: no cover
+    from ._persistent import PersistentCache
 
-_MATCH_FORMAT = re.compile(
-    r'(?|'
-    r'(I)(\d+)(?:\.(\d+))?$|'              # integer
-    r'([BOZ])(\d+)(?:\.(\d+))?$|'          # binary, octal, and hexadecimal
-    r'([FD])(\d+)\.(\d+)$|'                # real and double
-    r'(E)(\d+)\.(\d+)(?:[ED](\d+))?$|'     # exponent
-    r'(EN)(\d+)\.(\d+)(?:[ED](\d+))?$|'    # engineering
-    r'(ES)(\d+)\.(\d+)(?:[ED](\d+))?$|'    # scientific
-    r'(L)(\d+)$|'                          # logical
-    r'(A)(\d+)?$|'                         # character
-    r'(G)(\d+)\.(\d+)(?:[ED](\d+))?$'      # generalized
-    r')'
-)
+__all__ = ['Format', 'FormatError', 'convert', 'convert_cache',
+           'format_cache', 'instrumentation_snapshot', 'is_valid',
+           'use_instrumentation', 'use_lookup_table', 'use_persistent_cache']
+
+_Parts = Tuple[str, Optional[int], Optional[int], Optional[int]]
+# called with the specifier, its edit descriptor (None if invalid), and the
+# parse and assembly times of each constructed Format
+_Hook = Callable[[Any, Optional[str], float, float], None]
+_Numbers = Tuple[Optional[int], Optional[int], Optional[int]]
+
+
+def _scan_integer(body: str) -> Optional[_Numbers]:
+    # Iw[.m], Bw[.m], Ow[.m], and Zw[.m]
+    width, dot, digits = body.partition('.')
+    if width.isdecimal() and (not dot or digits.isdecimal()):
+        return int(width), int(digits) if dot else None, None
+    return None
+
+
+def _scan_real(body: str) -> Optional[_Numbers]:
+    # Fw.d and Dw.d
+    width, dot, digits = body.partition('.')
+    if dot and width.isdecimal() and digits.isdecimal():
+        return int(width), int(digits), None
+    return None
+
+
+def _scan_exponent(body: str) -> Optional[_Numbers]:
+    # Ew.d[Ee], ENw.d[Ee], ESw.d[Ee], and Gw.d[Ee] where the exponent letter
+    # may also be D
+    width, dot, rest = body.partition('.')
+    digits, letter, exponent = rest.partition('E')
+    if not letter:
+        digits, letter, exponent = rest.partition('D')
+    if (dot and width.isdecimal() and digits.isdecimal() and
+            (not letter or exponent.isdecimal())):
+        return int(width), int(digits), int(exponent) if letter else None
+    return None
+
+
+def _scan_logical(body: str) -> Optional[_Numbers]:
+    # Lw
+    if body.isdecimal():
+        return int(body), None, None
+    return None
+
+
+def _scan_character(body: str) -> Optional[_Numbers]:
+    # A[w]
+    if not body:
+        return None, None, None
+    if body.isdecimal():
+        return int(body), None, None
+    return None
+
+
+_SCANNERS = {
+    'I': _scan_integer,     # integer
+    'B': _scan_integer,     # binary
+    'O': _scan_integer,     # octal
+    'Z': _scan_integer,     # hexadecimal
+    'F': _scan_real,        # real
+    'D': _scan_real,        # double
+    'E': _scan_exponent,    # exponent
+    'EN': _scan_exponent,   # engineering
+    'ES': _scan_exponent,   # scientific
+    'L': _scan_logical,     # logical
+    'A': _scan_character,   # character
+    'G': _scan_exponent     # generalized
+}
+
+
+def _scan(specifier: str) -> Optional[_Parts]:
+    """Split an uppercase Fortran format specifier into its parts.
+
+    This is a single pass scanner that dispatches on the edit descriptor
+    letter(s) and then checks and converts the digits that follow.
+
+    Parameters
+    ----------
+    specifier
+        Uppercase Fortran format specification for a single value.
+
+    Returns
+    -------
+    Optional[Tuple[str, Optional[int], Optional[int], Optional[int]]]
+        The type, width, digits, and exponent digits of the specifier or None
+        if it is not a valid Fortran format specifier.
+
+    """
+    # a single trailing newline has always been accepted, as it was by the
+    # end of string anchor in the regular expression this scanner replaced
+    if specifier.endswith('\n'):
+        specifier = specifier[:-1]
+    type_ = specifier[:2]
+    if type_ != 'EN' and type_ != 'ES':
+        type_ = specifier[:1]
+    try:
+        scan = _SCANNERS[type_]
+    except KeyError:
+        return None
+    numbers = scan(specifier[len(type_):])
+    if numbers is None:
+        return None
+    width, digits, exponent = numbers
+    return type_, width, digits, exponent
+
+
+def _decimal_end(text: str, pos: int) -> int:
+    # index of the first character at or after pos that is not a digit
+    while text[pos:pos + 1].isdecimal():
+        pos += 1
+    return pos
+
+
+def _diagnose(specifier: str) -> Tuple[int, str]:
+    """Find where an invalid Fortran format specifier goes wrong.
+
+    This is the slow counterpart of :func:`_scan`, only used to describe
+    errors.
+
+    Parameters
+    ----------
+    specifier
+        Invalid Fortran format specification for a single value.
+
+    Returns
+    -------
+    Tuple[int, str]
+        Index of the first character that is not valid and a description of
+        what was expected there.
+
+    """
+    text = specifier.upper()
+    if text.endswith('\n'):
+        text = text[:-1]
+    type_ = text[:2] if text[:2] in {'EN', 'ES'} else text[:1]
+    if type_ not in _SCANNERS:
+        return 0, 'edit descriptor'
+    pos = len(type_)
+    end = _decimal_end(text, pos)
+    if end == pos:
+        return pos, 'width or end of specifier' if type_ == 'A' else 'width'
+    if type_ in {'L', 'A'}:
+        return end, 'end of specifier'
+    if text[end:end + 1] != '.':
+        if type_ in {'I', 'B', 'O', 'Z'}:
+            return end, "'.' or end of specifier"
+        return end, "'.'"
+    pos = end + 1
+    end = _decimal_end(text, pos)
+    if end == pos:
+        return pos, 'digits'
+    if type_ in {'E', 'EN', 'ES', 'G'} and text[end:end + 1] in {'E', 'D'}:
+        pos = end + 1
+        end = _decimal_end(text, pos)
+        if end == pos:
+            return pos, 'exponent digits'
+        return end, 'end of specifier'
+    if type_ in {'E', 'EN', 'ES', 'G'}:
+        return end, 'exponent letter or end of specifier'
+    return end, 'end of specifier'
+
+
+class FormatError(ValueError):
+    """Invalid Fortran format specification.
+
+    Raising and catching is cheap, the location of the error is only worked
+    out when :attr:`position` or :attr:`expected` is first used and the
+    message when the error is converted to a string.
+
+    Parameters
+    ----------
+    specifier
+        The invalid Fortran format specification.
+
+    """
+
+    def __init__(self, specifier: Any) -> None:
+        super().__init__(specifier)
+        self.specifier = specifier
+        self._diagnosis = None  # type: Optional[Tuple[int, str]]
+
+    def __str__(self) -> str:
+        return "'{}' is not a valid Fortran format specifier".format(
+            self.specifier)
+
+    def _diagnose(self) -> Tuple[int, str]:
+        if self._diagnosis is None:
+            if isinstance(self.specifier, str):
+                self._diagnosis = _diagnose(self.specifier)
+            else:
+                self._diagnosis = (0, 'string')
+        return self._diagnosis
+
+    @property
+    def position(self) -> int:
+        """Index of the first character of the specification that is invalid.
+
+        This is the length of the specification if it ends too soon.
+        """
+        return self._diagnose()[0]
+
+    @property
+    def expected(self) -> str:
+        """What was expected at :attr:`position`, such as 'width'."""
+        return self._diagnose()[1]
+
+
+def is_valid(fortran_format: str) -> bool:
+    """Check if a Fortran format specification is valid, without raising.
+
+    This only scans the specification, no :class:`Format` or error is
+    created, making it the cheapest way to validate.
+
+    Parameters
+    ----------
+    fortran_format
+        Fortran format specification for a single value as a string.
+
+    Returns
+    -------
+    bool
+        True if :paramref:`fortran_format` is a valid Fortran format
+        specification, False if it is not, including if it is not a string.
+
+    """
+    try:
+        return _scan(fortran_format.upper()) is not None
+    except AttributeError:  # not a string
+        return False
+
+
+_TYPES = {
+    'I': 'd',
+    'B': 'b',
+    'O': 'o',
+    'Z': 'X',
+    'F': 'F',
+    'E': 'E',
+    'D': 'F',
+    'EN': 'E',
+    'ES': 'E',
+    'L': '',
+    'A': 's',
+    'G': 'G'
+}
+
+convert_cache = LRUCache(maxsize=1024)  # type: LRUCache[str]
+"""Cache of :func:`convert` results keyed on its arguments.
+
+Use :meth:`LRUCache.info` for statistics, :meth:`LRUCache.clear` to empty
+it, and set :attr:`LRUCache.maxsize` to change its size (0 disables it).
+"""
+
+
+def _real_formatter(template: str) -> Callable[[Any], str]:
+    def format_real(value: Any) -> str:
+        # a single value, even a tuple, and the same error as format()
+        try:
+            return template % (value,)
+        except TypeError as err:
+            raise ValueError(str(err)) from None
+    return format_real
 
 
 class Format:
@@ -40,6 +298,9 @@ class Format:
         3. Engineering format.  Exponential format is the fallback.
         4. Scientific format.  Exponential format is the fallback.
 
+    Use :meth:`render` for output identical to Fortran's for real numbers,
+    including all of the above.
+
     Parameters
     ----------
     fortran_format
@@ -52,104 +313,585 @@ class Format:
 
     Raises
     ------
-    ValueError
+    FormatError
         If :paramref:`fortran_format` is not a valid Fortran format
         specification.
 
+    Notes
+    -----
+    Instances are immutable, with every field computed on construction, and
+    compare equal when the parsed specification and :paramref:`uppercase`
+    are the same, so they can be used as dictionary keys.
+
     """
 
+    __slots__ = ('_uppercase', '_fortran_format', '_type', '_width',
+                 '_digits', '_exponent', '_python_type', '_sign', '_fill',
+                 '_precision', '_string', '_formatter')
+
     def __init__(self, fortran_format: str, uppercase: bool = False) -> None:
         self._uppercase = uppercase
         self._fortran_format = fortran_format
+        if _instruments is None:
+            self._parse()
+            self._assemble()
+            return
+        start = perf_counter()
+        try:
+            self._parse()
+        except ValueError:
+            _instruments.constructed(fortran_format, None,
+                                     perf_counter() - start, 0.0)
+            raise
+        parsed = perf_counter()
+        self._assemble()
+        _instruments.constructed(fortran_format, self._type, parsed - start,
+                                 perf_counter() - parsed)
+
+    def _parse(self) -> None:
         self._type, self._width, self._digits, self._exponent = (
             self._fortran_parts())
 
+    def _assemble(self) -> None:
+        # everything else is derived once, up front
+        self._python_type = self._compute_type()
+        self._sign = self._compute_sign()
+        self._fill = self._compute_fill()
+        self._precision = self._compute_precision()
+        self._string = self._compute_string()
+        self._formatter = None  # type: Optional[Callable[[Any], str]]
+
+    @classmethod
+    def get(cls, fortran_format: str, uppercase: bool = False) -> 'Format':
+        """Get a shared instance for a Fortran format specification.
+
+        Equivalent specifications share a single instance, held in
+        :data:`format_cache`.  Specifications are equivalent if they only
+        differ in case.  Getting a shared instance is a single cache lookup,
+        avoiding both parsing and allocation.
+
+        Parameters
+        ----------
+        fortran_format
+            Fortran format specification for a single value as a string.
+        uppercase
+            Set to True to use uppercase format, see :class:`Format`.
+
+        Returns
+        -------
+        Format
+            Shared instance for the given specification.
+
+        Raises
+        ------
+        FormatError
+            If :paramref:`fortran_format` is not a valid Fortran format
+            specification.
+
+        """
+        try:
+            specifier = fortran_format.upper()
+        except AttributeError:
+            return cls(fortran_format, uppercase)  # raises ValueError
+        key = (cls, specifier, uppercase)
+        format_ = format_cache.get(key)
+        if format_ is None:
+            try:
+                format_ = cls(specifier, uppercase)
+            except ValueError:
+                # report the error with the original specification
+                return cls(fortran_format, uppercase)
+            format_cache.put(key, format_)
+        if _instruments is not None:
+            _instruments.requested(fortran_format)
+        return format_
+
+    @classmethod
+    def from_parts(cls, fortran_format: str, descriptor: str,
+                   width: Optional[int], digits: Optional[int],
+                   exponent_digits: Optional[int],
+                   uppercase: bool = False) -> 'Format':
+        """Create an instance from an already parsed specification.
+
+        The specification is not parsed again, so the parts must be those of
+        :paramref:`fortran_format`, as given by the :attr:`descriptor`,
+        :attr:`width`, :attr:`digits`, and :attr:`exponent_digits` of an
+        instance for it.
+
+        Parameters
+        ----------
+        fortran_format
+            Fortran format specification for a single value as a string.
+        descriptor
+            Edit descriptor, such as :code:`'EN'`.
+        width
+            Width, None if not given.
+        digits
+            Digits, None if not given.
+        exponent_digits
+            Exponent digits, None if not given.
+        uppercase
+            Set to True to use uppercase format, see :class:`Format`.
+
+        Returns
+        -------
+        Format
+            Instance equal to :code:`Format(fortran_format, uppercase)`.
+
+        """
+        format_ = cls.__new__(cls)
+        format_._uppercase = uppercase
+        format_._fortran_format = fortran_format
+        format_._type = descriptor
+        format_._width = width
+        format_._digits = digits
+        format_._exponent = exponent_digits
+        format_._assemble()
+        return format_
+
     def _format_error(self) -> Exception:
-        return ValueError(
-            "'{}' is not a valid Fortran format specifier".format(
-                self._fortran_format))
+        return FormatError(self._fortran_format)
 
-    def _fortran_parts(self) -> \
-            Tuple[str, Optional[int], Optional[int], Optional[int]]:
+    def _fortran_parts(self) -> _Parts:
         try:
-            type_, width_, digits_, exponent_ = (
-                _MATCH_FORMAT.match(self._fortran_format.upper()).groups())
+            parts = _scan(self._fortran_format.upper())
         except AttributeError:
             raise self._format_error()
-        width = int(width_) if width_ else None
-        digits = int(digits_) if digits_ else None
-        exponent = int(exponent_) if exponent_ else None
-        return type_, width, digits, exponent
+        if parts is None:
+            raise self._format_error()
+        return parts
 
-    @cached_property
-    def string(self) -> str:
-        """Best effort approximating Python format string."""
+    def _compute_type(self) -> str:
+        if self._uppercase:
+            return _TYPES[self._type]
+        return _TYPES[self._type].lower()
+
+    def _compute_sign(self) -> str:
+        if self._python_type.lower() in {'d', 'f', 'e', 'g'}:
+            return '-'
+        return ''
+
+    def _compute_fill(self) -> str:
+        if (self._type in {'I', 'B', 'O', 'Z'} and self._digits and
+                self._width and self._digits >= self._width):
+            return '0'  # zero fill
+        return ''  # space fill
+
+    def _compute_precision(self) -> Optional[int]:
+        if self._python_type.lower() in {'f', 'e', 'g'}:
+            return self._digits
+        return None
+
+    def _compute_string(self) -> str:
         align = self.align if self.align != '>' else ''
-        sign = self.sign if self.sign != '-' else ''
-        width = self.width if self.width is not None else ''
-        precision = '.{}'.format(self.precision) \
-            if self.precision is not None else ''
+        sign = self._sign if self._sign != '-' else ''
+        width = self._width if self._width is not None else ''
+        precision = '.{}'.format(self._precision) \
+            if self._precision is not None else ''
         return '{}{}{}{}{}{}'.format(
-            self.fill, align, sign, width, precision, self.type)
+            self._fill, align, sign, width, precision, self._python_type)
+
+    def _compile(self) -> Callable[[Any], str]:
+        if self._python_type.lower() in {'f', 'e', 'g'}:
+            # printf style formatting is the fastest and matches format() for
+            # anything that is converted to a float
+            return _real_formatter(cast(str, self.printf))
+        # format() without looking up the builtin or parsing the call
+        return methodcaller('__format__', self._string)
 
-    @cached_property
+    def _key(self) -> Tuple[str, Optional[int], Optional[int], Optional[int],
+                            bool]:
+        return (self._type, self._width, self._digits, self._exponent,
+                self._uppercase)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Format):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return '{}({!r}, uppercase={!r})'.format(
+            type(self).__name__, self._fortran_format, self._uppercase)
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, bool]]:
+        return type(self), (self._fortran_format, self._uppercase)
+
+    @property
+    def string(self) -> str:
+        """Best effort approximating Python format string."""
+        return self._string
+
+    @property
     def sign(self) -> str:
         """Sign character."""
-        if self.type.lower() in {'d', 'f', 'e', 'g'}:
-            return '-'
-        return ''
+        return self._sign
 
     @property
     def align(self) -> str:
         """Alignment character."""
         return '>'
 
-    @cached_property
+    @property
     def fill(self) -> str:
         """Fill character."""
-        if (self._type in {'I', 'B', 'O', 'Z'} and self._digits and
-                self._width and self._digits >= self._width):
-            return '0'  # zero fill
-        return ''  # space fill
+        return self._fill
 
-    @cached_property
+    @property
     def precision(self) -> Optional[int]:
         """Precision for float, exponent, and general, else None."""
-        if self.type.lower() in {'f', 'e', 'g'}:
-            return self._digits
-        return None
+        return self._precision
 
-    @cached_property
+    @property
     def type(self) -> str:
         """Type letter."""
-        switch = {
-            'I': 'd',
-            'B': 'b',
-            'O': 'o',
-            'Z': 'X',
-            'F': 'F',
-            'E': 'E',
-            'D': 'F',
-            'EN': 'E',
-            'ES': 'E',
-            'L': '',
-            'A': 's',
-            'G': 'G'
-        }
-        try:
-            if self._uppercase:
-                return switch[self._type]
-            return switch[self._type].lower()
-        except KeyError:  # pragma: no cover
-            # this can't realy be reached due to the structure of the
-            # _MATCH_FORMAT regular expression
-            raise self._format_error()
+        return self._python_type
 
     @property
     def width(self) -> Optional[int]:
         """Width of field."""
         return self._width
 
+    @property
+    def descriptor(self) -> str:
+        """Fortran edit descriptor, such as 'EN'."""
+        return self._type
+
+    @property
+    def digits(self) -> Optional[int]:
+        """Fortran digits, minimum digits for integers, None if not given."""
+        return self._digits
+
+    @property
+    def exponent_digits(self) -> Optional[int]:
+        """Fortran exponent digits, None if not given."""
+        return self._exponent
+
+    @property
+    def printf(self) -> Optional[str]:
+        """Printf style template equivalent to :attr:`string`.
+
+        None for logical and binary values, which have no printf style
+        equivalent.
+        """
+        if self._python_type in {'', 'b'}:
+            return None
+        width = '' if self._width is None else str(self._width)
+        if self._python_type == 's':
+            return '%-' + width + 's'  # strings are left aligned by default
+        precision = ('' if self._precision is None
+                     else '.{}'.format(self._precision))
+        return '%' + self._fill + width + precision + self._python_type
+
+    @property
+    def formatter(self) -> Callable[[Any], str]:
+        """Precompiled function formatting a single value.
+
+        Equivalent to :code:`lambda value: format(value, fmt.string)` but
+        without parsing :attr:`string` on every call, raising ValueError for
+        values that can not be formatted.  Real formats use a printf style
+        template and integer, logical, and character formats a bound
+        :meth:`object.__format__`.  Values given to a real format are
+        converted to :class:`float`, so :class:`decimal.Decimal` values are
+        rounded as floats.  Compiled on first use.
+        """
+        if self._formatter is None:
+            self._formatter = self._compile()
+        return self._formatter
+
+    def render(self, value: Any) -> str:
+        """Format a value exactly as Fortran formatted output would.
+
+        Unlike :attr:`string` this follows Fortran's rules for real edit
+        descriptors (F, D, E, EN, ES, and G) exactly:
+
+            1. The exponent has :code:`e` digits for Ew.dEe, or else two
+               digits, or three digits without the exponent letter if it
+               does not fit in two.
+            2. D uses D as the exponent letter, E uses E regardless of
+               :paramref:`uppercase`.
+            3. E writes a zero before the decimal point, ES writes one
+               non-zero digit, and EN writes one to three digits with an
+               exponent that is a multiple of three.
+            4. G uses fixed point, followed by blanks in place of the
+               exponent, if the rounded value is at least 0.1 and less than
+               :code:`10**d`, and E otherwise.
+            5. The optional zero before the decimal point is left off if
+               there is no room for it, and the entire field is filled with
+               asterisks if the value still does not fit.
+            6. Infinity and NaN are written as text.
+
+        Other edit descriptors are formatted with :attr:`formatter`.
+
+        Parameters
+        ----------
+        value
+            Value to format.  Values given to a real edit descriptor are
+            converted to :class:`float`.
+
+        Returns
+        -------
+        str
+            The formatted value.
+
+        """
+        if self._type in REAL_DESCRIPTORS:
+            return render_real(self._type, cast(int, self._width),
+                               cast(int, self._digits), self._exponent,
+                               value)
+        return self.formatter(value)
+
+    def format_many(self, values: Iterable[Any], sep: str = '') -> str:
+        """Format many values into a single string.
+
+        Parameters
+        ----------
+        values
+            Values to format, as with :attr:`formatter`.
+        sep
+            Text to place between formatted values.
+
+        Returns
+        -------
+        str
+            The formatted values joined by :paramref:`sep`.
+
+        """
+        if self._python_type.lower() in {'f', 'e', 'g'}:
+            # one printf style operation formats every value at once
+            values = tuple(values)
+            template = sep.replace('%', '%%').join(
+                [cast(str, self.printf)] * len(values))
+            try:
+                return template % values
+            except TypeError as err:
+                raise ValueError(str(err)) from None
+        return sep.join(map(self.formatter, values))
+
+
+format_cache = LRUCache(maxsize=1024)  # type: LRUCache[Format]
+"""Cache of shared :class:`Format` instances used by :meth:`Format.get`.
+
+Use :meth:`LRUCache.info` for statistics, :meth:`LRUCache.clear` to empty
+it, and set :attr:`LRUCache.maxsize` to change its size (0 disables it).
+"""
+
+
+# lookup tables keyed on uppercase, only populated while enabled
+_lookup_tables = {}  # type: Dict[bool, Dict[str, str]]
+_use_lookup_table = False
+
+
+class _Instruments:
+    """Counts conversions and times the construction of :class:`Format`."""
+
+    def __init__(self, hook: Optional[_Hook] = None) -> None:
+        self.hook = hook
+        self.lock = Lock()
+        self.specifiers = {}  # type: Dict[str, int]
+        self.descriptors = {}  # type: Dict[str, str]
+        self.invalid = 0
+        self.parse_time = 0.0
+        self.assembly_time = 0.0
+
+    def requested(self, specifier: str) -> None:
+        # called for every valid conversion, whether or not it was cached
+        with self.lock:
+            count = self.specifiers.get(specifier)
+            if count is None:
+                self.descriptors[specifier] = cast(
+                    _Parts, _scan(specifier.upper()))[0]
+                count = 0
+            self.specifiers[specifier] = count + 1
+
+    def constructed(self, specifier: Any, descriptor: Optional[str],
+                    parse_time: float, assembly_time: float) -> None:
+        with self.lock:
+            if descriptor is None:
+                self.invalid += 1
+            self.parse_time += parse_time
+            self.assembly_time += assembly_time
+        if self.hook is not None:
+            self.hook(specifier, descriptor, parse_time, assembly_time)
+
+    def counts(self) -> Dict[str, int]:
+        # number of conversions of each edit descriptor
+        counts = dict.fromkeys(_SCANNERS, 0)
+        for specifier, count in self.specifiers.items():
+            counts[self.descriptors[specifier]] += count
+        return counts
+
+
+# only set while instrumentation is enabled, so that it costs a single check
+# per Format otherwise
+_instruments = None  # type: Optional[_Instruments]
+
+
+def use_instrumentation(enabled: bool = True,
+                        hook: Optional[_Hook] = None) -> None:
+    """Enable or disable instrumentation of conversions.
+
+    While enabled, every call of :func:`convert` and :meth:`Format.get` is
+    counted by specification and edit descriptor, including calls answered
+    by a cache or the lookup table, and the time spent parsing the
+    specification and assembling the Python format string of every
+    :class:`Format` constructed is accumulated, see
+    :func:`instrumentation_snapshot`.  Enabling resets the counts and times.
+    Instrumentation is disabled by default, costing nothing beyond a single
+    check per call.
+
+    Parameters
+    ----------
+    enabled
+        Set to False to disable instrumentation and discard the counts and
+        times.
+    hook
+        Function to call after each :class:`Format` is constructed, or fails
+        to be, with the specification, its edit descriptor such as
+        :code:`'EN'` (None if it is invalid), and the parse and assembly
+        times in seconds.  It is called from whichever thread constructed
+        the :class:`Format`.
+
+    """
+    global _instruments
+    _instruments = _Instruments(hook) if enabled else None
+
+
+def _cache_stats(cache: LRUCache[Any]) -> Dict[str, Any]:
+    info = cache.info()
+    lookups = info.hits + info.misses
+    stats = dict(info._asdict())
+    stats['hit_rate'] = info.hits / lookups if lookups else None
+    return stats
+
+
+def instrumentation_snapshot() -> Dict[str, Any]:
+    """Get the counts and times collected since instrumentation was enabled.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A new dictionary with the following keys:
+
+            * 'enabled' - whether instrumentation is enabled.
+            * 'specifiers' - number of conversions, calls of :func:`convert`
+              and :meth:`Format.get`, of each valid specification.
+            * 'descriptors' - number of conversions of each edit
+              descriptor, I, B, O, Z, F, D, E, EN, ES, L, A, and G.
+            * 'invalid' - number of invalid specifications constructed.
+            * 'parse_time' - seconds spent parsing specifications.
+            * 'assembly_time' - seconds spent assembling Python format
+              strings.
+            * 'convert_cache' and 'format_cache' - the statistics of
+              :data:`convert_cache` and :data:`format_cache`, see
+              :class:`CacheInfo`, with their 'hit_rate', None before the
+              first lookup.  These are always collected.
+
+        Counts and times are all zero while instrumentation is disabled.
+
+    """
+    instruments = _instruments or _Instruments()
+    with instruments.lock:
+        return {
+            'enabled': _instruments is not None,
+            'specifiers': dict(instruments.specifiers),
+            'descriptors': instruments.counts(),
+            'invalid': instruments.invalid,
+            'parse_time': instruments.parse_time,
+            'assembly_time': instruments.assembly_time,
+            'convert_cache': _cache_stats(convert_cache),
+            'format_cache': _cache_stats(format_cache)
+        }
+
+
+def use_lookup_table(enabled: bool = True) -> None:
+    """Enable or disable the precomputed lookup table used by :func:`convert`.
+
+    When enabled, :func:`convert` looks up specifiers in a table of every
+    specifier with a width of up to 99, up to 30 digits, and up to 4
+    exponent digits, so converting them is a single dictionary lookup with
+    no parsing or cache bookkeeping.  Other specifiers are converted as
+    usual.  The table for each value of :paramref:`uppercase` takes about
+    80,000 entries and is built on first use.  Disabling the table frees
+    it.
+
+    Parameters
+    ----------
+    enabled
+        Set to False to disable the table.
+
+    """
+    global _use_lookup_table
+    _use_lookup_table = enabled
+    if not enabled:
+        _lookup_tables.clear()
+
+
+def _lookup_table(uppercase: bool) -> Dict[str, str]:
+    try:
+        return _lookup_tables[uppercase]
+    except KeyError:
+        table = _lookup_tables[uppercase] = build_table(uppercase)
+        return table
+
+
+# only set while conversions are persisted
+_persistent_cache = None  # type: Optional[PersistentCache]
+
+
+def _open_persistent_cache(path: str) -> 'PersistentCache':
+    # open the database and warm up the caches from it, with conversions
+    # for convert_cache and the parsed parts for format_cache
+    from . import __version__, _persistent
+    cache = _persistent.PersistentCache(path, __version__)
+    sizes = [convert_cache.maxsize, format_cache.maxsize]
+    if any(size != 0 for size in sizes):
+        # each cache gets no more rows than it holds, so nothing is evicted
+        limit = None if None in sizes else max(cast(List[int], sizes))
+        rows = cache.load(limit)
+        for (specifier, uppercase, string, _, _, _, _) in rows[:sizes[0]]:
+            convert_cache.put((specifier, uppercase), string)
+        for (specifier, uppercase, _, descriptor, width, digits,
+             exponent_digits) in rows[:sizes[1]]:
+            specifier = specifier.upper()
+            format_cache.put((Format, specifier, uppercase), Format.from_parts(
+                specifier, descriptor, width, digits, exponent_digits,
+                uppercase))
+    return cache
+
+
+def use_persistent_cache(path: Optional[str] = None) -> None:
+    """Persist the conversions made by :func:`convert` in a database.
+
+    Conversions are stored in an SQLite database, which any number of
+    processes can share, along with the parsed type, width, digits, and
+    exponent digits of each specification.  Enabling the database fills
+    :data:`convert_cache` with the conversions already stored, and
+    :data:`format_cache` with :class:`Format` objects assembled from their
+    parsed parts, up to their :attr:`LRUCache.maxsize`, so a new process
+    starts with warm caches.
+    New conversions are written in batches, when the database is disabled,
+    and at exit.  Conversions are keyed on the version of this package, so
+    upgrading never uses stale conversions.
+
+    Parameters
+    ----------
+    path
+        Path to the database, created if it does not exist, or None to
+        stop using the database.
+
+    """
+    global _persistent_cache
+    if _persistent_cache is not None:
+        atexit.unregister(_persistent_cache.close)
+        _persistent_cache.close()
+        _persistent_cache = None
+    if path is not None:
+        _persistent_cache = _open_persistent_cache(path)
+        atexit.register(_persistent_cache.close)
+
 
 def convert(fortran_format: str, uppercase: bool = False) -> str:
     """Convert Fortran format specification to Python format string language.
@@ -171,6 +913,46 @@ def convert(fortran_format: str, uppercase: bool = False) -> str:
     str
         A Python format string that is a best effort approximation of the
         given :paramref:`fortran_format` string.
+
+    Raises
+    ------
+    FormatError
+        If :paramref:`fortran_format` is not a valid Fortran format
+        specification.
+
+    Notes
+    -----
+    Results are memoized in :data:`convert_cache`, so converting a repeated
+    specification is a single cache lookup.  Invalid specifications are not
+    cached.
+
+    Common specifications can instead be looked up in a precomputed table,
+    see :func:`use_lookup_table`, and conversions can be shared between
+    processes, see :func:`use_persistent_cache`.
+
     """
-    format_string = Format(fortran_format, uppercase).string  # type: str
+    if _use_lookup_table and isinstance(fortran_format, str):
+        table = _lookup_table(uppercase)
+        format_string = table.get(fortran_format)
+        if format_string is None:
+            format_string = table.get(fortran_format.upper())
+        if format_string is not None:
+            if _instruments is not None:
+                _instruments.requested(fortran_format)
+            return format_string
+    key = (fortran_format, uppercase)
+    try:
+        format_string = convert_cache.get(key)
+    except TypeError:  # unhashable, so not a specification at all
+        return Format(fortran_format, uppercase).string
+    if format_string is None:
+        format_ = Format(fortran_format, uppercase)
+        format_string = format_.string
+        convert_cache.put(key, format_string)
+        if _persistent_cache is not None:
+            _persistent_cache.add(
+                fortran_format, uppercase, format_string, format_.descriptor,
+                format_.width, format_.digits, format_.exponent_digits)
+    if _instruments is not None:
+        _instruments.requested(fortran_format)
     return format_string
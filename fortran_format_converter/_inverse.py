@@ -0,0 +1,169 @@
+"""Python format string to Fortran format specification conversion."""
+
+from typing import NamedTuple, Optional
+
+from ._cache import LRUCache
+
+__all__ = ['to_fortran', 'to_fortran_cache']
+
+_ALIGNS = {'<', '>', '=', '^'}
+_SIGNS = {'+', '-', ' '}
+_TYPES = set('bcdeEfFgGnosxX%')
+
+_Spec = NamedTuple('_Spec', [
+    ('fill', str),
+    ('align', str),
+    ('zero', bool),
+    ('width', Optional[int]),
+    ('precision', Optional[int]),
+    ('type', str)
+])
+
+
+def _digits(spec: str, pos: int) -> int:
+    # index of the first non-digit at or after pos
+    while spec[pos:pos + 1].isdecimal():
+        pos += 1
+    return pos
+
+
+def _parse(spec: str) -> Optional[_Spec]:
+    """Split a Python format specification into the parts used by Fortran.
+
+    This is a single pass scanner for
+    :code:`[[fill]align][sign][z][#][0][width][grouping][.precision][type]`.
+
+    Parameters
+    ----------
+    spec
+        Python format specification for a single value.
+
+    Returns
+    -------
+    Optional[_Spec]
+        The fill, alignment, zero padding, width, precision, and type of the
+        specification, with sign, alternate form, and grouping dropped, or
+        None if it is not a valid Python format specification.
+
+    """
+    fill, align, pos = '', '', 0
+    if spec[1:2] in _ALIGNS:
+        fill, align, pos = spec[0], spec[1], 2
+    elif spec[:1] in _ALIGNS:
+        align, pos = spec[0], 1
+    if spec[pos:pos + 1] in _SIGNS:
+        pos += 1
+    if spec[pos:pos + 1] == 'z':
+        pos += 1
+    if spec[pos:pos + 1] == '#':
+        pos += 1
+    zero = spec[pos:pos + 1] == '0'
+    end = _digits(spec, pos)
+    width = int(spec[pos:end]) if end > pos else None
+    pos = end
+    if spec[pos:pos + 1] in {',', '_'}:
+        pos += 1
+    precision = None
+    if spec[pos:pos + 1] == '.':
+        end = _digits(spec, pos + 1)
+        if end == pos + 1:
+            return None
+        precision = int(spec[pos + 1:end])
+        pos = end
+    type_ = spec[pos:]
+    if type_ and type_ not in _TYPES:
+        return None
+    return _Spec(fill, align, zero or (fill == '0' and align == '='), width,
+                 precision, type_)
+
+
+def _descriptor(spec: _Spec) -> str:
+    # the closest Fortran edit descriptor, chosen so that converting it back
+    # gives the same Python format string whenever that is possible
+    type_ = spec.type.lower()
+    width = 0 if spec.width is None else spec.width  # 0 is minimal width
+    if type_ in {'d', 'n', 'b', 'o', 'x'}:
+        letter = {'d': 'I', 'n': 'I', 'b': 'B', 'o': 'O', 'x': 'Z'}[type_]
+        if spec.zero and width:
+            return '{}{}.{}'.format(letter, width, width)  # zero fill
+        return '{}{}'.format(letter, width)
+    if type_ in {'f', '%', 'e', 'g'}:
+        letter = {'f': 'F', '%': 'F', 'e': 'E', 'g': 'G'}[type_]
+        precision = 6 if spec.precision is None else spec.precision
+        return '{}{}.{}'.format(letter, width, precision)
+    if type_ == 'c':
+        return 'A{}'.format(spec.width or 1)
+    if not type_ and spec.precision is not None:  # general number format
+        return 'G{}.{}'.format(width, spec.precision)
+    if not type_ and spec.width is not None:  # what L converts to
+        return 'L{}'.format(spec.width)
+    return 'A' if spec.width is None else 'A{}'.format(spec.width)
+
+
+to_fortran_cache = LRUCache(maxsize=1024)  # type: LRUCache[str]
+"""Cache of :func:`to_fortran` results keyed on its argument.
+
+Use :meth:`LRUCache.info` for statistics, :meth:`LRUCache.clear` to empty
+it, and set :attr:`LRUCache.maxsize` to change its size (0 disables it).
+"""
+
+
+def to_fortran(python_format: str) -> str:
+    """Convert Python format string language to Fortran format specification.
+
+    This is the inverse of :func:`convert` and like it is a best effort, the
+    closest Fortran edit descriptor is chosen:
+
+        1. Integer (d and n), binary, octal, and hexadecimal types become I,
+           B, O, and Z, with the digits set to the width if zero padded.
+        2. Fixed point (f and %), exponent, and general types become F, E,
+           and G.  The precision defaults to 6 as it does in Python.
+        3. String and character types become A.
+        4. No type becomes G if there is a precision and otherwise L, which
+           :func:`convert` produces for logicals, if there is a width.
+        5. A missing width becomes 0, Fortran's minimal width.
+        6. Fill, alignment, sign, alternate form, and grouping are dropped.
+
+    Converting the result back with :func:`convert` gives the original
+    Python format string for any string produced by :func:`convert`.
+
+    Parameters
+    ----------
+    python_format
+        Python format specification for a single value, such as
+        :code:`'10.4f'`, without the enclosing braces and colon.
+
+    Returns
+    -------
+    str
+        The closest uppercase Fortran format specification.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`python_format` is not a valid Python format
+        specification.
+
+    Notes
+    -----
+    Results are memoized in :data:`to_fortran_cache`, so converting a
+    repeated specification is a single cache lookup.  Invalid specifications
+    are not cached.
+
+    """
+    try:
+        fortran_format = to_fortran_cache.get(python_format)
+    except TypeError:  # unhashable, so not a specification at all
+        fortran_format = None
+    if fortran_format is None:
+        try:
+            spec = _parse(python_format)
+        except TypeError:  # not a string
+            spec = None
+        if spec is None:
+            raise ValueError(
+                "'{}' is not a valid Python format specifier".format(
+                    python_format))
+        fortran_format = _descriptor(spec)
+        to_fortran_cache.put(python_format, fortran_format)
+    return fortran_format
@@ -0,0 +1,126 @@
+"""Record layouts shared by the readers and writers."""
+
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+from ._converter import Format
+from ._statement import FormatStatement
+
+__all__ = ['Field', 'Layout', 'fields', 'records', 'width']
+
+Layout = Union[str, Format, FormatStatement, Sequence[Union[str, Format]]]
+
+Field = NamedTuple('Field', [
+    ('start', int),
+    ('stop', Optional[int]),
+    ('format', Format)
+])
+Field.__doc__ = """Position of a data edit descriptor within a record.
+
+Parameters
+----------
+start
+    Index of the first character of the field.
+stop
+    Index one past the last character of the field, None if the field extends
+    to the end of the record.
+format
+    Data edit descriptor of the field.
+
+"""
+
+
+def records(layout: Layout) -> List[List[Union[str, Format]]]:
+    """Get the literal text and data edit descriptors of each record.
+
+    Parameters
+    ----------
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, a single
+        Fortran format specification or :class:`Format`, or a sequence of
+        Fortran format specifications or :class:`Format` objects making up a
+        single record.
+
+    Returns
+    -------
+    List[List[Union[str, Format]]]
+        Literal text and data edit descriptors of each record.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`layout` contains an invalid Fortran format
+        specification or statement.
+
+    """
+    if isinstance(layout, FormatStatement):
+        return layout.items
+    if isinstance(layout, Format):
+        return [[layout]]
+    if isinstance(layout, str):
+        if layout.lstrip().startswith('('):
+            return FormatStatement(layout).items
+        return [[Format.get(layout)]]
+    return [[format_ if isinstance(format_, Format) else Format.get(format_)
+             for format_ in layout]]
+
+
+def fields(record: Sequence[Union[str, Format]]) -> List[Field]:
+    """Get the position of each data edit descriptor within a record.
+
+    Parameters
+    ----------
+    record
+        Literal text and data edit descriptors of a record.
+
+    Returns
+    -------
+    List[Field]
+        Position of each data edit descriptor.
+
+    Raises
+    ------
+    ValueError
+        If a field of unknown width is followed by any other field or text.
+
+    """
+    result = []
+    start = 0
+    for i, item in enumerate(record):
+        if isinstance(item, str):
+            start += len(item)
+            continue
+        if item.width is None:
+            if i != len(record) - 1:
+                raise ValueError(
+                    'only the last field of a record may be of unknown width')
+            result.append(Field(start, None, item))
+        else:
+            result.append(Field(start, start + item.width, item))
+            start += item.width
+    return result
+
+
+def width(record: Sequence[Union[str, Format]]) -> Optional[int]:
+    """Get the width of a record.
+
+    Parameters
+    ----------
+    record
+        Literal text and data edit descriptors of a record.
+
+    Returns
+    -------
+    Optional[int]
+        Number of characters in the record, None if it contains a field of
+        unknown width.
+
+    """
+    total = 0
+    for item in record:
+        if isinstance(item, str):
+            total += len(item)
+        elif item.width is None:
+            return None
+        else:
+            total += item.width
+    return total
@@ -0,0 +1,156 @@
+"""Reading and writing pandas DataFrames as fixed width records."""
+
+from typing import (TYPE_CHECKING, Any, BinaryIO, Iterator, List, Optional,
+                    Sequence, TextIO, Union, overload)
+
+from ._array import _decode_view, _record_view, write_columns
+from ._converter import Format
+from ._layout import Layout
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    import pandas as pd
+
+__all__ = ['read_fortran', 'write_fortran']
+
+
+def _frame(columns: Sequence['np.ndarray'],
+           names: Optional[Sequence[Any]]) -> 'pd.DataFrame':
+    import pandas as pd
+    if names is None:
+        names = range(len(columns))
+    return pd.DataFrame(dict(zip(names, columns)), columns=list(names))
+
+
+def _frames(view: 'np.ndarray', formats: List[Format],
+            names: Optional[Sequence[Any]], encoding: str,
+            chunksize: int) -> Iterator['pd.DataFrame']:
+    for start in range(0, len(view), chunksize):
+        yield _frame(_decode_view(view[start:start + chunksize], formats,
+                                  encoding), names)
+
+
+@overload
+def read_fortran(file: Union[str, bytes, BinaryIO], layout: Layout,
+                 names: Optional[Sequence[Any]] = None,
+                 chunksize: None = None,
+                 encoding: str = 'ascii') -> 'pd.DataFrame':
+    pass  # pragma: no cover
+
+
+@overload
+def read_fortran(file: Union[str, bytes, BinaryIO], layout: Layout,
+                 names: Optional[Sequence[Any]], chunksize: int,
+                 encoding: str = 'ascii') -> Iterator['pd.DataFrame']:
+    pass  # pragma: no cover
+
+
+@overload
+def read_fortran(file: Union[str, bytes, BinaryIO], layout: Layout,
+                 names: Optional[Sequence[Any]] = None, *, chunksize: int,
+                 encoding: str = 'ascii') -> Iterator['pd.DataFrame']:
+    pass  # pragma: no cover
+
+
+def read_fortran(file: Union[str, bytes, BinaryIO], layout: Layout,
+                 names: Optional[Sequence[Any]] = None,
+                 chunksize: Optional[int] = None, encoding: str = 'ascii'
+                 ) -> Union['pd.DataFrame', Iterator['pd.DataFrame']]:
+    """Read a file of fixed length records written by Fortran into a DataFrame.
+
+    The column positions and types come from the data edit descriptors of
+    :paramref:`layout`, so there is no need to work out column
+    specifications for :func:`pandas.read_fwf`.  The file is memory mapped
+    and each column is converted in a single vectorized operation, see
+    :func:`read_columns`.
+
+    Parameters
+    ----------
+    file
+        Path to or binary file object of the file to read.  Every line must
+        be exactly the width of its record and all lines must end with the
+        same newline, either LF or CRLF.
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, a single
+        Fortran format specification or :class:`Format`, or a sequence of
+        Fortran format specifications or :class:`Format` objects making up a
+        record.  Each record of a statement is read from its own line, into
+        a single row.
+    names
+        Column names, one for each data edit descriptor.  Defaults to
+        integers counting from 0.
+    chunksize
+        Number of rows to read at a time.  If given, an iterator of
+        DataFrames is returned, only one chunk of which is converted at a
+        time, so files larger than memory can be processed.
+    encoding
+        Encoding of character fields.
+
+    Returns
+    -------
+    Union[pandas.DataFrame, Iterator[pandas.DataFrame]]
+        A DataFrame with a column for each data edit descriptor, or an
+        iterator of DataFrames of up to :paramref:`chunksize` rows.  Integer,
+        binary, octal, and hexadecimal fields are read as :code:`int64`,
+        real fields as :code:`float64`, logical fields as :code:`bool`, and
+        character fields as strings.
+
+    Raises
+    ------
+    ValueError
+        If the layout has a field of unknown width, the file is not made up
+        of fixed length records, a value can not be read, or the number of
+        names does not match the number of data edit descriptors.
+
+    """
+    view, formats = _record_view(file, layout)
+    if names is not None and len(names) != len(formats):
+        raise ValueError(
+            '{} names were given for {} columns'.format(
+                len(names), len(formats)))
+    if chunksize is not None:
+        if chunksize < 1:
+            raise ValueError(
+                'chunksize must be at least 1, not {}'.format(chunksize))
+        return _frames(view, formats, names, encoding, chunksize)
+    return _frame(_decode_view(view, formats, encoding), names)
+
+
+def write_fortran(frame: 'pd.DataFrame', file: Union[str, TextIO],
+                  layout: Layout, chunksize: int = 65536,
+                  encoding: str = 'ascii') -> None:
+    """Write a DataFrame as fixed width records.
+
+    The inverse of :func:`read_fortran`.  The index is not written.  Each
+    chunk of rows is formatted column by column with a single printf style
+    operation, see :func:`write_columns`, rather than formatting each cell.
+
+    Parameters
+    ----------
+    frame
+        DataFrame to write, with one column for each data edit descriptor in
+        :paramref:`layout`, in order.
+    file
+        Path to or text file object to write the records to.
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, or a sequence
+        of Fortran format specifications or :class:`Format` objects, one for
+        each column.
+    chunksize
+        Number of rows to format at a time, limiting memory use.
+    encoding
+        Encoding to write :paramref:`file` with if it is a path.
+
+    Raises
+    ------
+    ValueError
+        If the number of columns does not match the number of data edit
+        descriptors, or a character value can not be encoded.
+
+    """
+    if isinstance(file, str):
+        with open(file, 'w', encoding=encoding) as opened:
+            write_fortran(frame, opened, layout, chunksize)
+        return
+    columns = [frame.iloc[:, i].to_numpy() for i in range(frame.shape[1])]
+    write_columns(file, layout, columns, chunksize)
@@ -0,0 +1,196 @@
+"""Conversion cache persisted in an SQLite database shared by processes."""
+
+import os
+import sqlite3
+from threading import Lock
+from typing import List, Optional, Tuple
+
+__all__ = ['PersistentCache']
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS conversions (
+    version TEXT NOT NULL,
+    specifier TEXT NOT NULL,
+    uppercase INTEGER NOT NULL,
+    string TEXT NOT NULL,
+    type TEXT NOT NULL,
+    width INTEGER,
+    digits INTEGER,
+    exponent INTEGER,
+    PRIMARY KEY (version, specifier, uppercase)
+) WITHOUT ROWID
+'''
+
+# specifier, uppercase, Python format string, and the parsed type, width,
+# digits, and exponent digits
+_Row = Tuple[str, bool, str, str, Optional[int], Optional[int], Optional[int]]
+
+
+class PersistentCache:
+    """Conversions stored in an SQLite database.
+
+    The database is in write-ahead logging mode, so any number of processes
+    can read it while one writes, and writers wait on each other.  New
+    conversions are buffered and written a batch at a time.  A batch that
+    can not be written, such as while another process holds the database
+    locked for longer than :paramref:`timeout`, stays buffered and is
+    written with the next batch, since the database is only a cache.
+    Conversions are keyed on the version of the converter that made them,
+    so a new version never sees stale results.
+
+    Parameters
+    ----------
+    path
+        Path to the database, created if it does not exist.
+    version
+        Version of the converter.
+    batchsize
+        Number of new conversions to buffer before writing them.
+    timeout
+        Seconds to wait for other processes writing to the database.
+
+    """
+
+    def __init__(self, path: str, version: str, batchsize: int = 256,
+                 timeout: float = 30.0) -> None:
+        self._path = path
+        self._version = version
+        self._batchsize = batchsize
+        self._timeout = timeout
+        self._lock = Lock()
+        self._pending = []  # type: List[_Row]
+        self._next_flush = batchsize
+        self._pid = os.getpid()
+        self._connection = None  # type: Optional[sqlite3.Connection]
+        self._connect()
+
+    def _check_fork(self) -> None:
+        # connections can not be shared with forked processes, which get
+        # their own on first use, and the parent writes its own conversions
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pending = []
+            self._next_flush = self._batchsize
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        self._check_fork()
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout, check_same_thread=False)
+            try:
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('PRAGMA synchronous=NORMAL')
+                with connection:
+                    connection.execute(_SCHEMA)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    @property
+    def path(self) -> str:
+        """Path to the database."""
+        return self._path
+
+    def load(self, limit: Optional[int] = None) -> List[_Row]:
+        """Get the stored conversions of this version of the converter.
+
+        Parameters
+        ----------
+        limit
+            Maximum number of conversions to get, None for all of them.
+
+        Returns
+        -------
+        List[Tuple[str, bool, str, str, int, int, int]]
+            The specifier, uppercase, Python format string, type, width,
+            digits, and exponent digits of each conversion.
+
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT specifier, uppercase, string, type, width, digits, '
+                'exponent FROM conversions WHERE version = ? LIMIT ?',
+                (self._version, -1 if limit is None else limit)).fetchall()
+        return [(specifier, bool(uppercase), string, type_, width, digits,
+                 exponent)
+                for specifier, uppercase, string, type_, width, digits,
+                exponent in rows]
+
+    def add(self, specifier: str, uppercase: bool, string: str, type_: str,
+            width: Optional[int], digits: Optional[int],
+            exponent: Optional[int]) -> None:
+        """Store a conversion, writing it with the rest of its batch.
+
+        Parameters
+        ----------
+        specifier
+            Fortran format specification.
+        uppercase
+            Whether the conversion used uppercase format.
+        string
+            Python format string.
+        type_
+            Edit descriptor, such as :code:`'EN'`.
+        width
+            Width, None if not given.
+        digits
+            Digits, None if not given.
+        exponent
+            Exponent digits, None if not given.
+
+        """
+        with self._lock:
+            self._check_fork()
+            self._pending.append((specifier, uppercase, string, type_, width,
+                                  digits, exponent))
+            if len(self._pending) >= self._next_flush:
+                self._flush()
+
+    def flush(self) -> bool:
+        """Write all buffered conversions.
+
+        Returns
+        -------
+        bool
+            True if they were written, False if the database could not be
+            written to and they are still buffered.
+
+        """
+        with self._lock:
+            return self._flush()
+
+    def _flush(self) -> bool:
+        self._check_fork()
+        if not self._pending:
+            return True
+        try:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    'INSERT OR IGNORE INTO conversions VALUES '
+                    '(?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(self._version,) + row for row in self._pending])
+        except sqlite3.Error:
+            # try again with the next batch, rather than with every
+            # conversion while the database is unavailable
+            self._next_flush = len(self._pending) + self._batchsize
+            return False
+        self._pending = []
+        self._next_flush = self._batchsize
+        return True
+
+    def close(self) -> None:
+        """Write all buffered conversions and close the database.
+
+        Conversions that can not be written are discarded.
+
+        """
+        with self._lock:
+            self._flush()
+            self._pending = []
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,206 @@
+"""Streaming reader for fixed width records written by Fortran."""
+
+import re
+from functools import partial
+from mmap import mmap
+from operator import itemgetter
+from typing import (Any, Callable, Iterable, Iterator, List, Tuple, Union,
+                    cast)
+
+from ._converter import Format
+from ._layout import Layout, fields, records
+
+__all__ = ['read_records']
+
+_EXPONENT_LETTERS = str.maketrans('DQ', 'EE')
+_MISSING_EXPONENT_LETTER = re.compile(r'(?<=[0-9.])(?=[+-])')
+
+
+def _read_integer(field: str, base: int = 10) -> int:
+    try:
+        return int(field, base)
+    except ValueError:
+        # blanks are ignored and an entirely blank field is zero
+        text = field.replace(' ', '')
+        return int(text, base) if text else 0
+
+
+def _implied_point(text: str, digits: int) -> str:
+    # insert the decimal point implied by the digits of the edit descriptor
+    mantissa, letter, exponent = text.partition('E')
+    sign = mantissa[:1] if mantissa[:1] in {'+', '-'} else ''
+    mantissa = mantissa[len(sign):]
+    if not digits or not mantissa.isdecimal():
+        return text
+    mantissa = mantissa.rjust(digits, '0')
+    return (sign + mantissa[:-digits] + '.' + mantissa[-digits:] +
+            letter + exponent)
+
+
+def _read_real(field: str, digits: int = 0) -> float:
+    if '.' in field:
+        try:
+            return float(field)
+        except ValueError:
+            pass
+    # blanks are ignored, an entirely blank field is zero, the exponent
+    # letter may be D or Q or be left off of a signed exponent, and the
+    # decimal point may be left off
+    text = field.replace(' ', '').upper()
+    if not text:
+        return 0.0
+    text = _MISSING_EXPONENT_LETTER.sub(
+        'E', text.translate(_EXPONENT_LETTERS))
+    if '.' not in text:
+        text = _implied_point(text, digits)
+    return float(text)
+
+
+def _read_logical(field: str) -> bool:
+    text = field.lstrip()
+    if text[:1] == '.':
+        text = text[1:]
+    letter = text[:1].upper()
+    if letter == 'T':
+        return True
+    if letter == 'F':
+        return False
+    raise ValueError("'{}' is not a valid Fortran logical".format(field))
+
+
+def _read_character(field: str) -> str:
+    return field
+
+
+def _reader(format_: Format) -> Callable[[str], Any]:
+    """Get the function to read a field with the given format.
+
+    Parameters
+    ----------
+    format_
+        Data edit descriptor of the field.
+
+    Returns
+    -------
+    Callable[[str], Any]
+        Function to convert the text of a field to an :class:`int`,
+        :class:`float`, :class:`bool`, or :class:`str`.
+
+    """
+    type_ = format_.type.lower()
+    if type_ == 'd':
+        return _read_integer
+    if type_ in {'b', 'o', 'x'}:
+        return partial(_read_integer, base={'b': 2, 'o': 8, 'x': 16}[type_])
+    if type_ in {'f', 'e', 'g'}:
+        return partial(_read_real, digits=format_.precision or 0)
+    if type_ == 's':
+        return _read_character
+    return _read_logical
+
+
+class _RecordReader:
+    """Read the fields of a single record.
+
+    The fields are sliced out of the line with a single :func:`itemgetter`
+    call.
+
+    """
+
+    def __init__(self, record: List[Union[str, Format]]) -> None:
+        record_fields = fields(record)
+        self._readers = [_reader(field.format) for field in record_fields]
+        self._getter = itemgetter(
+            *[slice(field.start, field.stop) for field in record_fields])
+        self._single = len(record_fields) == 1
+
+    def __call__(self, line: str) -> List[Any]:
+        if not self._readers:
+            return []
+        line = line.rstrip('\r\n')
+        values = self._getter(line)
+        if self._single:
+            values = (values,)
+        return [read(value) for read, value in zip(self._readers, values)]
+
+
+def read_records(file: Union[Iterable[str], Iterable[bytes], mmap],
+                 layout: Layout,
+                 encoding: str = 'ascii') -> Iterator[Tuple[Any, ...]]:
+    """Read fixed width records written by Fortran.
+
+    The file is read one line at a time, so it is never entirely loaded into
+    memory.  Fields are read following Fortran's formatted input rules:
+
+        1. Blanks are ignored and an entirely blank numeric field is zero.
+        2. For real fields the decimal point is optional, when it is left
+           off the digits of the edit descriptor give the number of fraction
+           digits.
+        3. The exponent letter may be E, D, or Q or may be left off of a
+           signed exponent.
+        4. Logical fields are true if the first character, after an optional
+           period, is T and false if it is F.
+        5. Lines shorter than the record are padded with blanks.
+
+    Parameters
+    ----------
+    file
+        Text or binary file, any other iterable of lines, or a memory map to
+        read records from.
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, a single
+        Fortran format specification or :class:`Format`, or a sequence of
+        Fortran format specifications or :class:`Format` objects making up a
+        record.  Literal text and positioning are skipped over and each
+        record of a statement is read from its own line.
+    encoding
+        Encoding used to decode binary lines.
+
+    Returns
+    -------
+    Iterator[Tuple[Any, ...]]
+        Lazily yields a tuple of values for each record, or each group of
+        records if the statement has record breaks.  Integer, binary, octal,
+        and hexadecimal fields are read as :class:`int`, real fields as
+        :class:`float`, logical fields as :class:`bool`, and character
+        fields as :class:`str`.
+
+    Raises
+    ------
+    ValueError
+        If the layout is invalid.  While iterating, if a field can not be
+        read or if the file ends in the middle of a group of records.
+
+    """
+    readers = [_RecordReader(record) for record in records(layout)]
+    if isinstance(file, mmap):
+        lines = iter(file.readline, b'')  # type: Iterator[Union[str, bytes]]
+    else:
+        lines = iter(cast(Iterable[Union[str, bytes]], file))
+    return _read_records(lines, readers, encoding)
+
+
+def _read_records(lines: Iterator[Union[str, bytes]],
+                  readers: List[_RecordReader],
+                  encoding: str) -> Iterator[Tuple[Any, ...]]:
+    number = 0
+    while True:
+        row = []  # type: List[Any]
+        for reader in readers:
+            try:
+                line = next(lines)
+            except StopIteration:
+                if reader is readers[0]:
+                    return
+                raise ValueError(
+                    'file ends in the middle of a group of records')
+            number += 1
+            if isinstance(line, bytes):
+                line = line.decode(encoding)
+            try:
+                row.extend(reader(line))
+            except ValueError as err:
+                raise ValueError(
+                    'invalid record on line {}: {}'.format(number, err)
+                ) from err
+        yield tuple(row)
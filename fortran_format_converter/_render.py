@@ -0,0 +1,170 @@
+"""Rendering of real numbers exactly as Fortran formatted output does."""
+
+import math
+from typing import Optional, Tuple
+
+__all__ = ['REAL_DESCRIPTORS', 'render_real']
+
+REAL_DESCRIPTORS = {'F', 'D', 'E', 'EN', 'ES', 'G'}
+
+
+def _special(value: float, width: int) -> Optional[str]:
+    # infinity and NaN are written as text, shortened to fit if possible
+    if math.isnan(value):
+        text = 'NaN'
+    elif math.isinf(value):
+        sign = '-' if value < 0 else ''
+        text = sign + 'Infinity'
+        if len(text) > width:
+            text = sign + 'Inf'
+    else:
+        return None
+    if len(text) > width:
+        return '*' * width
+    return text.rjust(width)
+
+
+def _scientific(magnitude: float, precision: int) -> Tuple[str, int]:
+    # the precision + 1 significant digits and the decimal exponent of a
+    # number written as d.ddd x 10**exponent, correctly rounded
+    mantissa, _, exponent = ('%#.*e' % (precision, magnitude)).partition('e')
+    return mantissa.replace('.', ''), int(exponent)
+
+
+def _exponent_field(exponent: int, exponent_digits: Optional[int],
+                    letter: str) -> Optional[str]:
+    sign = '-' if exponent < 0 else '+'
+    magnitude = abs(exponent)
+    if exponent_digits:
+        if magnitude >= 10 ** exponent_digits:
+            return None
+        return letter + sign + str(magnitude).zfill(exponent_digits)
+    if magnitude <= 99:
+        return letter + sign + str(magnitude).zfill(2)
+    if magnitude <= 999:  # the exponent letter is dropped
+        return sign + str(magnitude)
+    return None
+
+
+def _assemble(width: int, negative: bool, digits: str, integer: int,
+              tail: str) -> str:
+    # right justify [-][0]iii.fff<tail>, where the zero is only written if
+    # there are no integer digits and either there is room for it or there
+    # are no other digits
+    body = digits[:integer] + '.' + digits[integer:] + tail
+    sign = '-' if negative else ''
+    if not integer and (len(sign) + len(body) < width or not digits):
+        body = '0' + body
+    if len(sign) + len(body) > width:
+        return '*' * width
+    return (sign + body).rjust(width)
+
+
+def _exponential(width: int, digits: int, exponent_digits: Optional[int],
+                 letter: str, negative: bool, magnitude: float) -> str:
+    # Ew.d[Ee] and Dw.d, 0.ddd x 10**exponent
+    if not digits:
+        return '*' * width
+    if magnitude:
+        significand, exponent = _scientific(magnitude, digits - 1)
+        exponent += 1
+    else:
+        significand, exponent = '0' * digits, 0
+    tail = _exponent_field(exponent, exponent_digits, letter)
+    if tail is None:
+        return '*' * width
+    return _assemble(width, negative, significand, 0, tail)
+
+
+def _engineering(width: int, digits: int, exponent_digits: Optional[int],
+                 negative: bool, magnitude: float) -> str:
+    # ENw.d[Ee], ddd.ddd x 10**exponent with the exponent a multiple of 3
+    if magnitude:
+        _, exponent = _scientific(magnitude, 16)  # never rounds up
+        group = exponent - exponent % 3
+        significand, exponent = _scientific(
+            magnitude, digits + exponent - group)
+        if exponent - group == 3:  # rounded up into the next group
+            group += 3
+        integer = exponent - group + 1
+        # rounding up adds a digit, which is always a trailing zero
+        significand = significand.ljust(integer + digits, '0')
+        significand = significand[:integer + digits]
+    else:
+        significand, integer, group = '0' * (digits + 1), 1, 0
+    tail = _exponent_field(group, exponent_digits, 'E')
+    if tail is None:
+        return '*' * width
+    return _assemble(width, negative, significand, integer, tail)
+
+
+def _general(width: int, digits: int, exponent_digits: Optional[int],
+             negative: bool, magnitude: float) -> str:
+    # Gw.d[Ee], fixed point followed by blanks in place of the exponent if
+    # the rounded magnitude is in [0.1, 10**d), otherwise Ew.d[Ee]
+    if not digits:
+        return _exponential(width, digits, exponent_digits, 'E', negative,
+                            magnitude)
+    blanks = ' ' * (exponent_digits + 2 if exponent_digits else 4)
+    if not magnitude:
+        return _assemble(width, negative, '0' * (digits - 1), 0, blanks)
+    significand, exponent = _scientific(magnitude, digits - 1)
+    if 0 <= exponent + 1 <= digits:
+        return _assemble(width, negative, significand, exponent + 1, blanks)
+    return _exponential(width, digits, exponent_digits, 'E', negative,
+                        magnitude)
+
+
+def _fixed(width: int, digits: int, negative: bool, magnitude: float) -> str:
+    # Fw.d
+    integer, _, fraction = ('%.*f' % (digits, magnitude)).partition('.')
+    if integer == '0':
+        integer = ''  # the leading zero is optional
+    return _assemble(width, negative, integer + fraction, len(integer), '')
+
+
+def render_real(descriptor: str, width: int, digits: int,
+                exponent_digits: Optional[int], value: float) -> str:
+    """Render a real number as Fortran formatted output would.
+
+    Parameters
+    ----------
+    descriptor
+        Uppercase real edit descriptor, one of :data:`REAL_DESCRIPTORS`.
+    width
+        Width of the field.
+    digits
+        Digits of the edit descriptor.
+    exponent_digits
+        Exponent digits of the edit descriptor, None for the default.
+    value
+        Number to render, converted to :class:`float`.
+
+    Returns
+    -------
+    str
+        Exactly :paramref:`width` characters, all asterisks if the number
+        does not fit.
+
+    """
+    value = float(value)
+    special = _special(value, width)
+    if special is not None:
+        return special
+    negative = math.copysign(1.0, value) < 0
+    magnitude = abs(value)
+    if descriptor == 'F':
+        return _fixed(width, digits, negative, magnitude)
+    if descriptor == 'ES':
+        significand, exponent = _scientific(magnitude, digits)
+        tail = _exponent_field(exponent, exponent_digits, 'E')
+        if tail is None:
+            return '*' * width
+        return _assemble(width, negative, significand, 1, tail)
+    if descriptor == 'EN':
+        return _engineering(width, digits, exponent_digits, negative,
+                            magnitude)
+    if descriptor == 'G':
+        return _general(width, digits, exponent_digits, negative, magnitude)
+    return _exponential(width, digits, exponent_digits, descriptor[0],
+                        negative, magnitude)
@@ -0,0 +1,315 @@
+"""Formatting of single records into reusable buffers."""
+
+import mmap
+from itertools import chain, islice
+from typing import (IO, Any, Iterable, List, Optional, Sequence, Set, Tuple,
+                    Union, cast)
+
+from ._converter import Format
+from ._layout import Layout, records, width
+from ._statement import _template
+
+__all__ = ['RowFormat']
+
+_REAL_TYPES = {'f', 'e', 'g', 'F', 'E', 'G'}
+_INTEGER_TYPES = {'d', 'o', 'x', 'X'}
+# printf style formatting of bytes also matches for integers, but truncates
+# reals where the format string would reject them, so it is only used when
+# the values of integer fields are all of these types
+_INTEGERS = {int, bool}
+
+
+def _printf(record: List[Union[str, Format]],
+            types: Set[str]) -> Optional[str]:
+    # printf style template for a record of only literal text and the given
+    # types, which is faster than the format string and also works for bytes
+    parts = []
+    for item in record:
+        if isinstance(item, str):
+            parts.append(item.replace('%', '%%'))
+        elif item.type in types:
+            parts.append(cast(str, item.printf))
+        else:
+            return None
+    return ''.join(parts)
+
+
+def _values_error(err: Exception) -> ValueError:
+    return ValueError('values do not match the record: {}'.format(err))
+
+
+def _length_error(fields: int, length: int) -> ValueError:
+    return ValueError('a row must have {} values, not {}'.format(
+        fields, length))
+
+
+class RowFormat:
+    """Format rows of values as a single fixed width record.
+
+    The record is compiled once, so formatting a row is a single formatting
+    operation with no string per field.  Rows can be formatted to
+    :class:`str` or :class:`bytes`, or written straight into a reusable text
+    buffer such as :class:`io.StringIO` or a preallocated :class:`bytearray`.
+
+    Parameters
+    ----------
+    layout
+        A Fortran FORMAT statement without record breaks, a single Fortran
+        format specification or :class:`Format`, or a sequence of Fortran
+        format specifications or :class:`Format` objects making up the
+        record.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`layout` is invalid or has more than one record.
+
+    """
+
+    __slots__ = ('_record', '_width', '_string', '_printf', '_bytes',
+                 '_fields', '_integers')
+
+    def __init__(self, layout: Layout) -> None:
+        records_ = records(layout)
+        if len(records_) != 1:
+            raise ValueError('a row must be a single record, not {}'.format(
+                len(records_)))
+        self._record = records_[0]
+        self._width = width(self._record)
+        self._string = _template(self._record)
+        self._printf = _printf(self._record, _REAL_TYPES)
+        self._bytes = None  # type: Optional[bytes]
+        printf = _printf(self._record, _REAL_TYPES | _INTEGER_TYPES)
+        if printf is not None:
+            try:
+                self._bytes = printf.encode('ascii')
+            except UnicodeEncodeError:
+                pass  # encoding the result will fail instead
+        formats = self.formats
+        self._fields = len(formats)
+        self._integers = tuple(i for i, format_ in enumerate(formats)
+                               if format_.type in _INTEGER_TYPES)
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__name__, self._record)
+
+    @property
+    def string(self) -> str:
+        """Python format string for the record."""
+        return self._string
+
+    @property
+    def formats(self) -> List[Format]:
+        """Data edit descriptors, one for each value of a row."""
+        return [item for item in self._record if isinstance(item, Format)]
+
+    @property
+    def width(self) -> Optional[int]:
+        """Number of characters in the record, None if not fixed."""
+        return self._width
+
+    def format(self, values: Sequence[Any]) -> str:
+        """Format a row of values.
+
+        Parameters
+        ----------
+        values
+            One value for each data edit descriptor, see :attr:`formats`.
+
+        Returns
+        -------
+        str
+            The formatted record, without a newline.
+
+        Raises
+        ------
+        ValueError
+            If there is not one value per field or the values can not be
+            formatted by their fields.
+
+        """
+        values = self._row(values)
+        if self._printf is not None:
+            try:
+                return self._printf % values
+            except TypeError as err:
+                raise _values_error(err) from None
+        return self._string.format(*values)
+
+    def format_bytes(self, values: Sequence[Any]) -> bytes:
+        """Format a row of values as ASCII.
+
+        Records of only integer, octal, hexadecimal, and real fields and
+        literal text are formatted directly to bytes, without an intermediate
+        string, as long as the values of integer fields are :class:`int`.
+        Either way the values accepted and the result are the same as
+        :meth:`format`.
+
+        Parameters
+        ----------
+        values
+            One value for each data edit descriptor, see :attr:`formats`.
+
+        Returns
+        -------
+        bytes
+            The formatted record, without a newline.
+
+        Raises
+        ------
+        ValueError
+            If there is not one value per field or the values can not be
+            formatted by their fields.
+        UnicodeEncodeError
+            If the record contains characters that are not ASCII.
+
+        """
+        values = self._row(values)
+        if self._bytes is not None and self._integral(values):
+            try:
+                return self._bytes % values
+            except TypeError as err:
+                raise _values_error(err) from None
+        return self.format(values).encode('ascii')
+
+    def _row(self, values: Sequence[Any]) -> Tuple[Any, ...]:
+        values = tuple(values)
+        if len(values) != self._fields:
+            raise _length_error(self._fields, len(values))
+        return values
+
+    def _integral(self, values: Tuple[Any, ...]) -> bool:
+        # whether the values of every integer field, of any number of rows,
+        # are integers that printf style formatting of bytes does not alter
+        return all(set(map(type, values[i::self._fields])) <= _INTEGERS
+                   for i in self._integers)
+
+    def write(self, buffer: Union[IO[str], bytearray, memoryview],
+              values: Sequence[Any], offset: int = 0) -> int:
+        """Write a row of values into a buffer.
+
+        Parameters
+        ----------
+        buffer
+            Text stream, such as :class:`io.StringIO`, to write the record
+            to at its current position, or a writable bytes buffer, such as
+            :class:`bytearray`, to write the record to as ASCII at
+            :paramref:`offset`.  Bytes buffers are never resized.
+        values
+            One value for each data edit descriptor, see :attr:`formats`.
+        offset
+            Index of a bytes buffer to write the record at.
+
+        Returns
+        -------
+        int
+            Number of characters or bytes written.
+
+        Raises
+        ------
+        ValueError
+            If there is not one value per field, a value does not fit in its
+            field, or the record does not fit in a bytes buffer.
+
+        """
+        if isinstance(buffer, (bytearray, memoryview)):
+            data = self.format_bytes(values)
+            self._check(len(data))
+            if offset < 0 or offset + len(data) > len(buffer):
+                raise ValueError(
+                    'a {} byte record does not fit at offset {} of a {} byte '
+                    'buffer'.format(len(data), offset, len(buffer)))
+            buffer[offset:offset + len(data)] = data
+            return len(data)
+        text = self.format(values)
+        self._check(len(text))
+        return buffer.write(text)
+
+    def _check(self, size: int) -> None:
+        # values too wide for their fields widen the record
+        if self._width is not None and size != self._width:
+            raise ValueError(
+                'values do not fit in the {} character record'.format(
+                    self._width))
+
+    def pack_into(self, buffer: Union[bytearray, memoryview, mmap.mmap],
+                  offset: int,
+                  rows: Iterable[Sequence[Any]], newline: bytes = b'\n',
+                  batchsize: int = 4096) -> int:
+        """Write rows of values as consecutive ASCII records into a buffer.
+
+        Record offsets are known in advance from the fixed width of the
+        record.  A batch of rows is formatted with a single operation,
+        directly to bytes where :meth:`format_bytes` does, and copied into
+        :paramref:`buffer` with a single slice assignment, so it can then be
+        written with :func:`os.write` or be a memory mapped file.
+
+        Parameters
+        ----------
+        buffer
+            Writable bytes buffer, such as :class:`bytearray`,
+            :class:`memoryview`, or :class:`mmap.mmap`, to write the records
+            to.  It is never resized.
+        offset
+            Index of :paramref:`buffer` to write the first record at.
+        rows
+            One value for each data edit descriptor, see :attr:`formats`,
+            for each record.
+        newline
+            Bytes to end each record with.
+        batchsize
+            Number of rows to format at a time.  Each batch is formatted
+            directly to bytes if :meth:`format_bytes` would format all of its
+            rows that way.
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+
+        Raises
+        ------
+        ValueError
+            If the record is not of fixed width, a row does not have one
+            value per field, a value can not be formatted by or does not fit
+            in its field, or the records do not fit in :paramref:`buffer`.
+            Batches before the one that failed have already been written.
+
+        """
+        if self._width is None:
+            raise ValueError('records of unknown width can not be packed')
+        stride = self._width + len(newline)
+        template = None if self._bytes is None else self._bytes + newline
+        text = self._string + newline.decode('ascii')
+        start = offset
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, batchsize))
+            if not batch:
+                return offset - start
+            # checked row by row, since the values of a batch are formatted
+            # all at once
+            lengths = set(map(len, batch))
+            lengths.discard(self._fields)
+            if lengths:
+                raise _length_error(self._fields, min(lengths))
+            values = tuple(chain.from_iterable(batch))
+            try:
+                if template is not None and self._integral(values):
+                    data = template * len(batch) % values
+                else:
+                    data = (text * len(batch)).format(*values).encode('ascii')
+            except TypeError as err:
+                raise _values_error(err) from None
+            size = stride * len(batch)
+            if len(data) != size:
+                raise ValueError(
+                    'values do not fit in the {} character record'.format(
+                        self._width))
+            if offset < 0 or offset + size > len(buffer):
+                raise ValueError(
+                    '{} records of {} bytes do not fit at offset {} of a {} '
+                    'byte buffer'.format(len(batch), stride, offset,
+                                         len(buffer)))
+            buffer[offset:offset + size] = data
+            offset += size
@@ -0,0 +1,294 @@
+"""Fortran FORMAT statement to Python format string conversion."""
+
+from typing import Any, List, NamedTuple, Optional, Union
+
+from ._converter import Format
+
+__all__ = ['FormatStatement']
+
+# a 1-based column, or a number of columns to move if relative
+_Position = NamedTuple('_Position', [('column', int), ('relative', bool)])
+
+
+class _RecordBreak:
+    pass
+
+
+_RECORD_BREAK = _RecordBreak()
+
+_Item = Union[str, Format, _Position, _RecordBreak]
+
+_QUOTES = {"'", '"'}
+_DESCRIPTOR_END = {',', '(', ')', '/', ':', "'", '"'}
+
+
+class _Parser:
+    """Recursive descent parser for Fortran FORMAT statements.
+
+    Blanks are insignificant outside of character literals, as they are in
+    Fortran.  Groups are expanded according to their repeat counts, resulting
+    in a flat list of items.
+
+    """
+
+    def __init__(self, statement: str, uppercase: bool) -> None:
+        self._statement = statement
+        self._uppercase = uppercase
+        self._pos = 0
+
+    def _error(self) -> ValueError:
+        return ValueError(
+            "'{}' is not a valid Fortran format statement, "
+            "error at position {}".format(self._statement, self._pos))
+
+    def _peek(self) -> str:
+        while self._statement[self._pos:self._pos + 1].isspace():
+            self._pos += 1
+        return self._statement[self._pos:self._pos + 1].upper()
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise self._error()
+        self._pos += 1
+
+    def _number(self) -> Optional[int]:
+        digits = ''
+        while self._peek().isdecimal():
+            digits += self._statement[self._pos]
+            self._pos += 1
+        return int(digits) if digits else None
+
+    def parse(self) -> List[_Item]:
+        self._expect('(')
+        items = self._list()
+        self._expect(')')
+        if self._peek():
+            raise self._error()
+        return items
+
+    def _list(self) -> List[_Item]:
+        items = []  # type: List[_Item]
+        while True:
+            char = self._peek()
+            if char in {')', ''}:
+                return items
+            if char == ',':
+                self._pos += 1
+                continue
+            items.extend(self._item())
+
+    def _item(self) -> List[_Item]:
+        char = self._peek()
+        if char in _QUOTES:
+            return [self._literal()]
+        if char == ':':  # no effect when formatting a complete record
+            self._pos += 1
+            return []
+        count = self._number()
+        char = self._peek()
+        if char == '(':
+            self._pos += 1
+            group = self._list()
+            self._expect(')')
+            return group * (1 if count is None else count)
+        if char == '/':
+            self._pos += 1
+            return [_RECORD_BREAK] * (1 if count is None else count)
+        if char == 'H' and count:  # Hollerith constant
+            start = self._pos + 1
+            self._pos = start + count
+            if self._pos > len(self._statement):
+                raise self._error()
+            return [self._statement[start:self._pos]]
+        if char == 'X':
+            self._pos += 1
+            return [_Position(1 if count is None else count, True)]
+        if char == 'T' and count is None:
+            return [self._tab()]
+        return [self._descriptor()] * (1 if count is None else count)
+
+    def _literal(self) -> str:
+        quote = self._statement[self._pos]
+        literal = ''
+        start = self._pos + 1
+        while True:
+            end = self._statement.find(quote, start)
+            if end < 0:
+                raise self._error()
+            literal += self._statement[start:end]
+            self._pos = end + 1
+            if self._statement[self._pos:self._pos + 1] != quote:
+                return literal
+            literal += quote  # doubled quote
+            start = self._pos + 1
+
+    def _tab(self) -> _Position:
+        self._pos += 1
+        direction = self._peek()
+        if direction in {'L', 'R'}:
+            self._pos += 1
+        column = self._number()
+        if column is None:
+            raise self._error()
+        if direction == 'L':
+            return _Position(-column, True)
+        if direction == 'R':
+            return _Position(column, True)
+        return _Position(column, False)
+
+    def _descriptor(self) -> Format:
+        start = self._pos
+        descriptor = ''
+        while self._pos < len(self._statement):
+            char = self._statement[self._pos]
+            if char in _DESCRIPTOR_END:
+                break
+            if not char.isspace():
+                descriptor += char
+            self._pos += 1
+        try:
+            return Format.get(descriptor, self._uppercase)
+        except ValueError as err:
+            self._pos = start
+            raise self._error() from err
+
+
+def _records(items: List[_Item],
+             statement: str) -> List[List[Union[str, Format]]]:
+    # resolve positioning into blank literals and split into records
+    records = [[]]  # type: List[List[Union[str, Format]]]
+    end = 0  # type: Optional[int]
+    offset = 0
+    for item in items:
+        if isinstance(item, _RecordBreak):
+            records.append([])
+            end = 0
+            offset = 0
+            continue
+        if isinstance(item, _Position):
+            if item.relative:
+                offset += item.column
+            elif end is None:
+                raise ValueError(
+                    "cannot tab to column {} after a field of unknown width "
+                    "in '{}'".format(item.column, statement))
+            else:
+                offset = item.column - 1 - end
+            continue
+        if offset < 0:
+            raise ValueError(
+                "cannot move left over previously written characters "
+                "in '{}'".format(statement))
+        if offset > 0:
+            records[-1].append(' ' * offset)
+            if end is not None:
+                end += offset
+            offset = 0
+        records[-1].append(item)
+        if isinstance(item, str):
+            if end is not None:
+                end += len(item)
+        elif item.width is None or end is None:
+            end = None
+        else:
+            end += item.width
+    return records
+
+
+def _template(record: List[Union[str, Format]]) -> str:
+    parts = []
+    for item in record:
+        if isinstance(item, str):
+            parts.append(item.replace('{', '{{').replace('}', '}}'))
+        else:
+            parts.append('{:' + item.string + '}')
+    return ''.join(parts)
+
+
+class FormatStatement:
+    """Convert a Fortran FORMAT statement to Python format strings.
+
+    The statement is compiled once into a single Python format string, with
+    one replacement field per data edit descriptor, so that an entire
+    statement can be written with one call to :meth:`str.format`.
+
+    The following are supported:
+
+        1. Data edit descriptors, see :class:`Format`.
+        2. Repeat counts on data edit descriptors and parenthesized groups,
+           which may be nested.
+        3. Character literals, either quoted or Hollerith (nH).
+        4. Positioning with nX, Tn, TLn, and TRn.  Positions beyond the last
+           character of a record do not extend the record and moving left
+           over characters that have already been written is not supported.
+        5. Record breaks with /, which become newlines.
+        6. The : edit descriptor, which has no effect since all values are
+           always given.
+
+    Parameters
+    ----------
+    statement
+        Fortran FORMAT statement, such as :code:`(2X,3F10.4,I6,'label',A8/)`.
+        The enclosing parentheses are required but the FORMAT keyword and
+        statement label must be omitted.
+    uppercase
+        Set to True to use uppercase format, see :class:`Format`.
+
+    Raises
+    ------
+    ValueError
+        If :paramref:`statement` is not a valid Fortran FORMAT statement or
+        can not be converted.
+
+    """
+
+    def __init__(self, statement: str, uppercase: bool = False) -> None:
+        self._statement = statement
+        self._uppercase = uppercase
+        self._records = _records(
+            _Parser(statement, uppercase).parse(), statement)
+        self._templates = [_template(record) for record in self._records]
+        self._string = '\n'.join(self._templates)
+
+    @property
+    def string(self) -> str:
+        """Python format string for the entire statement.
+
+        Records are separated by newlines.
+        """
+        return self._string
+
+    @property
+    def records(self) -> List[str]:
+        """Python format string for each record."""
+        return list(self._templates)
+
+    @property
+    def items(self) -> List[List[Union[str, Format]]]:
+        """Literal text and data edit descriptors for each record.
+
+        Positioning has already been converted into blank literals.
+        """
+        return [list(record) for record in self._records]
+
+    @property
+    def formats(self) -> List[Format]:
+        """Data edit descriptors, in order and with repeat counts expanded."""
+        return [item for record in self._records for item in record
+                if isinstance(item, Format)]
+
+    def format(self, *values: Any) -> str:
+        """Format values according to the statement.
+
+        Parameters
+        ----------
+        values
+            One value for each data edit descriptor, see :attr:`formats`.
+
+        Returns
+        -------
+        str
+            The formatted records, separated by newlines.
+
+        """
+        return self._string.format(*values)
@@ -0,0 +1,76 @@
+"""Precomputed conversions of the most common Fortran format specifiers."""
+
+from typing import Dict, Iterator, Tuple
+
+__all__ = ['MAX_DIGITS', 'MAX_EXPONENT_DIGITS', 'MAX_WIDTH', 'build_table']
+
+MAX_WIDTH = 99
+MAX_DIGITS = 30
+MAX_EXPONENT_DIGITS = 4
+
+
+def _integers(letter: str, type_: str) -> Iterator[Tuple[str, str]]:
+    # Iw[.m], Bw[.m], Ow[.m], and Zw[.m]
+    for width in range(MAX_WIDTH + 1):
+        string = '{}{}'.format(width, type_)
+        yield '{}{}'.format(letter, width), string
+        for digits in range(MAX_DIGITS + 1):
+            yield ('{}{}.{}'.format(letter, width, digits),
+                   '0' + string if width and digits >= width else string)
+
+
+def _reals(letter: str, type_: str,
+           exponent: bool) -> Iterator[Tuple[str, str]]:
+    # Fw.d and Dw.d, or Ew.d[Ee], ENw.d[Ee], ESw.d[Ee], and Gw.d[Ee]
+    for width in range(MAX_WIDTH + 1):
+        for digits in range(MAX_DIGITS + 1):
+            specifier = '{}{}.{}'.format(letter, width, digits)
+            string = '{}.{}{}'.format(width, digits, type_)
+            yield specifier, string
+            if exponent:
+                for exponent_digits in range(1, MAX_EXPONENT_DIGITS + 1):
+                    yield '{}E{}'.format(specifier, exponent_digits), string
+
+
+def _specifiers(uppercase: bool) -> Iterator[Tuple[str, str]]:
+    def case(type_: str) -> str:
+        return type_ if uppercase else type_.lower()
+
+    yield from _integers('I', 'd')
+    yield from _integers('B', 'b')
+    yield from _integers('O', 'o')
+    yield from _integers('Z', case('X'))
+    yield from _reals('F', case('F'), False)
+    yield from _reals('D', case('F'), False)
+    for letter in ['E', 'EN', 'ES']:
+        yield from _reals(letter, case('E'), True)
+    yield from _reals('G', case('G'), True)
+    for width in range(MAX_WIDTH + 1):
+        yield 'L{}'.format(width), str(width)
+        yield 'A{}'.format(width), '{}s'.format(width)
+    yield 'A', 's'
+
+
+def build_table(uppercase: bool) -> Dict[str, str]:
+    """Build the table of common specifiers and their Python format strings.
+
+    The table covers uppercase specifiers of every type with a width of up
+    to :data:`MAX_WIDTH`, up to :data:`MAX_DIGITS` digits, and up to
+    :data:`MAX_EXPONENT_DIGITS` exponent digits.  The format strings are
+    generated directly rather than by parsing each specifier, and equal
+    format strings are shared.
+
+    Parameters
+    ----------
+    uppercase
+        Set to True to use uppercase format, see :class:`Format`.
+
+    Returns
+    -------
+    Dict[str, str]
+        Python format string for each specifier.
+
+    """
+    strings = {}  # type: Dict[str, str]
+    return {specifier: strings.setdefault(string, string)
+            for specifier, string in _specifiers(uppercase)}
@@ -0,0 +1,119 @@
+"""Matplotlib tick formatting with Fortran format specifications."""
+
+from typing import Any, Callable, List, Optional, Union
+
+from matplotlib.ticker import Formatter
+
+from ._converter import Format
+
+__all__ = ['FortranFormatter']
+
+_INTEGER_TYPES = {'d', 'b', 'o', 'x'}
+_REAL_TYPES = {'f', 'e', 'g'}
+
+
+def _integer(value: Any) -> int:
+    return int(round(float(value)))
+
+
+def _converter(type_: str) -> Optional[Callable[[Any], Any]]:
+    # tick values are floats, even on integer axes, which only some Python
+    # format types accept
+    if type_ in _INTEGER_TYPES:
+        return _integer
+    if type_ == 's':
+        return str
+    return None
+
+
+class FortranFormatter(Formatter):
+    """Format tick labels with a Fortran format specification.
+
+    The specification is compiled once, with equivalent specifications
+    sharing a single :class:`Format` through :meth:`Format.get`, so any
+    number of axes can use the same specification at the cost of one.  All
+    of an axis's ticks are formatted in a single call.
+
+    Tick values are rounded to the nearest integer for integer, binary,
+    octal, and hexadecimal edit descriptors, and converted to strings for
+    character edit descriptors.
+
+    Parameters
+    ----------
+    fortran_format
+        Fortran format specification or :class:`Format` to format tick
+        labels with, such as :code:`'F6.2'`.
+    uppercase
+        Set to True to use uppercase format, see :class:`Format`.
+
+    Raises
+    ------
+    FormatError
+        If :paramref:`fortran_format` is not a valid Fortran format
+        specification.
+
+    Examples
+    --------
+    >>> axes.xaxis.set_major_formatter(FortranFormatter('F6.2'))
+
+    """
+
+    def __init__(self, fortran_format: Union[str, Format],
+                 uppercase: bool = False) -> None:
+        if isinstance(fortran_format, Format):
+            self._format = fortran_format
+        else:
+            self._format = Format.get(fortran_format, uppercase)
+        type_ = self._format.type.lower()
+        self._convert = _converter(type_)
+        self._batch = type_ in _REAL_TYPES
+
+    @property
+    def format(self) -> Format:
+        """Format the tick labels are formatted with."""
+        return self._format
+
+    def __call__(self, x: Any, pos: Any = None) -> str:
+        """Format a single tick value.
+
+        Parameters
+        ----------
+        x
+            Tick value.
+        pos
+            Position of the tick, unused.
+
+        Returns
+        -------
+        str
+            Tick label.
+
+        """
+        if self._convert is not None:
+            x = self._convert(x)
+        return self._format.formatter(x)
+
+    def format_ticks(self, values: List[float]) -> List[str]:
+        """Format all of the tick values of an axis at once.
+
+        Parameters
+        ----------
+        values
+            Tick values.
+
+        Returns
+        -------
+        List[str]
+            Tick labels.
+
+        """
+        self.set_locs(values)
+        if self._batch:
+            # a single printf style operation formats every tick, a newline
+            # never appears in a formatted number
+            if not len(values):
+                return []
+            return self._format.format_many(values, '\n').split('\n')
+        if self._convert is not None:
+            values = list(map(self._convert, values))
+        return list(map(self._format.formatter, values))
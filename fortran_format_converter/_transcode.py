@@ -0,0 +1,152 @@
+"""Parallel transcoding of fixed length record files between layouts."""
+
+import io
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import suppress
+from itertools import islice
+from threading import get_ident
+from typing import BinaryIO, List, Optional, Tuple
+
+from ._array import (_decode_view, _memory_map, _record_dtype, _view_records,
+                     write_columns)
+from ._converter import Format
+from ._layout import Layout, records
+
+__all__ = ['transcode']
+
+
+def _transcode_shard(source: str, input_layout: Layout,
+                     output_layout: Layout, start: int, stop: int,
+                     encoding: str) -> bytes:
+    # module level so that it can be sent to a process pool, only the shard
+    # itself is mapped and converted
+    import numpy as np
+    data = np.memmap(source, dtype=np.uint8, mode='r', offset=start,
+                     shape=(stop - start,))
+    view, formats = _view_records(data, input_layout)
+    file = io.StringIO()
+    write_columns(file, output_layout, _decode_view(view, formats, encoding))
+    return file.getvalue().encode(encoding)
+
+
+def _shards(source: str, input_layout: Layout, output_layout: Layout,
+            shardsize: int) -> Tuple[int, List[Tuple[int, int]]]:
+    # the number of record groups and the byte range of each shard
+    data = _memory_map(source)
+    dtype, formats, _ = _record_dtype(input_layout, data)
+    if data.size % dtype.itemsize:
+        raise ValueError('file is not made up of fixed length records')
+    outputs = sum(isinstance(item, Format)
+                  for record in records(output_layout) for item in record)
+    if outputs != len(formats):
+        raise ValueError(
+            'the output layout has {} data edit descriptors, not {}'.format(
+                outputs, len(formats)))
+    step = shardsize * dtype.itemsize
+    return data.size // dtype.itemsize, [
+        (start, min(start + step, data.size))
+        for start in range(0, data.size, step)]
+
+
+def _write_shards(output: BinaryIO, source: str, input_layout: Layout,
+                  output_layout: Layout, shards: List[Tuple[int, int]],
+                  processes: Optional[int], encoding: str) -> None:
+    if processes is None or processes <= 1 or len(shards) <= 1:
+        for start, stop in shards:
+            output.write(_transcode_shard(
+                source, input_layout, output_layout, start, stop, encoding))
+        return
+    with ProcessPoolExecutor(processes) as executor:
+        remaining = iter(shards)
+
+        def submit(shard: Tuple[int, int]) -> 'Future[bytes]':
+            return executor.submit(
+                _transcode_shard, source, input_layout, output_layout,
+                shard[0], shard[1], encoding)
+
+        # shards are written in order, with enough in flight to keep every
+        # worker busy
+        pending = [submit(shard) for shard in islice(remaining, 2 * processes)]
+        try:
+            while pending:
+                future = pending.pop(0)
+                pending.extend(map(submit, islice(remaining, 1)))
+                output.write(future.result())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def transcode(source: str, destination: str, input_layout: Layout,
+              output_layout: Layout, processes: Optional[int] = None,
+              shardsize: int = 65536, encoding: str = 'ascii') -> int:
+    """Rewrite a file of fixed length records with a different layout.
+
+    The file is split into shards of whole records, which are read with
+    :func:`read_columns` and written with :func:`write_columns`, optionally
+    in a pool of worker processes.  Shards are written in order as they
+    complete, with only a few shards per process in flight at a time, so
+    memory use is bounded by :paramref:`shardsize` no matter the size of the
+    file.  They are written to a temporary file next to
+    :paramref:`destination`, which replaces it once every shard has been
+    written.
+
+    Parameters
+    ----------
+    source
+        Path to the file to read.  Every line must be exactly the width of
+        its record and all lines must end with the same newline, either LF or
+        CRLF.
+    destination
+        Path to the file to write, with LF newlines.  It may be
+        :paramref:`source` itself, to transcode a file in place.
+    input_layout
+        Layout of :paramref:`source`, a :class:`FormatStatement`, a Fortran
+        FORMAT statement, a single Fortran format specification or
+        :class:`Format`, or a sequence of Fortran format specifications or
+        :class:`Format` objects making up a record.
+    output_layout
+        Layout to write, with the same number of data edit descriptors as
+        :paramref:`input_layout`, such as :code:`'(E15.7)'` to rewrite
+        :code:`'(F10.4)'`.
+    processes
+        Number of worker processes to transcode with, or None to transcode
+        in this process.
+    shardsize
+        Number of records, or groups of records if :paramref:`input_layout`
+        has more than one, in each shard.
+    encoding
+        Encoding of both files.
+
+    Returns
+    -------
+    int
+        Number of records, or groups of records, transcoded.
+
+    Raises
+    ------
+    ValueError
+        If either layout is invalid, they do not have the same number of
+        data edit descriptors, the file is not made up of fixed length
+        records, or a value can not be read.  :paramref:`destination` is
+        left as it was if a shard fails.
+
+    """
+    if shardsize < 1:
+        raise ValueError(
+            'shardsize must be at least 1, not {}'.format(shardsize))
+    count, shards = _shards(source, input_layout, output_layout, shardsize)
+    # written next to the destination, so that replacing it is atomic
+    temporary = '{}.{}-{}.tmp'.format(destination, os.getpid(), get_ident())
+    try:
+        with open(temporary, 'xb') as output:
+            _write_shards(output, source, input_layout, output_layout, shards,
+                          processes, encoding)
+        os.replace(temporary, destination)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temporary)
+        raise
+    return count
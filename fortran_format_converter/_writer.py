@@ -0,0 +1,188 @@
+"""Synchronous and asyncio writers of fixed width records."""
+
+import asyncio
+from concurrent.futures import Executor
+from itertools import islice
+from typing import (Any, AsyncIterable, Iterable, Iterator, List, Optional,
+                    Sequence, TextIO, Tuple, Union)
+
+from ._converter import Format
+from ._layout import Layout, records
+from ._statement import _template
+
+__all__ = ['write_records', 'write_records_async']
+
+
+def _record_template(layout: Layout) -> Tuple[str, int]:
+    # a single format string for a group of records, ending in a newline, and
+    # the number of values it takes
+    records_ = records(layout)
+    fields = sum(isinstance(item, Format)
+                 for record in records_ for item in record)
+    return '\n'.join(map(_template, records_)) + '\n', fields
+
+
+def _format_rows(template: str, fields: int,
+                 rows: List[Sequence[Any]]) -> str:
+    # module level so that it can be sent to a process pool
+    lengths = set(map(len, rows))
+    lengths.discard(fields)
+    if lengths:
+        raise ValueError('a row must have {} values, not {}'.format(
+            fields, min(lengths)))
+    format_ = template.format
+    return ''.join([format_(*row) for row in rows])
+
+
+def _batches(rows: Iterable[Sequence[Any]],
+             batchsize: int) -> Iterator[List[Sequence[Any]]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batchsize))
+        if not batch:
+            return
+        yield batch
+
+
+def write_records(file: TextIO, layout: Layout, rows: Iterable[Sequence[Any]],
+                  batchsize: int = 4096) -> int:
+    """Write fixed width records.
+
+    The inverse of :func:`read_records`.  Rows are formatted and written a
+    batch at a time.
+
+    Parameters
+    ----------
+    file
+        Text file to write the records to.
+    layout
+        A :class:`FormatStatement`, a Fortran FORMAT statement, a single
+        Fortran format specification or :class:`Format`, or a sequence of
+        Fortran format specifications or :class:`Format` objects making up a
+        record.
+    rows
+        A sequence of values for each record, or each group of records if the
+        statement has record breaks, with one value per data edit
+        descriptor.
+    batchsize
+        Number of rows to format and write at a time.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If the layout is invalid, a row does not have one value per data edit
+        descriptor, or a value can not be formatted.
+
+    """
+    template, fields = _record_template(layout)
+    count = 0
+    for batch in _batches(rows, batchsize):
+        file.write(_format_rows(template, fields, batch))
+        count += len(batch)
+    return count
+
+
+class _Pipeline:
+    """Format batches in an executor while writing the previous batch.
+
+    At most two batches are held at a time, one being formatted and one
+    being written.
+
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, template: str,
+                 fields: int, executor: Optional[Executor]) -> None:
+        self._writer = writer
+        self._template = template
+        self._fields = fields
+        self._executor = executor
+        self._loop = asyncio.get_event_loop()
+        self._pending = None  # type: Optional[asyncio.Future[str]]
+        self.count = 0
+
+    async def push(self, batch: List[Sequence[Any]]) -> None:
+        pending = self._pending
+        self._pending = self._loop.run_in_executor(
+            self._executor, _format_rows, self._template, self._fields,
+            batch)
+        self.count += len(batch)
+        if pending is not None:
+            try:
+                await self._write(pending)
+            except BaseException:
+                self._pending.cancel()  # its result will never be needed
+                raise
+
+    async def flush(self) -> None:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            await self._write(pending)
+
+    async def _write(self, pending: 'asyncio.Future[str]') -> None:
+        self._writer.write((await pending).encode('ascii'))
+        await self._writer.drain()  # wait for the peer to catch up
+
+
+async def write_records_async(
+        writer: asyncio.StreamWriter, layout: Layout,
+        rows: Union[Iterable[Sequence[Any]], AsyncIterable[Sequence[Any]]],
+        batchsize: int = 4096, executor: Optional[Executor] = None) -> int:
+    """Write fixed width records to an asyncio stream.
+
+    Batches of rows are formatted off of the event loop, in
+    :paramref:`executor`, while the previous batch is written.  Writing
+    waits on :meth:`asyncio.StreamWriter.drain` after each batch, so a slow
+    reader applies backpressure instead of output building up in memory.
+
+    Parameters
+    ----------
+    writer
+        Stream to write the records to, encoded as ASCII.
+    layout
+        Layout of the records, see :func:`write_records`.
+    rows
+        A sequence of values for each record, or each group of records if the
+        statement has record breaks, with one value per data edit
+        descriptor.  May also be an asynchronous iterable.
+    batchsize
+        Number of rows to format and write at a time.
+    executor
+        Thread or process pool to format batches in, defaults to the event
+        loop's default executor.  A process pool avoids contention for the
+        global interpreter lock with the event loop, but should not fork its
+        workers after streams are opened, since they would hold the
+        streams open.  Use the spawn or forkserver start method.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If the layout is invalid, a row does not have one value per data edit
+        descriptor, or a value can not be formatted.
+
+    """
+    template, fields = _record_template(layout)
+    pipeline = _Pipeline(writer, template, fields, executor)
+    if isinstance(rows, AsyncIterable):
+        batch = []  # type: List[Sequence[Any]]
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batchsize:
+                await pipeline.push(batch)
+                batch = []
+        if batch:
+            await pipeline.push(batch)
+    else:
+        for batch in _batches(rows, batchsize):
+            await pipeline.push(batch)
+    await pipeline.flush()
+    return pipeline.count
@@ -29,10 +29,17 @@ setup(
     package_data={
         'fortran_format_converter': ['py.typed']
     },
-    install_requires=[
-        'cached_property',
-        'regex'
-    ],
+    install_requires=[],
+    extras_require={
+        'matplotlib': ['matplotlib'],
+        'numpy': ['numpy'],
+        'pandas': ['pandas']
+    },
+    entry_points={
+        'console_scripts': [
+            'fortran-format-converter = fortran_format_converter._cli:main'
+        ]
+    },
     setup_requires=['pytest-runner'],
     tests_require=[
         'pytest',
@@ -0,0 +1,227 @@
+import io
+
+import pytest  # type: ignore
+from fortran_format_converter import (Format, FormatStatement, format_array,
+                                      format_columns, read_columns,
+                                      read_records, render_array,
+                                      write_columns)
+
+np = pytest.importorskip('numpy')
+
+SPECS = ['I6', 'I6.6', 'B10', 'B8.8', 'O6', 'O6.6', 'Z6', 'Z6.6', 'F10.4',
+         'D12.5', 'E12.4', 'EN12.4E3', 'ES12.4', 'G12.4', 'F4.0']
+
+
+def values(dtype):
+    rng = np.random.RandomState(0)
+    if np.dtype(dtype).kind == 'f':
+        limit = 4 if dtype == 'float16' else 12
+        array = (rng.standard_normal(100) *
+                 10.0**rng.randint(-limit, limit, 100))
+        array[:4] = [np.nan, np.inf, -np.inf, -0.0]
+        return array.astype(dtype)
+    if np.dtype(dtype).kind == 'b':
+        return rng.randint(0, 2, 100).astype(bool)
+    info = np.iinfo(dtype)
+    return rng.randint(max(info.min, -2**31), min(info.max, 2**31),
+                       100).astype(dtype)
+
+
+def scalar(format_, array):
+    return [format(value, Format(format_).string) for value in array]
+
+
+@pytest.mark.parametrize('uppercase', [False, True])
+@pytest.mark.parametrize('spec', SPECS)
+def test_format_array_numeric(spec, uppercase):
+    format_ = Format(spec, uppercase)
+    for dtype in ['int8', 'int64', 'uint16', 'bool', 'float16', 'float32',
+                  'float64']:
+        array = values(dtype)
+        try:
+            expected = [format(value, format_.string) for value in array]
+        except ValueError:
+            continue  # not formattable by the scalar path either
+        assert format_array(format_, array).tolist() == expected
+
+
+def test_format_array_strings():
+    array = np.array(['a', 'abc', 'abcdefgh', ''])
+    for spec in ['A', 'A1', 'A4', 'A10']:
+        assert format_array(spec, array).tolist() == scalar(spec, array)
+
+
+def test_format_array_fallback():
+    array = np.array([True, False])
+    assert format_array('L3', array).tolist() == ['  1', '  0']
+    array = np.array([1, 2.5, 'x'], dtype=object)
+    assert format_array('A3', np.array(['x', 'y'], dtype=object)).tolist() == [
+        'x  ', 'y  ']
+    with pytest.raises(ValueError):
+        format_array('F4.1', array)
+
+
+def test_format_array_shape():
+    array = np.arange(6).reshape(2, 3)
+    assert format_array('I2', array).tolist() == [
+        [' 0', ' 1', ' 2'], [' 3', ' 4', ' 5']]
+    assert format_array('B3', array).shape == (2, 3)
+    assert format_array('I2', []).tolist() == []
+
+
+@pytest.mark.parametrize('spec', [
+    'F10.4', 'F4.0', 'F3.2', 'D12.5', 'E12.4', 'E9.4', 'E12.4E1', 'E12.4E3',
+    'EN12.4', 'EN12.3E3', 'ES12.4', 'ES8.0', 'G12.4', 'G12.4E3', 'G6.1',
+    'E8.0'])
+def test_render_array(spec):
+    format_ = Format(spec)
+    for dtype in ['int64', 'float32', 'float64']:
+        array = values(dtype)
+        expected = [format_.render(value) for value in array.tolist()]
+        assert render_array(format_, array).tolist() == expected
+    array = np.array([0.0, 9.9996, 999.9996, 0.099996, 9999.6, 1e-300,
+                      1e300, 5e-324])
+    expected = [format_.render(value) for value in array.tolist()]
+    assert render_array(format_, array).tolist() == expected
+
+
+def test_render_array_shape():
+    array = np.arange(6.0).reshape(2, 3)
+    assert render_array('ES8.1', array).tolist() == [
+        [' 0.0E+00', ' 1.0E+00', ' 2.0E+00'],
+        [' 3.0E+00', ' 4.0E+00', ' 5.0E+00']]
+    assert render_array('E10.3', []).tolist() == []
+    assert render_array('I3', [1, 2]).tolist() == ['  1', '  2']
+
+
+def test_format_columns():
+    ints = np.arange(3)
+    floats = np.linspace(0, 1, 3)
+    strings = np.array(['a', 'bb', 'ccc'])
+    records = format_columns(['I3', Format('F6.2'), 'A4'],
+                             [ints, floats, strings])
+    assert records.tolist() == [
+        '{:3d}{:6.2f}{:4s}'.format(*row)
+        for row in zip(ints, floats, strings)]
+
+
+def test_format_columns_statement():
+    statement = FormatStatement("(2X, I3, ' x', F6.2 / 'y ', Z4)")
+    columns = [np.arange(3), np.linspace(0, 1, 3), np.arange(3) * 1000]
+    assert format_columns(statement, columns).tolist() == [
+        statement.format(*row) for row in zip(*columns)]
+
+
+def test_format_columns_invalid():
+    with pytest.raises(ValueError):
+        format_columns(['I3', 'I3'], [np.arange(3)])
+    with pytest.raises(ValueError):
+        format_columns(['I3', 'I3'], [np.arange(3), np.arange(4)])
+    with pytest.raises(ValueError):
+        format_columns(['I3'], [np.arange(4).reshape(2, 2)])
+
+
+def test_write_columns():
+    columns = [np.arange(10), np.linspace(0, 1, 10)]
+    file = io.StringIO()
+    write_columns(file, ['I3', 'E10.3'], columns, chunksize=3)
+    assert file.getvalue() == ''.join(
+        '{:3d}{:10.3e}\n'.format(*row) for row in zip(*columns))
+    file = io.StringIO()
+    write_columns(file, ['I3'], [[]])
+    assert file.getvalue() == ''
+
+
+def test_write_columns_invalid():
+    for columns in [[np.arange(10), np.arange(12)],
+                    [np.arange(10), np.arange(7)]]:
+        file = io.StringIO()
+        with pytest.raises(ValueError):
+            write_columns(file, ['I3', 'I3'], columns, chunksize=5)
+        assert file.getvalue() == ''
+    with pytest.raises(ValueError):
+        write_columns(io.StringIO(), ["'text'"], [np.arange(3)])
+
+
+def check_read_columns(path, layout, expected_dtypes):
+    with open(str(path)) as file:
+        rows = list(read_records(file, layout))
+    columns = read_columns(str(path), layout)
+    assert [column.dtype for column in columns] == [
+        np.dtype(dtype) for dtype in expected_dtypes]
+    assert [tuple(row) for row in zip(*[column.tolist()
+                                        for column in columns])] == rows
+    return columns
+
+
+def test_read_columns(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(
+        b'    12    3.1416abc     T  ff\n'
+        b'   -45   -2.5000  xyz   F  10\n'
+        b'         1.5D+02       .T   1\n')
+    columns = check_read_columns(
+        path, '(I6, F10.4, A6, L3, Z4)',
+        ['int64', 'float64', '<U6', 'bool', 'int64'])
+    assert columns[0].tolist() == [12, -45, 0]
+    assert columns[1].tolist() == [3.1416, -2.5, 150.0]
+    assert columns[3].tolist() == [True, False, True]
+
+
+def test_read_columns_fallback(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(b' 1 2 1234 1.5-2\n 3 4  -12   inf\n')
+    columns = check_read_columns(path, '(I4, F5.2, F6.1)',
+                                 ['int64', 'float64', 'float64'])
+    assert columns[0].tolist() == [12, 34]
+    assert columns[1].tolist() == [12.34, -0.12]
+    assert columns[2].tolist() == [0.015, float('inf')]
+
+
+def test_read_columns_crlf(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(b'x=  12 1.5\r\nx=  34 2.5\r\n')
+    with open(str(path), 'rb') as file:
+        columns = read_columns(file, "('x=', I4, F4.1)")
+    assert [column.tolist() for column in columns] == [[12, 34], [1.5, 2.5]]
+
+
+def test_read_columns_multiple_records(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(b'  12\n 1.5\n  34\n 2.5\n')
+    columns = read_columns(str(path), '(I4 / F4.1)')
+    assert [column.tolist() for column in columns] == [[12, 34], [1.5, 2.5]]
+
+
+def test_read_columns_empty(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(b'')
+    columns = read_columns(str(path), ['I4', 'A3'])
+    assert [len(column) for column in columns] == [0, 0]
+
+
+def test_read_columns_invalid(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(b'  12\n 345\n')
+    with pytest.raises(ValueError):
+        read_columns(str(path), 'I3')
+    with pytest.raises(ValueError):
+        read_columns(str(path), 'I5')
+    with pytest.raises(ValueError):
+        read_columns(str(path), '(I2, A)')
+    path.write_binary(b'  12\n  ab\n')
+    with pytest.raises(ValueError):
+        read_columns(str(path), 'I4')
+    path.write_binary(b'  T\n  X\n')
+    with pytest.raises(ValueError):
+        read_columns(str(path), 'L3')
+
+
+def test_write_and_read_columns(tmpdir):
+    path = tmpdir.join('records.txt')
+    columns = [np.arange(-500, 500), np.linspace(-1, 1, 1000)]
+    with open(str(path), 'w') as file:
+        write_columns(file, ['I6', 'E14.6'], columns)
+    result = read_columns(str(path), ['I6', 'E14.6'])
+    assert np.array_equal(result[0], columns[0])
+    assert np.allclose(result[1], columns[1], rtol=1e-6)
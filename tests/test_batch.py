@@ -0,0 +1,50 @@
+import pytest  # type: ignore
+from fortran_format_converter import convert, convert_many, validate_many
+
+
+def test_convert_many():
+    specs = ['F10.4', 'I5', 'F10.4', 'z8']
+    assert convert_many(specs) == ['10.4f', '5d', '10.4f', '8x']
+    assert convert_many(iter(specs), uppercase=True) == [
+        '10.4F', '5d', '10.4F', '8X']
+    assert convert_many([]) == []
+
+
+def test_convert_many_raise():
+    with pytest.raises(ValueError) as excinfo:
+        convert_many(['F10.4', 'J4', 'K4'])
+    assert str(excinfo.value) == "'J4' is not a valid Fortran format specifier"
+
+
+def test_convert_many_skip():
+    assert convert_many(['F10.4', 'J4', 'I5', 'J4'], errors='skip') == [
+        '10.4f', '5d']
+
+
+def test_convert_many_collect():
+    results = convert_many(['F10.4', 'J4', 'I5', 'J4'], errors='collect')
+    assert results[0] == '10.4f'
+    assert isinstance(results[1], ValueError)
+    assert results[2] == '5d'
+    assert results[3] is results[1]
+
+
+def test_convert_many_invalid_errors():
+    with pytest.raises(ValueError):
+        convert_many(['F10.4'], errors='ignore')
+
+
+def test_convert_many_processes():
+    specs = ['I{}'.format(w) for w in range(1, 100)] * 3 + ['J4']
+    results = convert_many(specs, errors='collect', processes=2,
+                           chunksize=10)
+    assert results[:-1] == [convert(spec) for spec in specs[:-1]]
+    assert isinstance(results[-1], ValueError)
+
+
+def test_validate_many():
+    specs = ['F10.4', 'J4', 'F10.4', 'z8', '']
+    assert validate_many(specs) == [True, False, True, True, False]
+    assert validate_many(iter(specs)) == [True, False, True, True, False]
+    assert validate_many(
+        ['I4', None, [1]]) == [True, False, False]  # type: ignore
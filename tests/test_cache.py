@@ -0,0 +1,71 @@
+import pytest  # type: ignore
+from fortran_format_converter import CacheInfo, LRUCache
+
+
+def test_get_and_put():
+    cache = LRUCache(maxsize=2)  # type: LRUCache[int]
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert 'a' in cache
+    assert len(cache) == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, evictions=0,
+                                     maxsize=2, currsize=1)
+
+
+def test_least_recently_used_is_evicted():
+    cache = LRUCache(maxsize=2)  # type: LRUCache[int]
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.info().evictions == 1
+
+
+def test_unbounded():
+    cache = LRUCache(maxsize=None)  # type: LRUCache[int]
+    for i in range(10000):
+        cache.put(i, i)
+    assert len(cache) == 10000
+    assert cache.info().evictions == 0
+
+
+def test_disabled():
+    cache = LRUCache(maxsize=0)  # type: LRUCache[int]
+    cache.put('a', 1)
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_resize():
+    cache = LRUCache(maxsize=4)  # type: LRUCache[int]
+    for i in range(4):
+        cache.put(i, i)
+    cache.maxsize = 2
+    assert cache.maxsize == 2
+    assert 0 not in cache
+    assert 1 not in cache
+    assert 2 in cache
+    assert 3 in cache
+    assert cache.info().evictions == 2
+    with pytest.raises(ValueError):
+        cache.maxsize = -1
+
+
+def test_clear():
+    cache = LRUCache()  # type: LRUCache[int]
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('b')
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0,
+                                     maxsize=1024, currsize=0)
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
@@ -0,0 +1,111 @@
+import io
+import subprocess
+import sys
+
+import pytest  # type: ignore
+from fortran_format_converter._cli import main
+
+INPUT = 'F10.4\ni5\nJ4\n\n(2X,F6.2/I3)\nA\n'
+
+
+def run(monkeypatch, capsys, argv, text=INPUT):
+    monkeypatch.setattr('sys.stdin', io.StringIO(text))
+    status = main(argv)
+    out, err = capsys.readouterr()
+    return status, out, err
+
+
+def test_raise(monkeypatch, capsys):
+    status, out, err = run(monkeypatch, capsys, [])
+    assert status == 1
+    assert out == '10.4f\n5d\n'
+    assert err == ("fortran-format-converter: <stdin>:3: 'J4' is not a "
+                   "valid Fortran format specifier\n")
+
+
+def test_skip(monkeypatch, capsys):
+    status, out, err = run(monkeypatch, capsys, ['--errors', 'skip'])
+    assert status == 0
+    assert out == '10.4f\n5d\n\n  {:6.2f}\\n{:3d}\ns\n'
+    assert err == ''
+
+
+def test_mark(monkeypatch, capsys):
+    status, out, _ = run(monkeypatch, capsys, ['-e', 'mark', '-u'])
+    assert status == 0
+    assert out.splitlines() == [
+        '10.4F', '5d', "error: 'J4' is not a valid Fortran format specifier",
+        '', '  {:6.2F}\\n{:3d}', 's']
+
+
+def test_files(monkeypatch, capsys, tmpdir):
+    first = tmpdir.join('first.txt')
+    first.write('I3\nE12.4\n')
+    second = tmpdir.join('second.txt')
+    second.write('L2\nX4\n')
+    status, out, err = run(monkeypatch, capsys,
+                           [str(first), '-', str(second)], text='Z4\n')
+    assert status == 1
+    assert out == '3d\n12.4e\n4x\n2\n'
+    assert err.startswith('fortran-format-converter: {}:2: '.format(second))
+
+
+def test_missing_file(monkeypatch, capsys, tmpdir):
+    missing = str(tmpdir.join('missing.txt'))
+    with pytest.raises(SystemExit) as info:
+        run(monkeypatch, capsys, ['-', missing], text='I3\n')
+    assert info.value.code == 2
+    out, err = capsys.readouterr()
+    assert out == '3d\n'
+    assert "can't read '{}': No such file".format(missing) in err
+
+
+def test_invalid_encoding(monkeypatch, capsys, tmpdir):
+    path = tmpdir.join('latin1.txt')
+    path.write_binary(b'I3\n\xe9\n')
+    with pytest.raises(SystemExit) as info:
+        run(monkeypatch, capsys, [str(path)])
+    assert info.value.code == 2
+    assert 'invalid input' in capsys.readouterr()[1]
+
+
+@pytest.mark.parametrize('chunksize', ['1', '2', '4096'])
+def test_jobs(monkeypatch, capsys, chunksize):
+    specs = ['I{}'.format(i) for i in range(1, 50)] + ['J4'] + ['F5.2'] * 10
+    text = '\n'.join(specs) + '\n'
+    status, out, _ = run(monkeypatch, capsys,
+                         ['-j', '2', '--chunksize', chunksize, '-e', 'mark'],
+                         text=text)
+    assert status == 0
+    lines = out.splitlines()
+    assert lines[:49] == ['{}d'.format(i) for i in range(1, 50)]
+    assert lines[49].startswith('error: ')
+    assert lines[50:] == ['5.2f'] * 10
+    status, out, _ = run(monkeypatch, capsys,
+                         ['-j', '2', '--chunksize', chunksize], text=text)
+    assert status == 1
+    assert out.splitlines() == lines[:49]
+
+
+def test_invalid_arguments(monkeypatch, capsys):
+    for argv in [['-j', '0'], ['--chunksize', '0'], ['-e', 'ignore']]:
+        with pytest.raises(SystemExit):
+            run(monkeypatch, capsys, argv)
+
+
+def test_module():
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'fortran_format_converter'],
+        input=b'F6.2\n')
+    assert output == b'6.2f\n'
+
+
+def test_closed_output():
+    # like piping into head, which exits after reading the first lines
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'fortran_format_converter'],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    process.stdout.close()  # type: ignore
+    _, err = process.communicate(b'F10.4\n' * 100000)
+    assert err == b''
+    assert process.returncode == 1
@@ -1,5 +1,12 @@
+import pickle
+from typing import Any, Dict, List, cast
+
 import pytest  # type: ignore
-from fortran_format_converter import convert
+from fortran_format_converter import (Format, FormatError, convert,
+                                      convert_cache, format_cache,
+                                      instrumentation_snapshot, is_valid,
+                                      use_instrumentation, use_lookup_table)
+from fortran_format_converter._table import build_table
 
 
 def test_integer_format():
@@ -381,3 +388,400 @@ def test_general_format_uppercase():
 def test_invalid_type():
     with pytest.raises(ValueError):
         convert('Y')
+
+
+def test_convert_cache():
+    convert_cache.clear()
+    assert convert('F10.4') == '10.4f'
+    assert convert('F10.4') == '10.4f'
+    assert convert('F10.4', uppercase=True) == '10.4F'
+    info = convert_cache.info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+    with pytest.raises(ValueError):
+        convert('J4')
+    with pytest.raises(ValueError):
+        convert('J4')
+    assert convert_cache.info().currsize == 2
+    with pytest.raises(ValueError):
+        convert(['I4'])  # type: ignore
+    convert_cache.clear()
+
+
+def test_convert_cache_eviction():
+    convert_cache.clear()
+    maxsize = convert_cache.maxsize
+    try:
+        convert_cache.maxsize = 2
+        convert('I1')
+        convert('I2')
+        convert('I3')
+        assert convert_cache.info().evictions == 1
+        assert ('I1', False) not in convert_cache
+        convert_cache.maxsize = 0
+        assert convert('I4') == '4d'
+        assert len(convert_cache) == 0
+    finally:
+        convert_cache.maxsize = maxsize
+        convert_cache.clear()
+
+
+def test_lowercase():
+    assert convert('f10.4') == '10.4f'
+    assert convert('en12.3e2') == '12.3e'
+    assert convert('z8.8', uppercase=True) == '08X'
+    assert convert('a') == 's'
+
+
+def test_unicode_digits():
+    assert convert('F１０.４') == '10.4f'
+    assert convert('I٣') == '3d'
+
+
+def test_trailing_newline():
+    assert convert('F10.4\n') == '10.4f'
+    with pytest.raises(ValueError):
+        convert('F10.4\n\n')
+    with pytest.raises(ValueError):
+        convert('F10.4 ')
+
+
+def test_error_message():
+    with pytest.raises(ValueError) as excinfo:
+        convert('J4')
+    assert str(excinfo.value) == "'J4' is not a valid Fortran format specifier"
+    with pytest.raises(ValueError) as excinfo:
+        convert('')
+    assert str(excinfo.value) == "'' is not a valid Fortran format specifier"
+    with pytest.raises(ValueError) as excinfo:
+        convert(None)  # type: ignore
+    assert (str(excinfo.value) ==
+            "'None' is not a valid Fortran format specifier")
+
+
+def test_format_error():
+    with pytest.raises(FormatError) as excinfo:
+        convert('E10.4E')
+    assert excinfo.value.specifier == 'E10.4E'
+    assert excinfo.value.position == 6
+    assert excinfo.value.expected == 'exponent digits'
+    errors = {
+        '': (0, 'edit descriptor'),
+        'J4': (0, 'edit descriptor'),
+        'I': (1, 'width'),
+        'I4.': (3, 'digits'),
+        'I4x': (2, "'.' or end of specifier"),
+        'F10': (3, "'.'"),
+        'f10.4 ': (5, 'end of specifier'),
+        'EN10.4X': (6, 'exponent letter or end of specifier'),
+        'G10.4E2.': (7, 'end of specifier'),
+        'L4.1': (2, 'end of specifier'),
+        'A.': (1, 'width or end of specifier'),
+        'A4\n\n': (2, 'end of specifier')
+    }
+    for specifier, (position, expected) in errors.items():
+        with pytest.raises(FormatError) as excinfo:
+            convert(specifier)
+        assert (excinfo.value.position, excinfo.value.expected) == (
+            position, expected), specifier
+    with pytest.raises(FormatError) as excinfo:
+        convert(None)  # type: ignore
+    assert (excinfo.value.position, excinfo.value.expected) == (0, 'string')
+    error = pickle.loads(pickle.dumps(FormatError('I4.')))
+    assert str(error) == "'I4.' is not a valid Fortran format specifier"
+    assert error.position == 3
+
+
+def test_is_valid():
+    assert is_valid('I4')
+    assert is_valid('es10.4e3')
+    assert is_valid('A\n')
+    assert not is_valid('J4')
+    assert not is_valid('F10')
+    assert not is_valid('')
+    assert not is_valid(None)  # type: ignore
+
+
+def test_format_fields():
+    format_ = Format('Z8.8', uppercase=True)
+    assert format_.string == '08X'
+    assert format_.type == 'X'
+    assert format_.width == 8
+    assert format_.fill == '0'
+    assert format_.align == '>'
+    assert format_.sign == ''
+    assert format_.precision is None
+    assert format_.descriptor == 'Z'
+    assert format_.digits == 8
+    assert format_.exponent_digits is None
+    assert format_.printf == '%08X'
+    format_ = Format('e12.4e3')
+    assert format_.string == '12.4e'
+    assert format_.sign == '-'
+    assert format_.precision == 4
+    assert format_.descriptor == 'E'
+    assert format_.digits == 4
+    assert format_.exponent_digits == 3
+    assert format_.printf == '%12.4e'
+    assert Format('L2').printf is None
+    format_ = Format('B8')
+    assert format_.descriptor == 'B'
+    assert format_.width == 8
+    assert format_.printf is None
+    assert Format('A').printf == '%-s'
+
+
+def test_format_from_parts():
+    for spec in ['EN12.4E3', 'z8.8', 'A', 'L2']:
+        format_ = Format(spec, uppercase=True)
+        parts = Format.from_parts(spec, format_.descriptor, format_.width,
+                                  format_.digits, format_.exponent_digits,
+                                  uppercase=True)
+        assert parts == format_
+        assert repr(parts) == repr(format_)
+        assert parts.string == format_.string
+
+
+def test_format_immutable():
+    format_ = Format('F10.4')
+    with pytest.raises(AttributeError):
+        format_.string = '10.4f'  # type: ignore
+    with pytest.raises(AttributeError):
+        format_.other = 1  # type: ignore
+    assert not hasattr(format_, '__dict__')
+
+
+def test_format_equality():
+    assert Format('F10.4') == Format('f10.4')
+    assert Format('F10.4') != Format('F10.4', uppercase=True)
+    assert Format('F10.4') != Format('F10.3')
+    assert Format('F10.4') != Format('D10.4')
+    assert Format('F10.4') != 'F10.4'
+    assert len({Format('I5'), Format('i5'), Format('I6')}) == 2
+    assert {Format('I5'): 1}[Format('i5')] == 1
+
+
+def test_format_repr():
+    assert repr(Format('f10.4')) == "Format('f10.4', uppercase=False)"
+
+
+def test_format_pickle():
+    format_ = Format('EN12.4E3', uppercase=True)
+    result = pickle.loads(pickle.dumps(format_))
+    assert result == format_
+    assert result.string == format_.string
+
+
+def test_format_get():
+    format_cache.clear()
+    format_ = Format.get('F10.4')
+    assert format_ == Format('F10.4')
+    assert Format.get('F10.4') is format_
+    assert Format.get('f10.4') is format_
+    assert Format.get('D10.4') is not format_  # renders differently
+    assert Format.get('d10.4') is Format.get('D10.4')
+    assert Format.get('F10.4', uppercase=True) is not format_
+    assert Format.get('F10.4', uppercase=True).string == '10.4F'
+    assert Format.get('I5') is not format_
+    info = format_cache.info()
+    assert info.hits == 5
+    assert info.misses == 4
+    format_cache.clear()
+
+
+def test_format_get_subclass():
+    class SubFormat(Format):
+        __slots__ = ()
+
+    assert type(SubFormat.get('I5')) is SubFormat
+    assert type(Format.get('I5')) is Format
+    format_cache.clear()
+
+
+def test_format_get_invalid():
+    with pytest.raises(ValueError) as excinfo:
+        Format.get('j4')
+    assert str(excinfo.value) == "'j4' is not a valid Fortran format specifier"
+    with pytest.raises(ValueError):
+        Format.get(None)  # type: ignore
+
+
+def test_formatter():
+    values = cast(Dict[str, List[Any]], {
+        'I5': [0, 42, -42, True, 123456],
+        'I6.6': [7, -7],
+        'B8': [5],
+        'O4': [8],
+        'Z4': [255],
+        'F10.4': [0, 1, -1.5, 3.14159265, 1e20, float('inf'),
+                  float('nan')],
+        'D10.4': [2.5],
+        'E12.4': [0.0, -123.456, 1e-300],
+        'ES12.4E3': [6.02e23],
+        'G12.4': [0.001, 12345678.0],
+        'L2': [True, False],
+        'A8': ['abc', 'abcdefghij'],
+        'A': ['text']
+    })
+    for uppercase in [False, True]:
+        for fortran_format, cases in values.items():
+            format_ = Format(fortran_format, uppercase)
+            formatter = format_.formatter
+            assert format_.formatter is formatter
+            for value in cases:
+                assert formatter(value) == format(value, format_.string)
+
+
+def test_formatter_type_error():
+    with pytest.raises(ValueError):
+        Format('I5').formatter(1.5)
+    for value in ['abc', (1.5,), None]:
+        with pytest.raises(ValueError):
+            Format('F10.4').formatter(value)
+    with pytest.raises(ValueError):
+        Format('F10.4').format_many([1.0, 'abc'])
+
+
+def test_format_many():
+    values = [1.5, -2.25, 1e10]
+    format_ = Format('E12.4')
+    expected = ''.join(format(value, format_.string) for value in values)
+    assert format_.format_many(values) == expected
+    assert format_.format_many(iter(values)) == expected
+    assert format_.format_many(values, sep='%,') == '%,'.join(
+        format(value, format_.string) for value in values)
+    assert Format('I3').format_many(range(3), sep='\n') == '  0\n  1\n  2'
+    assert Format('A3').format_many(['a', 'bc']) == 'a  bc '
+    assert Format('F5.1').format_many([]) == ''
+
+
+def test_render():
+    cases = [
+        ('E12.4', 123.456, '  0.1235E+03'),
+        ('E12.4', -0.000123456, ' -0.1235E-03'),
+        ('E10.4', -123.456, '-.1235E+03'),
+        ('E9.4', -123.456, '*********'),
+        ('E12.4', 1e150, '  0.1000+151'),
+        ('E12.4E3', 1e150, ' 0.1000E+151'),
+        ('E12.4E1', 1e15, '************'),
+        ('E12.4', -0.0, ' -0.0000E+00'),
+        ('D12.4', 123.456, '  0.1235D+03'),
+        ('ES12.4', 123.456, '  1.2346E+02'),
+        ('ES12.4', 0.0, '  0.0000E+00'),
+        ('EN12.4', 123456, '123.4560E+03'),
+        ('EN12.3', 9.9996, '  10.000E+00'),
+        ('EN12.3', 999.9996, '   1.000E+03'),
+        ('EN12.3', 0.00012, ' 120.000E-06'),
+        ('EN12.3', 0.0, '   0.000E+00'),
+        ('G12.4', 123.456, '   123.5    '),
+        ('G12.4', 0.0, '   0.000    '),
+        ('G12.4', 0.09999, '  0.9999E-01'),
+        ('G12.4', 0.099996, '  0.1000    '),
+        ('G12.4', 9999.4, '   9999.    '),
+        ('G12.4', 9999.6, '  0.1000E+05'),
+        ('G12.4E3', 1.0, '  1.000     '),
+        ('G5.1', 0.0, '*****'),
+        ('F8.3', -0.5, '  -0.500'),
+        ('F5.3', -0.5, '-.500'),
+        ('F4.3', -0.5, '****'),
+        ('F5.0', 3.0, '   3.'),
+        ('F2.0', 0.0, '0.'),
+        ('F8.3', float('inf'), 'Infinity'),
+        ('F8.3', float('-inf'), '    -Inf'),
+        ('F3.1', float('nan'), 'NaN'),
+        ('F2.1', float('nan'), '**')
+    ]
+    for fortran_format, value, expected in cases:
+        for uppercase in [False, True]:
+            assert Format(fortran_format, uppercase).render(value) == expected
+
+
+def test_render_other():
+    assert Format('I5').render(42) == '   42'
+    assert Format('A4').render('ab') == 'ab  '
+
+
+def test_lookup_table():
+    specs = ['I5', 'i5', 'I6.6', 'Z8.8', 'F10.4', 'd10.4', 'E12.4E3',
+             'EN12.4', 'Es12.4E1', 'G12.4', 'L2', 'A', 'A8', 'I100',
+             'F10.31', 'E12.4E5', 'F10.4\n']
+    expected = {(spec, uppercase): convert(spec, uppercase)
+                for spec in specs for uppercase in [False, True]}
+    use_lookup_table()
+    try:
+        convert_cache.clear()
+        for (spec, uppercase), string in expected.items():
+            assert convert(spec, uppercase) == string
+        # only specifications outside of the table were cached
+        assert convert_cache.info().currsize == 8
+        with pytest.raises(ValueError):
+            convert('J4')
+    finally:
+        use_lookup_table(False)
+        convert_cache.clear()
+
+
+def test_instrumentation():
+    events = []
+    use_instrumentation(hook=lambda *event: events.append(event))
+    try:
+        convert_cache.clear()
+        format_cache.clear()
+        for spec in ['I5', 'I5', 'es12.4', 'F10.4', 'A']:
+            convert(spec)
+        Format.get('I5')
+        Format.get('I5')
+        with pytest.raises(ValueError):
+            convert('J4')
+        snapshot = instrumentation_snapshot()
+        assert snapshot['enabled']
+        assert snapshot['specifiers'] == {
+            'I5': 4, 'es12.4': 1, 'F10.4': 1, 'A': 1}
+        assert snapshot['descriptors'] == {
+            'I': 4, 'B': 0, 'O': 0, 'Z': 0, 'F': 1, 'D': 0, 'E': 0, 'EN': 0,
+            'ES': 1, 'L': 0, 'A': 1, 'G': 0}
+        assert snapshot['invalid'] == 1
+        assert snapshot['parse_time'] > 0
+        assert snapshot['assembly_time'] > 0
+        assert snapshot['convert_cache']['hits'] == 1
+        assert snapshot['convert_cache']['misses'] == 5
+        assert snapshot['convert_cache']['hit_rate'] == 1 / 6
+        assert snapshot['format_cache']['hit_rate'] == 0.5
+        assert [event[:2] for event in events] == [
+            ('I5', 'I'), ('es12.4', 'ES'), ('F10.4', 'F'), ('A', 'A'),
+            ('I5', 'I'), ('J4', None)]
+        assert all(event[2] > 0 and event[3] >= 0 for event in events)
+        use_instrumentation()  # resets
+        assert sum(instrumentation_snapshot()['descriptors'].values()) == 0
+        # cached conversions are counted too
+        events.clear()
+        use_lookup_table()
+        convert('I5')
+        convert('e12.4e3')
+        Format.get('I5')
+        snapshot = instrumentation_snapshot()
+        assert snapshot['specifiers'] == {'I5': 2, 'e12.4e3': 1}
+        assert snapshot['descriptors']['I'] == 2
+        assert snapshot['descriptors']['E'] == 1
+        assert snapshot['parse_time'] == 0
+        assert events == []
+    finally:
+        use_lookup_table(False)
+        use_instrumentation(False)
+    Format('I5')
+    snapshot = instrumentation_snapshot()
+    assert not snapshot['enabled']
+    assert sum(snapshot['descriptors'].values()) == 0
+    assert snapshot['parse_time'] == 0
+    convert_cache.clear()
+    format_cache.clear()
+    assert instrumentation_snapshot()['convert_cache']['hit_rate'] is None
+
+
+def test_build_table():
+    for uppercase in [False, True]:
+        table = build_table(uppercase)
+        assert len(table) > 80000
+        for spec, string in list(table.items())[::97]:
+            assert Format(spec, uppercase).string == string
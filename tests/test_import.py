@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import fortran_format_converter
+import pytest  # type: ignore
+
+
+def imported_modules(code):
+    output = subprocess.check_output(
+        [sys.executable, '-c',
+         code + '; import sys; print(" ".join(sorted(sys.modules)))'])
+    return set(output.decode().split())
+
+
+def test_import_is_lazy():
+    # importing the package must not import any of its submodules or their
+    # dependencies, such as typing, re, threading, or numpy
+    baseline = imported_modules('pass')
+    modules = imported_modules('import fortran_format_converter')
+    assert modules - baseline == {'fortran_format_converter'}
+
+
+def test_import_on_first_use():
+    modules = imported_modules(
+        'import fortran_format_converter; fortran_format_converter.convert')
+    assert 'fortran_format_converter._converter' in modules
+    assert 'fortran_format_converter._array' not in modules
+    assert 'numpy' not in modules
+    assert 'matplotlib' not in modules
+
+
+def test_public_names():
+    for name in fortran_format_converter.__all__:
+        assert name in dir(fortran_format_converter)
+        value = getattr(fortran_format_converter, name)
+        assert value is getattr(fortran_format_converter, name)
+    from fortran_format_converter import convert
+    assert convert('F6.2') == '6.2f'
+
+
+def test_optional_dependencies():
+    # names needing an optional dependency are importable, but not part of a
+    # star import, which must work without them
+    for name in ['FortranFormatter', 'read_fortran', 'write_fortran']:
+        assert name in dir(fortran_format_converter)
+        assert name not in fortran_format_converter.__all__
+    modules = imported_modules(
+        "import sys; sys.modules['matplotlib'] = None; "
+        "sys.modules['pandas'] = None; from fortran_format_converter import *")
+    assert 'fortran_format_converter._ticker' not in modules
+    assert 'fortran_format_converter._pandas' not in modules
+
+
+def test_missing_name():
+    with pytest.raises(AttributeError):
+        fortran_format_converter.missing
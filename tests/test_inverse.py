@@ -0,0 +1,77 @@
+import pytest  # type: ignore
+from fortran_format_converter import (Format, convert, to_fortran,
+                                      to_fortran_cache)
+
+
+def test_integer():
+    assert to_fortran('6d') == 'I6'
+    assert to_fortran('06d') == 'I6.6'
+    assert to_fortran('0=6d') == 'I6.6'
+    assert to_fortran('d') == 'I0'
+    assert to_fortran('+6n') == 'I6'
+    assert to_fortran('16b') == 'B16'
+    assert to_fortran('#o') == 'O0'
+    assert to_fortran('08X') == 'Z8.8'
+    assert to_fortran('x') == 'Z0'
+
+
+def test_real():
+    assert to_fortran('10.4f') == 'F10.4'
+    assert to_fortran('10.4F') == 'F10.4'
+    assert to_fortran('f') == 'F0.6'
+    assert to_fortran(',.2f') == 'F0.2'
+    assert to_fortran('8.1%') == 'F8.1'
+    assert to_fortran('12.4e') == 'E12.4'
+    assert to_fortran('>12.4E') == 'E12.4'
+    assert to_fortran('12.4g') == 'G12.4'
+    assert to_fortran('.3') == 'G0.3'
+
+
+def test_character():
+    assert to_fortran('s') == 'A'
+    assert to_fortran('<8s') == 'A8'
+    assert to_fortran('*^8') == 'L8'
+    assert to_fortran('c') == 'A1'
+    assert to_fortran('') == 'A'
+
+
+def test_invalid():
+    for spec in ['j', '10.f', '5.2q', '10.4ff', '>>>5']:
+        with pytest.raises(ValueError) as excinfo:
+            to_fortran(spec)
+        assert str(excinfo.value) == (
+            "'{}' is not a valid Python format specifier".format(spec))
+    with pytest.raises(ValueError):
+        to_fortran(None)  # type: ignore
+    with pytest.raises(ValueError):
+        to_fortran(['10d'])  # type: ignore
+
+
+def test_valid_fortran():
+    for spec in ['6d', '06d', '10.4f', '12.4e', '12.4g', 's', '8s', '2', 'c',
+                 '.3', 'd', 'f', '%']:
+        Format(to_fortran(spec))
+
+
+def test_round_trip():
+    specs = ['I6', 'I6.6', 'I6.2', 'B16.16', 'O8', 'Z8.8', 'F10.4', 'D12.5',
+             'E12.4', 'E12.4E3', 'EN12.4', 'ES12.4', 'G12.4', 'L2', 'A',
+             'A16']
+    for uppercase in [False, True]:
+        for spec in specs:
+            python_format = convert(spec, uppercase)
+            assert convert(to_fortran(python_format),
+                           uppercase) == python_format
+
+
+def test_cache():
+    to_fortran_cache.clear()
+    assert to_fortran('10.4f') == 'F10.4'
+    assert to_fortran('10.4f') == 'F10.4'
+    with pytest.raises(ValueError):
+        to_fortran('j')
+    info = to_fortran_cache.info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 1
+    to_fortran_cache.clear()
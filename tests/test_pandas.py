@@ -0,0 +1,65 @@
+import io
+
+import pytest  # type: ignore
+
+pd = pytest.importorskip('pandas')
+
+from fortran_format_converter import read_fortran, write_fortran  # noqa: E402
+
+LAYOUT = '(I6, F10.4, A6, L3, Z4)'
+
+DATA = (b'    12    3.1416abc     T  ff\n'
+        b'   -45   -2.5000  xyz   F  10\n'
+        b'         1.5D+02       .T   1\n')
+
+
+def test_read_fortran(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(DATA)
+    frame = read_fortran(str(path), LAYOUT,
+                         names=['i', 'x', 'name', 'flag', 'hex'])
+    assert list(frame.columns) == ['i', 'x', 'name', 'flag', 'hex']
+    assert [str(dtype) for dtype in frame.dtypes[['i', 'x', 'flag', 'hex']]
+            ] == ['int64', 'float64', 'bool', 'int64']
+    assert frame['i'].tolist() == [12, -45, 0]
+    assert frame['x'].tolist() == [3.1416, -2.5, 150.0]
+    assert frame['name'].tolist() == ['abc   ', '  xyz ', '      ']
+    assert frame['flag'].tolist() == [True, False, True]
+    assert frame['hex'].tolist() == [255, 16, 1]
+    frame = read_fortran(str(path), ['I6', 'F10.4', 'A6', 'L3', 'Z4'])
+    assert list(frame.columns) == [0, 1, 2, 3, 4]
+
+
+def test_read_fortran_chunks(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(DATA)
+    frames = list(read_fortran(str(path), LAYOUT, chunksize=2))
+    assert [len(frame) for frame in frames] == [2, 1]
+    assert pd.concat(frames, ignore_index=True).equals(
+        read_fortran(str(path), LAYOUT))
+    with pytest.raises(ValueError):
+        read_fortran(str(path), LAYOUT, chunksize=0)
+    with pytest.raises(ValueError):
+        read_fortran(str(path), LAYOUT, names=['i'])
+
+
+def test_write_fortran(tmpdir):
+    frame = pd.DataFrame({'i': [12, -45], 'x': [3.14159, -2.5],
+                          'name': ['abc', 'xyz']}, index=[5, 6])
+    file = io.StringIO()
+    write_fortran(frame, file, ['I6', 'F10.4', 'A6'])
+    assert file.getvalue() == ('    12    3.1416abc   \n'
+                               '   -45   -2.5000xyz   \n')
+    path = tmpdir.join('records.txt')
+    for chunksize in [1, 65536]:
+        write_fortran(frame, str(path), '(I6, F10.4, A6)', chunksize)
+        assert path.read() == file.getvalue()
+    assert read_fortran(str(path), '(I6, F10.4, A6)',
+                        names=['i', 'x', 'name'])['i'].tolist() == [12, -45]
+    with pytest.raises(ValueError):
+        write_fortran(frame, io.StringIO(), ['I6', 'F10.4'])
+    frame = pd.DataFrame({'name': ['caf\u00e9']})
+    with pytest.raises(ValueError):
+        write_fortran(frame, str(path), ['A5'])
+    write_fortran(frame, str(path), ['A5'], encoding='latin-1')
+    assert path.read_binary() == b'caf\xe9 \n'
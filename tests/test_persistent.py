@@ -0,0 +1,112 @@
+import sqlite3
+import subprocess
+import sys
+
+from fortran_format_converter import (__version__, Format, convert,
+                                      convert_cache, format_cache,
+                                      use_persistent_cache)
+from fortran_format_converter._persistent import PersistentCache
+
+SPECS = ['I5', 'z8.8', 'F10.4', 'EN12.4E3', 'A']
+
+
+def test_persistent_cache(tmpdir):
+    path = str(tmpdir.join('cache.sqlite'))
+    convert_cache.clear()
+    use_persistent_cache(path)
+    try:
+        expected = [convert(spec) for spec in SPECS]
+        convert('I5', uppercase=True)
+        use_persistent_cache(path)  # writes and reopens
+        assert convert_cache.info().currsize == 6
+        convert_cache.clear()
+        format_cache.clear()
+        use_persistent_cache(path)
+        assert convert_cache.info().currsize == 6
+        assert [convert(spec) for spec in SPECS] == expected
+        assert convert_cache.info().misses == 0
+        # the parsed parts make Format objects without parsing
+        assert format_cache.info().currsize == 6
+        for spec, uppercase in [(spec, False) for spec in SPECS] + [
+                ('I5', True)]:
+            format_ = Format.get(spec, uppercase)
+            assert format_ == Format(spec, uppercase)
+            assert format_.string == convert(spec, uppercase)
+        assert format_cache.info().misses == 0
+    finally:
+        use_persistent_cache(None)
+        convert_cache.clear()
+        format_cache.clear()
+    rows = PersistentCache(path, __version__).load()
+    assert sorted(rows) == sorted([
+        ('A', False, 's', 'A', None, None, None),
+        ('EN12.4E3', False, '12.4e', 'EN', 12, 4, 3),
+        ('F10.4', False, '10.4f', 'F', 10, 4, None),
+        ('I5', False, '5d', 'I', 5, None, None),
+        ('I5', True, '5d', 'I', 5, None, None),
+        ('z8.8', False, '08x', 'Z', 8, 8, None)])
+    assert len(PersistentCache(path, __version__).load(2)) == 2
+    assert PersistentCache(path, __version__ + '.other').load() == []
+
+
+def test_persistent_cache_limit(tmpdir):
+    path = str(tmpdir.join('cache.sqlite'))
+    cache = PersistentCache(path, __version__, batchsize=2)
+    cache.add('I5', False, '5d', 'I', 5, None, None)
+    assert PersistentCache(path, __version__).load() == []
+    cache.add('I6', False, '6d', 'I', 6, None, None)
+    assert len(PersistentCache(path, __version__).load()) == 2
+    maxsize = convert_cache.maxsize
+    convert_cache.maxsize = 1
+    try:
+        use_persistent_cache(path)
+        assert convert_cache.info() == (0, 0, 0, 1, 1)
+        convert_cache.maxsize = 0
+        use_persistent_cache(path)
+        assert convert_cache.info().currsize == 0
+    finally:
+        use_persistent_cache(None)
+        convert_cache.maxsize = maxsize
+        convert_cache.clear()
+
+
+def test_persistent_cache_locked(tmpdir):
+    # conversions that can not be written stay buffered, and are written
+    # with the next batch once the database is available
+    path = str(tmpdir.join('cache.sqlite'))
+    cache = PersistentCache(path, __version__, batchsize=2, timeout=0.01)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute('BEGIN EXCLUSIVE')
+    cache.add('I5', False, '5d', 'I', 5, None, None)
+    cache.add('I6', False, '6d', 'I', 6, None, None)
+    assert not cache.flush()
+    cache.add('I7', False, '7d', 'I', 7, None, None)
+    other.execute('ROLLBACK')
+    cache.add('I8', False, '8d', 'I', 8, None, None)
+    assert len(PersistentCache(path, __version__).load()) == 4
+    other.execute('BEGIN EXCLUSIVE')
+    cache.add('I9', False, '9d', 'I', 9, None, None)
+    cache.close()  # discards what can not be written
+    other.execute('ROLLBACK')
+    other.close()
+    assert len(PersistentCache(path, __version__).load()) == 4
+
+
+def test_persistent_cache_processes(tmpdir):
+    # processes write concurrently and a new process starts warm
+    path = str(tmpdir.join('cache.sqlite'))
+    code = ('import sys; import fortran_format_converter as ffc; '
+            'ffc.use_persistent_cache(sys.argv[1]); '
+            'print(ffc.convert_cache.info().currsize); '
+            '[ffc.convert("I{}".format(i)) for i in range(int(sys.argv[2]), '
+            'int(sys.argv[2]) + 1000)]')
+    workers = [subprocess.Popen([sys.executable, '-c', code, path,
+                                 str(1000 * i)], stdout=subprocess.PIPE)
+               for i in range(4)]
+    for worker in workers:
+        worker.communicate()
+        assert worker.returncode == 0
+    assert len(PersistentCache(path, __version__).load()) == 4000
+    output = subprocess.check_output(
+        [sys.executable, '-c', code, path, '0'])
+    assert int(output) == convert_cache.maxsize
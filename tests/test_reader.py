@@ -0,0 +1,98 @@
+import io
+import mmap
+
+import pytest  # type: ignore
+from fortran_format_converter import (Format, FormatStatement, read_records)
+
+
+def test_read_records():
+    file = io.StringIO(
+        '    12    3.1416abc     T\n'
+        '   -45   -2.5000  xyz   F\n')
+    assert list(read_records(file, ['I6', 'F10.4', 'A6', 'L3'])) == [
+        (12, 3.1416, 'abc   ', True),
+        (-45, -2.5, '  xyz ', False)]
+
+
+def test_read_records_binary():
+    file = io.BytesIO(b'  12 1.5\r\n  34 2.5\r\n')
+    assert list(read_records(file, '(I4, F4.1)')) == [(12, 1.5), (34, 2.5)]
+
+
+def test_read_records_mmap(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(b'  12 1.5\n  34 2.5\n')
+    with open(str(path), 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            assert list(read_records(memory, ['I4', 'F4.1'])) == [
+                (12, 1.5), (34, 2.5)]
+
+
+def test_read_records_lazy():
+    def lines():
+        yield '  12\n'
+        raise RuntimeError('read too far')
+    records = read_records(lines(), 'I4')
+    assert next(records) == (12,)
+
+
+def test_integers():
+    file = io.StringIO(' 121 2     -1  101  17  ff\n')
+    assert list(read_records(file, '(2I3, I4, I3, B5, O4, Z4)')) == [
+        (12, 12, 0, -1, 5, 15, 255)]
+
+
+def test_reals():
+    file = io.StringIO(
+        ' 1.5 12345 1.5D2 1.5-2 1.5+2  1234E2 1 5.0 inf -0.5')
+    values = next(read_records(file, '(F5.1, F6.4, D6.1, E6.1, G6.1, '
+                                     'F8.2, F5.1, F4.1, F5.1)'))
+    assert values == (1.5, 1.2345, 150.0, 0.015, 150.0, 1234.0, 15.0,
+                      float('inf'), -0.5)
+    assert next(read_records(io.StringIO('     '), 'F5.1')) == (0.0,)
+    assert next(read_records(io.StringIO('  -12'), 'F5.3')) == (-0.012,)
+
+
+def test_logicals():
+    file = io.StringIO('  T  F .TRUE. .false.  t')
+    assert next(read_records(file, '(2L3, L7, L8, L3)')) == (
+        True, False, True, False, True)
+    with pytest.raises(ValueError):
+        next(read_records(io.StringIO('  X'), 'L3'))
+
+
+def test_short_lines():
+    file = io.StringIO('  12\n  34  56\n')
+    assert list(read_records(file, ['I4', 'I4'])) == [(12, 0), (34, 56)]
+
+
+def test_literals_and_positioning():
+    file = io.StringIO('x =   12 y = 3.5\n')
+    statement = FormatStatement("('x =', I5, T10, 'y =', F4.1)")
+    assert list(read_records(file, statement)) == [(12, 3.5)]
+
+
+def test_unknown_width():
+    file = io.StringIO('  12hello world\n')
+    assert list(read_records(file, '(I4, A)')) == [(12, 'hello world')]
+    with pytest.raises(ValueError):
+        read_records(file, '(A, I4)')
+
+
+def test_multiple_records():
+    file = io.StringIO('  12\n 1.5\n  34\n 2.5\n')
+    assert list(read_records(file, '(I4 / F4.1)')) == [(12, 1.5), (34, 2.5)]
+    with pytest.raises(ValueError):
+        list(read_records(io.StringIO('  12\n'), '(I4 / F4.1)'))
+
+
+def test_single_format():
+    file = io.StringIO('  12\n  34\n')
+    assert list(read_records(file, Format('I4'))) == [(12,), (34,)]
+
+
+def test_invalid_field():
+    file = io.StringIO('  12\n  ab\n')
+    with pytest.raises(ValueError) as excinfo:
+        list(read_records(file, 'I4'))
+    assert 'line 2' in str(excinfo.value)
@@ -0,0 +1,163 @@
+import io
+import mmap
+
+import pytest  # type: ignore
+from fortran_format_converter import Format, FormatStatement, RowFormat
+
+LAYOUT = "(I4,2X,F8.3,1X,A3,'%{x}')"
+
+ROW = (42, 3.14159, 'abc')
+
+
+def test_row_format():
+    row = RowFormat(LAYOUT)
+    assert row.string == FormatStatement(LAYOUT).string
+    assert row.formats == [Format('I4'), Format('F8.3'), Format('A3')]
+    assert row.width == 22
+    assert row.format(ROW) == '  42     3.142 abc%{x}'
+    assert row.format_bytes(ROW) == b'  42     3.142 abc%{x}'
+    assert RowFormat('A').width is None
+    assert RowFormat(['I2', Format('A')]).format([1, 'xyz']) == ' 1xyz'
+
+
+def test_row_format_reals():
+    # formatted with printf style templates, which must agree with format
+    layout = "(F8.3,'%',E12.4E3,1X,G10.3,ES10.2)"
+    row = RowFormat(layout)
+    for values in [(1.5, -2.25e-8, 0.5, 1e10), (0, 1, 2, 3),
+                   (float('nan'), float('inf'), -0.0, 123456.0)]:
+        expected = FormatStatement(layout).format(*values)
+        assert row.format(values) == expected
+        assert row.format_bytes(values) == expected.encode('ascii')
+
+
+def test_row_format_invalid():
+    with pytest.raises(ValueError):
+        RowFormat('(I4/I4)')
+    with pytest.raises(ValueError):
+        RowFormat(['I4', 'J4'])
+    with pytest.raises(UnicodeEncodeError):
+        RowFormat('A3').format_bytes(['é'])
+
+
+def test_row_format_write_text():
+    row = RowFormat(LAYOUT)
+    buffer = io.StringIO()
+    for _ in range(3):
+        buffer.seek(0)
+        buffer.truncate()
+        assert row.write(buffer, ROW) == 22
+        assert buffer.getvalue() == '  42     3.142 abc%{x}'
+    with pytest.raises(ValueError):
+        row.write(buffer, (12345, 1.0, 'abc'))
+
+
+def test_row_format_write_bytes():
+    row = RowFormat(['F6.2', 'I3'])
+    buffer = bytearray(b'.' * 20)
+    assert row.write(buffer, (1.0, 2)) == 9
+    assert row.write(memoryview(buffer), (3.0, 4), offset=9) == 9
+    assert buffer == b'  1.00  2  3.00  4..'
+    with pytest.raises(ValueError):
+        row.write(buffer, (1.0, 2), offset=12)
+    with pytest.raises(ValueError):
+        row.write(buffer, (1.0, 1234))
+    assert buffer == b'  1.00  2  3.00  4..'
+    buffer = bytearray(4)
+    assert RowFormat('A').write(buffer, ['ab'], 1) == 2
+    assert buffer == b'\x00ab\x00'
+
+
+def test_row_format_bytes_integers():
+    layout = "(I6,'%',Z4.4,O4,F8.3)"
+    row = RowFormat(layout)
+    for values in [(0, 255, 8, 1.5), (-12345, 0, 0, -0.0), (True, 1, 2, 3)]:
+        expected = FormatStatement(layout).format(*values)
+        assert row.format(values) == expected
+        assert row.format_bytes(values) == expected.encode('ascii')
+    assert RowFormat('Z4').format_bytes([255]) == b'  ff'
+    assert RowFormat(Format('Z4', uppercase=True)).format_bytes(
+        [255]) == b'  FF'
+
+
+def test_row_format_bytes_validation():
+    # every path accepts the same values as format
+    row = RowFormat(['I3', 'F6.2'])
+    buffer = bytearray(20)
+    for values in [(1.5, 2.0), ('1', 2.0), (1, 'x'), (1,), (1, 2.0, 3)]:
+        with pytest.raises(ValueError):
+            row.format(values)
+        with pytest.raises(ValueError):
+            row.format_bytes(values)
+        with pytest.raises(ValueError):
+            row.write(buffer, values)
+        with pytest.raises(ValueError):
+            row.pack_into(buffer, 0, [(1, 2.0), values])
+    with pytest.raises(ValueError):
+        row.pack_into(buffer, 0, [(1,), (1, 2.0, 3)])
+    assert buffer == bytearray(20)
+    row = RowFormat(['A3', 'I2'])
+    for values in [('ab',), ('ab', 1, 2)]:
+        with pytest.raises(ValueError):
+            row.format(values)
+        with pytest.raises(ValueError):
+            row.format_bytes(values)
+        with pytest.raises(ValueError):
+            row.pack_into(buffer, 0, [values])
+    assert buffer == bytearray(20)
+    row = RowFormat(['I3', 'F6.2'])
+
+    class Integer(int):
+        pass
+
+    assert row.format_bytes((Integer(7), 1)) == b'  7  1.00'
+    assert row.pack_into(buffer, 0, [(1, 2.0), (Integer(3), 4)]) == 20
+    assert buffer == b'  1  2.00\n  3  4.00\n'
+
+
+def test_row_format_pack_into():
+    rows = [(i, i / 4) for i in range(10)]
+    row = RowFormat(['I3', 'F6.2'])
+    expected = ''.join(row.format(values) + '\n' for values in rows)
+    for batchsize in [1, 3, 4096]:
+        buffer = bytearray(b'.' * 102)
+        assert row.pack_into(buffer, 1, iter(rows),
+                             batchsize=batchsize) == 100
+        assert buffer == b'.' + expected.encode('ascii') + b'.'
+    buffer = bytearray(40)
+    assert row.pack_into(memoryview(buffer), 0, rows[:4], newline=b'') == 36
+    assert buffer[:36] == expected.replace('\n', '').encode('ascii')[:36]
+    assert row.pack_into(buffer, 0, []) == 0
+
+
+def test_row_format_pack_into_text():
+    # character fields are formatted as text and then encoded
+    row = RowFormat("(A3,I2,'{}')")
+    buffer = bytearray(18)
+    assert row.pack_into(buffer, 0, [('ab', 1), ('cd', 2)],
+                         newline=b'\r\n') == 18
+    assert buffer == b'ab  1{}\r\ncd  2{}\r\n'
+
+
+def test_row_format_pack_into_mmap(tmpdir):
+    path = tmpdir.join('records.txt')
+    path.write_binary(b'\0' * 20)
+    row = RowFormat(['F4.1', 'I5'])
+    with open(str(path), 'r+b') as file:
+        with mmap.mmap(file.fileno(), 0) as mapped:
+            assert row.pack_into(mapped, 0, [(1, 2), (3, 4)]) == 20
+    assert path.read_binary() == b' 1.0    2\n 3.0    4\n'
+
+
+def test_row_format_pack_into_invalid():
+    row = RowFormat(['F4.1', 'I2'])
+    buffer = bytearray(14)
+    with pytest.raises(ValueError):
+        row.pack_into(buffer, 0, [(1.0, 2)] * 3)
+    with pytest.raises(ValueError):
+        row.pack_into(buffer, 0, [(1.0, 123)])
+    with pytest.raises(ValueError):
+        row.pack_into(buffer, -1, [(1.0, 2)])
+    assert buffer == bytearray(14)
+    with pytest.raises(ValueError):
+        RowFormat('A').pack_into(buffer, 0, [('ab',)])
@@ -0,0 +1,85 @@
+import pytest  # type: ignore
+from fortran_format_converter import Format, FormatStatement
+
+
+def test_data_descriptors():
+    statement = FormatStatement('(I6, F10.4, A8)')
+    assert statement.string == '{:6d}{:10.4f}{:8s}'
+    assert statement.records == ['{:6d}{:10.4f}{:8s}']
+    assert [format_.string for format_ in statement.formats] == [
+        '6d', '10.4f', '8s']
+    assert statement.format(12, 3.14159, 'abc') == (
+        '    12    3.1416abc     ')
+
+
+def test_uppercase():
+    statement = FormatStatement('(z4, e10.3)', uppercase=True)
+    assert statement.string == '{:4X}{:10.3E}'
+
+
+def test_repeat_counts():
+    assert FormatStatement('(3I2)').string == '{:2d}{:2d}{:2d}'
+    assert FormatStatement('(2(I2,A1))').string == '{:2d}{:1s}{:2d}{:1s}'
+    assert FormatStatement('(2(I1,2(F4.1)))').string == (
+        '{:1d}{:4.1f}{:4.1f}{:1d}{:4.1f}{:4.1f}')
+
+
+def test_literals():
+    assert FormatStatement("('x =', F6.2)").string == 'x ={:6.2f}'
+    assert FormatStatement('("x =", F6.2)').string == 'x ={:6.2f}'
+    assert FormatStatement("('it''s')").string == "it's"
+    assert FormatStatement("(4Ha bC)").string == 'a bC'
+    assert FormatStatement("('{}')").format() == '{}'
+
+
+def test_positioning():
+    assert FormatStatement('(2X, I2)').string == '  {:2d}'
+    assert FormatStatement('(X, I2)').string == ' {:2d}'
+    assert FormatStatement("(I2, T6, I2)").string == '{:2d}   {:2d}'
+    assert FormatStatement("(I2, TR3, I2)").string == '{:2d}   {:2d}'
+    assert FormatStatement("(I4, TL2, TR3, I2)").string == '{:4d} {:2d}'
+    assert FormatStatement("(I2, 4X)").string == '{:2d}'
+    assert FormatStatement("(A, 2X, I2)").string == '{:s}  {:2d}'
+    with pytest.raises(ValueError):
+        FormatStatement('(I4, TL2, I2)')
+    with pytest.raises(ValueError):
+        FormatStatement('(I4, T2, I2)')
+    with pytest.raises(ValueError):
+        FormatStatement('(A, T10, I2)')
+
+
+def test_record_breaks():
+    statement = FormatStatement("(2X,3F10.4,I6,'label',A8/)")
+    assert statement.records == [
+        '  {:10.4f}{:10.4f}{:10.4f}{:6d}label{:8s}', '']
+    assert statement.format(1, 2, 3, 4, 'abc') == (
+        '      1.0000    2.0000    3.0000     4labelabc     \n')
+    assert FormatStatement('(I1/I1,2/I1)').records == [
+        '{:1d}', '{:1d}', '', '{:1d}']
+    assert FormatStatement('(I1:I1)').string == '{:1d}{:1d}'
+
+
+def test_blanks():
+    assert FormatStatement(' ( 2 ( I 2 , F 6 . 2 ) ) ').string == (
+        '{:2d}{:6.2f}{:2d}{:6.2f}')
+
+
+def test_formats():
+    formats = FormatStatement('(2I3)').formats
+    assert len(formats) == 2
+    assert all(isinstance(format_, Format) for format_ in formats)
+    assert all(format_.width == 3 for format_ in formats)
+    assert FormatStatement('()').formats == []
+    assert FormatStatement('()').string == ''
+
+
+def test_invalid():
+    for statement in ['', 'I5', '(I5', '(I5))', '(J5)', "('abc)", '(T)',
+                      '(3T5)', '(5Habc)', '(I5) I5', '(1PE10.3)']:
+        with pytest.raises(ValueError):
+            FormatStatement(statement)
+    with pytest.raises(ValueError) as excinfo:
+        FormatStatement('(I5, J5)')
+    assert str(excinfo.value) == (
+        "'(I5, J5)' is not a valid Fortran format statement, "
+        "error at position 5")
@@ -0,0 +1,49 @@
+import pytest  # type: ignore
+
+pytest.importorskip('matplotlib')
+
+from fortran_format_converter import Format, FortranFormatter  # noqa: E402
+
+
+def test_fortran_formatter():
+    formatter = FortranFormatter('F6.2')
+    assert formatter.format is Format.get('f6.2')
+    assert formatter(3.14159) == '  3.14'
+    assert formatter(-1, 0) == ' -1.00'
+    assert formatter.format_ticks([0.0, 0.5, 1.25]) == [
+        '  0.00', '  0.50', '  1.25']
+    assert formatter.format_ticks([]) == []
+    assert FortranFormatter('es10.2e3', uppercase=True).format_ticks(
+        [1e-5, 2.5e10]) == ['  1.00E-05', '  2.50E+10']
+
+
+def test_fortran_formatter_types():
+    assert FortranFormatter('I3')(2.0) == '  2'
+    assert FortranFormatter('I3').format_ticks([0.0, 0.9999, -2.0]) == [
+        '  0', '  1', ' -2']
+    assert FortranFormatter('Z4.4', uppercase=True).format_ticks(
+        [255.0]) == ['00FF']
+    assert FortranFormatter('A5').format_ticks([1.5]) == ['1.5  ']
+    assert FortranFormatter(Format('E10.3')).format_ticks([1.0]) == [
+        Format('E10.3').formatter(1.0)]
+    with pytest.raises(ValueError):
+        FortranFormatter('J4')
+
+
+def test_fortran_formatter_axes():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    for i in range(4):
+        axes = figure.add_subplot(2, 2, i + 1)
+        axes.set_xlim(0, 1)
+        axes.set_xticks([0, 0.5, 1])
+        axes.xaxis.set_major_formatter(FortranFormatter('F5.2'))
+    figure.canvas.draw()
+    for axes in figure.axes:
+        assert [label.get_text() for label in axes.get_xticklabels()] == [
+            ' 0.00', ' 0.50', ' 1.00']
+        formatter = axes.xaxis.get_major_formatter()
+        assert isinstance(formatter, FortranFormatter)
+        assert formatter.format is Format.get('F5.2')
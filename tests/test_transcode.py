@@ -0,0 +1,82 @@
+import pytest  # type: ignore
+
+pytest.importorskip('numpy')
+
+from fortran_format_converter import FormatStatement, transcode  # noqa: E402
+
+ROWS = [(i, i / 7, 'ab'[:i % 3]) for i in range(100)]
+
+
+def write(path, layout, rows, newline='\n'):
+    statement = FormatStatement(layout)
+    path.write_binary(''.join(
+        statement.format(*row).replace('\n', newline) + newline
+        for row in rows).encode('ascii'))
+
+
+def expected(layout, rows):
+    statement = FormatStatement(layout)
+    return ''.join(statement.format(*row) + '\n' for row in rows)
+
+
+def test_transcode(tmpdir):
+    source = tmpdir.join('source.txt')
+    destination = tmpdir.join('destination.txt')
+    write(source, '(I4,F10.4,A2)', ROWS)
+    for shardsize in [1, 7, 65536]:
+        assert transcode(str(source), str(destination), '(I4,F10.4,A2)',
+                         '(I6,1X,E15.7,1X,A3)', shardsize=shardsize) == 100
+        assert destination.read() == expected(
+            '(I6,1X,E15.7,1X,A3)',
+            [(i, float('{:10.4f}'.format(x)), a) for i, x, a in ROWS])
+
+
+def test_transcode_processes(tmpdir):
+    source = tmpdir.join('source.txt')
+    destination = tmpdir.join('destination.txt')
+    write(source, '(F10.4/I3)', [row[1::-1] for row in ROWS], '\r\n')
+    assert transcode(str(source), str(destination), '(F10.4/I3)',
+                     ['F12.5', 'I4'], processes=2, shardsize=9) == 100
+    assert destination.read() == expected(
+        '(F12.5,I4)', [(float('{:10.4f}'.format(x)), i) for i, x, _ in ROWS])
+
+
+def test_transcode_empty(tmpdir):
+    source = tmpdir.join('source.txt')
+    destination = tmpdir.join('destination.txt')
+    source.write_binary(b'')
+    assert transcode(str(source), str(destination), 'I4', 'I8',
+                     processes=2) == 0
+    assert destination.read() == ''
+
+
+def test_transcode_invalid(tmpdir):
+    source = tmpdir.join('source.txt')
+    destination = tmpdir.join('destination.txt')
+    write(source, '(I4,F10.4)', [row[:2] for row in ROWS])
+    with pytest.raises(ValueError):
+        transcode(str(source), str(destination), '(I4,F10.4)', 'I4')
+    with pytest.raises(ValueError):
+        transcode(str(source), str(destination), '(I5,F10.4)', '(I4,F10.4)')
+    with pytest.raises(ValueError):
+        transcode(str(source), str(destination), 'I4', 'I4', shardsize=0)
+    source.write_binary(b'   1\n   x\n   3\n')
+    destination.write('unchanged')
+    for processes in [None, 2]:
+        with pytest.raises(ValueError):
+            transcode(str(source), str(destination), 'I4', 'I6',
+                      processes=processes, shardsize=1)
+        assert destination.read() == 'unchanged'
+        assert sorted(tmpdir.listdir()) == [destination, source]
+
+
+def test_transcode_in_place(tmpdir):
+    path = tmpdir.join('records.txt')
+    write(path, '(I4,F10.4)', [row[:2] for row in ROWS])
+    for processes in [None, 2]:
+        assert transcode(str(path), str(path), '(I4,F10.4)',
+                         '(I4,F10.4)', processes=processes, shardsize=7) == 100
+        assert path.read() == expected('(I4,F10.4)', [
+            (i, float('{:10.4f}'.format(x))) for i, x, _ in ROWS])
+    assert transcode(str(path), str(path), '(I4,F10.4)', '(I6,E12.4)') == 100
+    assert path.size() == 100 * 19
@@ -0,0 +1,130 @@
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest  # type: ignore
+from fortran_format_converter import (FormatStatement, read_records,
+                                      write_records, write_records_async)
+
+LAYOUT = "(I4,2X,F8.3,1X,A3,'{x}')"
+
+ROWS = [(i, i / 7, 'ab'[:i % 3]) for i in range(100)]
+
+
+def expected(layout=LAYOUT, rows=ROWS):
+    return ''.join(FormatStatement(layout).format(*row) + '\n'
+                   for row in rows)
+
+
+def test_write_records():
+    for batchsize in [1, 7, 4096]:
+        file = io.StringIO()
+        assert write_records(file, LAYOUT, ROWS, batchsize) == len(ROWS)
+        assert file.getvalue() == expected()
+
+
+def test_write_records_layouts():
+    file = io.StringIO()
+    write_records(file, ['I2', 'F5.1'], [(1, 2.0), (3, 4.0)])
+    assert file.getvalue() == ' 1  2.0\n 3  4.0\n'
+    file = io.StringIO()
+    write_records(file, '(I2/F5.1)', iter([(1, 2.0)]))
+    assert file.getvalue() == ' 1\n  2.0\n'
+    file = io.StringIO()
+    assert write_records(file, 'E10.2', []) == 0
+    assert file.getvalue() == ''
+
+
+def test_write_and_read_records():
+    file = io.StringIO()
+    rows = [(1, 1.5, 'abc'), (-2, 0.25, 'xyz')]
+    write_records(file, '(I4,F8.3,A3)', rows)
+    file.seek(0)
+    assert list(read_records(file, '(I4,F8.3,A3)')) == rows
+
+
+def test_write_records_invalid():
+    with pytest.raises(ValueError):
+        write_records(io.StringIO(), 'J4', [(1,)])
+    with pytest.raises(ValueError):
+        write_records(io.StringIO(), 'I4', [('x',)])
+    for row in [(1,), (1, 2.0, 'a', 4)]:
+        with pytest.raises(ValueError):
+            write_records(io.StringIO(), LAYOUT, [ROWS[0], row])
+    with pytest.raises(ValueError):
+        write_records(io.StringIO(), '(I2/F5.1)', [(1,)])
+
+
+class AsyncRows:
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def write_to_socket(rows, **kwargs):
+    # write the rows to a local socket and return what was received
+
+    async def main():
+        received = asyncio.get_event_loop().create_future()
+
+        async def handle(reader, writer):
+            received.set_result(await reader.read())
+            writer.close()
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        _, writer = await asyncio.open_connection('127.0.0.1', port)
+        try:
+            count = await write_records_async(writer, LAYOUT, rows, **kwargs)
+        finally:
+            writer.close()
+            data = await received
+            server.close()
+            await server.wait_closed()
+        return count, data.decode('ascii')
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def test_write_records_async():
+    for batchsize in [1, 7, 4096]:
+        assert write_to_socket(ROWS, batchsize=batchsize) == (
+            len(ROWS), expected())
+
+
+def test_write_records_async_iterable():
+    assert write_to_socket(AsyncRows(ROWS), batchsize=7) == (
+        len(ROWS), expected())
+    assert write_to_socket(AsyncRows([])) == (0, '')
+
+
+def test_write_records_async_executors():
+    with ThreadPoolExecutor(2) as executor:
+        assert write_to_socket(ROWS, batchsize=10, executor=executor) == (
+            len(ROWS), expected())
+    # forked workers would keep the socket open
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(2, mp_context=context) as executor:
+        assert write_to_socket(ROWS, batchsize=10, executor=executor) == (
+            len(ROWS), expected())
+
+
+def test_write_records_async_invalid():
+    with pytest.raises(ValueError):
+        write_to_socket(ROWS[:5] + [('x', 1.0, 'a')] + ROWS, batchsize=2)
+    with pytest.raises(ValueError):
+        write_to_socket(ROWS[:5] + [(1, 1.0, 'a', 4)] + ROWS, batchsize=2)